@@ -0,0 +1,58 @@
+"""Benchmark create_module when many namespaces share class names.
+
+Merging CIDOC-CRM, FRBRoo and LRMoo yields several namespaces declaring classes
+with the same local names, each of which is wrapped in a namespace group. This
+builds `--namespaces` namespaces that all declare the same `--classes` local
+names, with properties ranging over classes in the neighbouring namespace, and
+times schema preparation plus rendering (extraction is excluded). Time per
+class should stay roughly flat as the number of colliding namespaces grows.
+
+Usage:
+    python benchmarks/bench_collisions.py [--namespaces 4 16 64 256] [--classes 200]
+"""
+
+import argparse
+import time
+from rdflib import Graph, Namespace
+from rdflib.namespace import RDF, RDFS
+from rdfs_pydantic import create_module
+from rdfs_pydantic.extraction import extract_schema
+
+
+def build_graph(n_namespaces: int, n_classes: int) -> Graph:
+    """Build `n_namespaces` namespaces declaring the same class names."""
+    g = Graph()
+    namespaces = [Namespace(f"http://example.org/ns{n}/") for n in range(n_namespaces)]
+    for n, ns in enumerate(namespaces):
+        g.bind(f"ns{n}", ns)
+        other = namespaces[(n + 1) % n_namespaces]
+        for i in range(n_classes):
+            cls = ns[f"E{i}"]
+            g.add((cls, RDF.type, RDFS.Class))
+            if i:
+                g.add((cls, RDFS.subClassOf, ns[f"E{(i - 1) // 2}"]))
+            prop = ns[f"p{i}"]
+            g.add((prop, RDF.type, RDF.Property))
+            g.add((prop, RDFS.domain, cls))
+            g.add((prop, RDFS.range, other[f"E{(i * 7) % n_classes}"]))
+    return g
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--namespaces", type=int, nargs="+", default=[4, 16, 64, 256], help="Colliding namespace counts to benchmark")
+    parser.add_argument("--classes", type=int, default=200, help="Classes per namespace")
+    args = parser.parse_args()
+
+    print(f"{'namespaces':>10} {'classes':>8} {'seconds':>9} {'us/class':>9}")
+    for n_namespaces in args.namespaces:
+        schema = extract_schema(build_graph(n_namespaces, args.classes))
+        start = time.perf_counter()
+        create_module(schema)
+        elapsed = time.perf_counter() - start
+        n_total = len(schema.classes)
+        print(f"{n_namespaces:>10} {n_total:>8} {elapsed:>9.3f} {elapsed / n_total * 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark schema extraction against graph size.
+
+Builds synthetic graphs that mix an RDFS schema with instance data (the shape
+of schema.org or CIDOC-CRM merged with records) and times
+`extract_schema` at increasing triple counts. Time per triple should stay
+roughly flat as the graph grows; the naming cache hit rate shows how often an
+IRI's identifier was reused rather than recomputed.
+
+Usage:
+    python benchmarks/bench_extraction.py [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import time
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import RDF, RDFS
+from rdfs_pydantic.extraction import extract_schema
+from rdfs_pydantic.naming import NamingCache
+
+EX = Namespace("http://example.org/")
+
+
+def build_graph(n_classes: int, instances_per_class: int = 5) -> Graph:
+    """Build a graph with a class chain, one property per class and instance data."""
+    g = Graph()
+    g.bind("ex", EX)
+    for i in range(n_classes):
+        cls = EX[f"C{i}"]
+        g.add((cls, RDF.type, RDFS.Class))
+        g.add((cls, RDFS.label, Literal(f"Class {i}", lang="en")))
+        g.add((cls, RDFS.label, Literal(f"Classe {i}", lang="fr")))
+        g.add((cls, RDFS.comment, Literal(f"Comment for class {i}")))
+        if i:
+            g.add((cls, RDFS.subClassOf, EX[f"C{i // 2}"]))
+        prop = EX[f"p{i}"]
+        g.add((prop, RDF.type, RDF.Property))
+        g.add((prop, RDFS.domain, cls))
+        g.add((prop, RDFS.range, EX[f"C{(i * 7) % n_classes}"]))
+        for j in range(instances_per_class):
+            item = EX[f"item{i}_{j}"]
+            g.add((item, RDF.type, cls))
+            g.add((item, RDFS.label, Literal(f"Item {i}/{j}")))
+            g.add((item, prop, EX[f"item{(i * 7) % n_classes}_{j}"]))
+    return g
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 8000, 32000], help="Class counts to benchmark")
+    args = parser.parse_args()
+
+    print(f"{'classes':>8} {'triples':>9} {'seconds':>9} {'us/triple':>10} {'name hits':>10}")
+    for n_classes in args.sizes:
+        g = build_graph(n_classes)
+        cache = NamingCache()
+        start = time.perf_counter()
+        extract_schema(g, naming_cache=cache)
+        elapsed = time.perf_counter() - start
+        hit_rate = cache.hits / max(cache.hits + cache.misses, 1)
+        print(f"{n_classes:>8} {len(g):>9} {elapsed:>9.3f} {elapsed / len(g) * 1e6:>10.2f} {hit_rate:>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark importing packages generated with eager and lazy __init__ files.
+
+Builds a synthetic ontology of `--group`-sized clusters of classes that
+inherit from and refer to each other, generates it twice, once with the
+default eager `__init__.py` files and once with `lazy=True`, and times in
+fresh interpreters `import pkg` alone and `import pkg` followed by the first
+access of `--use` classes (as a service using a handful of models would). Each
+measurement is the best of `--repeat` runs.
+
+Usage:
+    python benchmarks/bench_import.py [--classes 1000 5000] [--group 20] [--use 5] [--repeat 5]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from rdflib import Graph, Namespace
+from rdflib.namespace import RDF, RDFS, XSD
+from rdfs_pydantic import create_package
+from rdfs_pydantic.extraction import extract_schema
+
+_SCRIPT = """
+import sys
+import time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import {package}
+imported = time.perf_counter()
+for name in {names!r}:
+    getattr({package}, name)
+used = time.perf_counter()
+print(imported - start, used - start)
+"""
+
+
+def build_graph(n_classes: int, group: int) -> Graph:
+    """Build clusters of `group` classes, each a root with subclasses referring to their neighbours."""
+    g = Graph()
+    ex = Namespace("http://example.org/")
+    g.bind("ex", ex)
+    for i in range(n_classes):
+        root = i - i % group
+        g.add((ex[f"C{i}"], RDF.type, RDFS.Class))
+        if i != root:
+            g.add((ex[f"C{i}"], RDFS.subClassOf, ex[f"C{root}"]))
+        g.add((ex[f"name{i}"], RDF.type, RDF.Property))
+        g.add((ex[f"name{i}"], RDFS.domain, ex[f"C{i}"]))
+        g.add((ex[f"name{i}"], RDFS.range, XSD.string))
+        g.add((ex[f"rel{i}"], RDF.type, RDF.Property))
+        g.add((ex[f"rel{i}"], RDFS.domain, ex[f"C{i}"]))
+        g.add((ex[f"rel{i}"], RDFS.range, ex[f"C{root + (i + 1 - root) % group}"]))
+    return g
+
+
+def time_import(root: str, package: str, names: list[str], repeat: int) -> tuple[float, float]:
+    """Get the best (import, import + first use) seconds over `repeat` fresh interpreters."""
+    best = (float("inf"), float("inf"))
+    script = _SCRIPT.format(root=root, package=package, names=names)
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+        imported, used = (float(value) for value in output.split())
+        best = (min(best[0], imported), min(best[1], used))
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--classes", type=int, nargs="+", default=[1000, 5000], help="Class counts to benchmark")
+    parser.add_argument("--group", type=int, default=20, help="Classes per cluster of related classes")
+    parser.add_argument("--use", type=int, default=5, help="Number of classes accessed after the import")
+    parser.add_argument("--repeat", type=int, default=5, help="Interpreter runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="bench_import_")
+    try:
+        print(f"{'classes':>8} {'init':>6} {'import s':>9} {'+use s':>9}")
+        for n_classes in args.classes:
+            schema = extract_schema(build_graph(n_classes, args.group))
+            # Classes spread over different clusters
+            step = max(1, n_classes // args.use)
+            names = [f"C{i}" for i in range(0, n_classes, step)][:args.use]
+            for init, lazy in (("eager", False), ("lazy", True)):
+                package = f"{init}{n_classes}"
+                create_package(schema, os.path.join(root, package), lazy=lazy)
+                imported, used = time_import(root, package, names, args.repeat)
+                print(f"{n_classes:>8} {init:>6} {imported:>9.3f} {used:>9.3f}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark the memory footprint of an extracted schema.
+
+Builds a synthetic ontology whose properties each have several domains, then
+extracts it and reports the process's peak RSS before and after extraction and
+whether the source graph stays alive through the SchemaIR after it is dropped.
+With --trace, the memory still held by the SchemaIR once extraction has
+finished is measured with tracemalloc instead (which inflates peak RSS).
+
+Run each size in a fresh process, since peak RSS never goes down.
+
+Usage:
+    python benchmarks/bench_memory.py [--classes 50000] [--domains 3] [--trace]
+"""
+
+import argparse
+import gc
+import resource
+import sys
+import tracemalloc
+import weakref
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import RDF, RDFS, XSD
+from rdfs_pydantic.extraction import extract_schema
+
+EX = Namespace("http://example.org/")
+
+
+def build_graph(n_classes: int, n_domains: int) -> Graph:
+    """Build a graph with a class tree and one property per class shared by several domains."""
+    g = Graph()
+    g.bind("ex", EX)
+    for i in range(n_classes):
+        cls = EX[f"C{i}"]
+        g.add((cls, RDF.type, RDFS.Class))
+        g.add((cls, RDFS.label, Literal(f"Class {i}", lang="en")))
+        if i:
+            g.add((cls, RDFS.subClassOf, EX[f"C{i // 2}"]))
+        prop = EX[f"p{i}"]
+        g.add((prop, RDF.type, RDF.Property))
+        g.add((prop, RDFS.label, Literal(f"Property {i}", lang="en")))
+        for j in range(n_domains):
+            g.add((prop, RDFS.domain, EX[f"C{(i + j * 7919) % n_classes}"]))
+        g.add((prop, RDFS.range, EX[f"C{(i * 7) % n_classes}"]))
+        g.add((prop, RDFS.range, XSD.string))
+    return g
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--classes", type=int, default=50000, help="Number of classes (and properties)")
+    parser.add_argument("--domains", type=int, default=3, help="Domains per property")
+    parser.add_argument("--trace", action="store_true", help="Measure the SchemaIR size with tracemalloc")
+    args = parser.parse_args()
+
+    g = build_graph(args.classes, args.domains)
+    graph_ref = weakref.ref(g)
+    graph_peak = peak_rss_mb()
+
+    if args.trace:
+        tracemalloc.start()
+    schema = extract_schema(g)
+    gc.collect()
+    if args.trace:
+        print(f"schema holds {tracemalloc.get_traced_memory()[0] / (1 << 20):.1f} MiB")
+        tracemalloc.stop()
+
+    del g
+    gc.collect()
+    print(f"{'classes':>8} {'graph peak MiB':>15} {'peak RSS MiB':>13} {'graph kept alive':>17}")
+    print(f"{len(schema.classes):>8} {graph_peak:>15.1f} {peak_rss_mb():>13.1f} {str(graph_ref() is not None):>17}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark create_module with serial and parallel chunked rendering.
+
+Builds a synthetic ontology with a class tree, labels, comments and two
+properties per class, extracts it before each run and times `create_module`
+for each `--jobs` value, checking that every run returns the same code as the
+first one.
+
+Usage:
+    python benchmarks/bench_module.py [--classes 40000] [--jobs 1 2 4 8]
+"""
+
+import argparse
+import time
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import RDF, RDFS, XSD
+from rdfs_pydantic import create_module
+from rdfs_pydantic.extraction import extract_schema
+
+EX = Namespace("http://example.org/")
+
+
+def build_graph(n_classes: int) -> Graph:
+    """Build a class tree with a literal and a class-valued property per class."""
+    g = Graph()
+    g.bind("ex", EX)
+    for i in range(n_classes):
+        cls = EX[f"C{i}"]
+        g.add((cls, RDF.type, RDFS.Class))
+        g.add((cls, RDFS.label, Literal(f"Class {i}", lang="en")))
+        g.add((cls, RDFS.comment, Literal(f"Comment for class {i}")))
+        if i:
+            g.add((cls, RDFS.subClassOf, EX[f"C{(i - 1) // 3}"]))
+        for prop, range_ in ((EX[f"name{i}"], XSD.string), (EX[f"rel{i}"], EX[f"C{(i * 7) % n_classes}"])):
+            g.add((prop, RDF.type, RDF.Property))
+            g.add((prop, RDFS.label, Literal(f"Property {prop}", lang="en")))
+            g.add((prop, RDFS.domain, cls))
+            g.add((prop, RDFS.range, range_))
+    return g
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--classes", type=int, default=40000, help="Number of classes")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker counts to benchmark (1 is serial)")
+    args = parser.parse_args()
+
+    g = build_graph(args.classes)
+    print(f"{'jobs':>5} {'classes':>8} {'seconds':>9} {'speedup':>8} {'identical':>10}")
+    baseline = None
+    reference = None
+    for jobs in args.jobs:
+        # A fresh schema per run, so no run reuses another's hierarchy lookups
+        schema = extract_schema(g)
+        start = time.perf_counter()
+        code = create_module(schema, jobs=jobs)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline, reference = elapsed, code
+        print(f"{jobs:>5} {len(schema.classes):>8} {elapsed:>9.2f} {baseline / elapsed:>7.2f}x {str(code == reference):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark create_package with serial and parallel class-file rendering.
+
+Builds a synthetic ontology spread over a few namespaces, extracts it before
+each run and times `create_package` for each `--jobs` value, checking that
+every run writes a tree byte-identical to the first one. Each run is repeated
+into the same directory to time a regeneration that finds every file up to
+date and rewrites nothing. Run it on the volume
+the packages are normally built on (`--dir`), since slow filesystems are where
+the I/O thread pool helps most.
+
+Usage:
+    python benchmarks/bench_package.py [--classes 30000] [--jobs 1 2 4 8] [--dir DIR]
+"""
+
+import argparse
+import filecmp
+import os
+import shutil
+import tempfile
+import time
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import RDF, RDFS, XSD
+from rdfs_pydantic import create_package
+from rdfs_pydantic.extraction import extract_schema
+from rdfs_pydantic.package_generator import MANIFEST_NAME
+
+
+def build_graph(n_classes: int, n_namespaces: int = 4) -> Graph:
+    """Build a class tree over several namespaces with two properties per class."""
+    g = Graph()
+    namespaces = [Namespace(f"http://example.org/ns{n}/") for n in range(n_namespaces)]
+    for n, ns in enumerate(namespaces):
+        g.bind(f"ns{n}", ns)
+
+    def cls(i: int):
+        return namespaces[i % n_namespaces][f"C{i}"]
+
+    for i in range(n_classes):
+        g.add((cls(i), RDF.type, RDFS.Class))
+        g.add((cls(i), RDFS.label, Literal(f"Class {i}", lang="en")))
+        g.add((cls(i), RDFS.comment, Literal(f"Comment for class {i}")))
+        if i:
+            g.add((cls(i), RDFS.subClassOf, cls((i - 1) // 3)))
+        ns = namespaces[i % n_namespaces]
+        g.add((ns[f"name{i}"], RDF.type, RDF.Property))
+        g.add((ns[f"name{i}"], RDFS.domain, cls(i)))
+        g.add((ns[f"name{i}"], RDFS.range, XSD.string))
+        g.add((ns[f"rel{i}"], RDF.type, RDF.Property))
+        g.add((ns[f"rel{i}"], RDFS.domain, cls(i)))
+        g.add((ns[f"rel{i}"], RDFS.range, cls((i * 7) % n_classes)))
+    return g
+
+
+def same_tree(left: str, right: str) -> bool:
+    """Check that two directory trees hold the same files with the same bytes (manifests aside)."""
+    comparison = filecmp.dircmp(left, right, ignore=filecmp.DEFAULT_IGNORES + [MANIFEST_NAME])
+    if comparison.left_only or comparison.right_only or comparison.funny_files:
+        return False
+    _, mismatch, errors = filecmp.cmpfiles(left, right, comparison.common_files, shallow=False)
+    if mismatch or errors:
+        return False
+    return all(same_tree(os.path.join(left, d), os.path.join(right, d)) for d in comparison.common_dirs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--classes", type=int, default=30000, help="Number of classes")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker counts to benchmark (1 is serial)")
+    parser.add_argument("--dir", default=None, help="Directory to write the packages in (default: a temporary directory)")
+    args = parser.parse_args()
+
+    g = build_graph(args.classes)
+    root = tempfile.mkdtemp(prefix="bench_package_", dir=args.dir)
+    try:
+        print(f"{'jobs':>5} {'classes':>8} {'seconds':>9} {'speedup':>8} {'rerun':>7} {'identical':>10}")
+        baseline = None
+        reference = None
+        for jobs in args.jobs:
+            # A fresh schema per run, so no run reuses another's inheritance lookups
+            schema = extract_schema(g)
+            output_dir = os.path.join(root, f"jobs{jobs}", "pkg")
+            start = time.perf_counter()
+            create_package(schema, output_dir, jobs=jobs)
+            elapsed = time.perf_counter() - start
+            start = time.perf_counter()
+            report = create_package(schema, output_dir, jobs=jobs)
+            rerun = time.perf_counter() - start
+            assert report.is_empty(), report.summary()
+            if baseline is None:
+                baseline, reference = elapsed, output_dir
+            identical = same_tree(reference, output_dir)
+            print(f"{jobs:>5} {len(schema.classes):>8} {elapsed:>9.2f} {baseline / elapsed:>7.2f}x {rerun:>7.2f} {str(identical):>10}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark topological_sort_classes against hierarchy size.
+
+Builds synthetic class hierarchies (a random forest where each class has up to
+three parents among earlier classes) and times `topological_sort_classes` at
+increasing class counts. Time per class should grow only logarithmically.
+
+Usage:
+    python benchmarks/bench_toposort.py [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import random
+import time
+from rdfs_pydantic.models import ClassInfo
+from rdfs_pydantic.utils import topological_sort_classes
+
+
+def build_classes(n_classes: int, seed: int = 0) -> dict[str, ClassInfo]:
+    """Build classes with random multiple inheritance, inserted in shuffled order."""
+    rng = random.Random(seed)
+    uris = [f"http://example.org/C{i}" for i in range(n_classes)]
+    classes = {}
+    for i, uri in enumerate(uris):
+        parents = [uris[rng.randrange(i)] for _ in range(rng.randrange(4))] if i else []
+        classes[uri] = ClassInfo(iri=uri, name=f"C{i}", parent_uris=parents)
+    items = list(classes.items())
+    rng.shuffle(items)
+    return dict(items)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Class counts to benchmark")
+    args = parser.parse_args()
+
+    print(f"{'classes':>8} {'seconds':>9} {'us/class':>9}")
+    for n_classes in args.sizes:
+        classes = build_classes(n_classes)
+        start = time.perf_counter()
+        topological_sort_classes(classes)
+        elapsed = time.perf_counter() - start
+        print(f"{n_classes:>8} {elapsed:>9.3f} {elapsed / n_classes * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 """RDFS Pydantic - Create Pydantic models from RDFS ontologies."""
 
-from .module_generator import create_module
-from .package_generator import create_package
+from .module_generator import create_module, create_modules, iter_module
+from .package_generator import create_package, create_packages
 from .base import RDFSBaseModel, IRIAwareBaseModel
 
-__all__ = ["create_module", "create_package", "RDFSBaseModel", "IRIAwareBaseModel"]
+__all__ = ["create_module", "create_modules", "iter_module", "create_package", "create_packages", "RDFSBaseModel", "IRIAwareBaseModel"]
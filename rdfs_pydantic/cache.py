@@ -0,0 +1,176 @@
+"""Content-addressed on-disk cache of extracted schemas.
+
+Parsing and extraction dominate the cost of a run, yet their result depends
+only on the ontology bytes, the JSON-LD context, the preferred language and the
+prefix bindings. `SchemaCache` stores the extracted `SchemaIR` under a hash of
+those inputs, so an unchanged ontology skips rdflib entirely on later runs.
+Entries are pickled and zlib-compressed; the least recently used entries are
+evicted once the cache exceeds its size limit.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import zlib
+from importlib.metadata import PackageNotFoundError, version
+from .models import SchemaIR
+
+# Bump when the pickled SchemaIR layout changes so stale entries are never read
+CACHE_FORMAT_VERSION = 5
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_ENTRY_SUFFIX = ".ir"
+
+
+def cache_root() -> str:
+    """Get the root directory for rdfs_pydantic caches.
+
+    Uses $RDFS_PYDANTIC_CACHE_DIR if set, otherwise rdfs_pydantic/ under
+    $XDG_CACHE_HOME (default: ~/.cache).
+    """
+    if os.environ.get("RDFS_PYDANTIC_CACHE_DIR"):
+        return os.environ["RDFS_PYDANTIC_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "rdfs_pydantic")
+
+
+def default_cache_dir() -> str:
+    """Get the default schema cache directory (schema/ under `cache_root`)."""
+    return os.path.join(cache_root(), "schema")
+
+
+def _package_version() -> str:
+    try:
+        return version("rdfs-pydantic")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class SchemaCache:
+    """Least-recently-used on-disk cache of SchemaIR objects keyed by input hash.
+
+    Example:
+        ```python
+        cache = SchemaCache()
+        key = cache.key(["ontology.ttl"], context=None, language="en", bindings=[])
+        schema = cache.get(key)
+        if schema is None:
+            schema = extract_schema(graph)
+            cache.put(key, schema)
+        code = create_module(schema)
+        ```
+    """
+
+    def __init__(self, directory: str | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory (default: see `default_cache_dir`)
+            max_bytes: Total size above which least recently used entries are evicted
+        """
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def key(
+        self,
+        ontology_paths: list[str],
+        context: dict | list | str | None = None,
+        language: str = "en",
+        bindings: list[tuple[str, str]] | None = None,
+    ) -> str:
+        """Compute the cache key for a set of generation inputs.
+
+        Args:
+            ontology_paths: Ontology files, in the order they are loaded
+            context: JSON-LD context as passed to extraction
+            language: Preferred language for labels and comments
+            bindings: Extra (prefix, namespace) bindings applied to the graph
+
+        Returns:
+            Hex digest identifying the inputs
+        """
+        digest = hashlib.sha256()
+        header = {
+            "format": CACHE_FORMAT_VERSION,
+            "version": _package_version(),
+            "context": context,
+            "language": language,
+            "bindings": [list(binding) for binding in bindings or []],
+            "files": [os.path.splitext(str(path))[1].lower() for path in ontology_paths],
+        }
+        digest.update(json.dumps(header, sort_keys=True, default=str).encode("utf-8"))
+        for path in ontology_paths:
+            digest.update(b"\0")
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> SchemaIR | None:
+        """Load a cached schema, marking it as recently used.
+
+        Returns:
+            The cached SchemaIR, or None on a miss or unreadable entry
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                schema = pickle.loads(zlib.decompress(f.read()))
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        if not isinstance(schema, SchemaIR):
+            return None
+        os.utime(path)
+        return schema
+
+    def put(self, key: str, schema: SchemaIR) -> None:
+        """Store a schema, then evict least recently used entries over the size limit."""
+        os.makedirs(self.directory, exist_ok=True)
+        payload = zlib.compress(pickle.dumps(_detach(schema), protocol=pickle.HIGHEST_PROTOCOL))
+
+        # Write atomically so concurrent runs never read a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._entry_path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits within `max_bytes`."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(_ENTRY_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _ENTRY_SUFFIX)
+
+
+def _detach(schema: SchemaIR) -> SchemaIR:
+    """Copy a schema without its class hierarchy analysis, which is rebuilt on first use."""
+    return dataclasses.replace(schema, hierarchy=None)
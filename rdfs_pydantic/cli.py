@@ -1,10 +1,18 @@
 import typer
 import json
-import requests
+import os
+import sys
 from pathlib import Path
 from rdflib import Graph
-from rdfs_pydantic import create_module, create_package
-from rdfs_pydantic.extraction import get_unbound_rdfs_classes
+from rdfs_pydantic import create_module, create_modules, create_package, create_packages
+from rdfs_pydantic.cache import SchemaCache
+from rdfs_pydantic.extraction import check_prefix_bindings, extract_schema
+from rdfs_pydantic.language import ANY, parse_language_chain
+from rdfs_pydantic.loading import load_graph
+from rdfs_pydantic.models import SchemaIR
+from rdfs_pydantic.resources import DEFAULT_TTL, ResourceLoader, default_loader
+from rdfs_pydantic.schema_index import SchemaIndex
+from rdfs_pydantic.streaming import is_streaming_format, read_ntriples_schema
 
 app = typer.Typer()
 
@@ -44,11 +52,12 @@ def infer_rdf_format(file_path: str) -> str:
         )
 
 
-def load_context(context_path: str) -> dict:
+def load_context(context_path: str, loader: ResourceLoader | None = None) -> dict:
     """Load JSON-LD context from local file or remote URL.
     
     Args:
         context_path: Path to local file or URL
+        loader: Loader used for URLs (default: the shared cached loader)
         
     Returns:
         Parsed JSON-LD context object
@@ -60,9 +69,7 @@ def load_context(context_path: str) -> dict:
     else:
         # Try to fetch from URL
         try:
-            response = requests.get(context_path)
-            response.raise_for_status()
-            return response.json()
+            return (loader or default_loader()).fetch_json(context_path)
         except Exception as e:
             raise typer.BadParameter(f"Failed to load context from '{context_path}': {e}")
 
@@ -83,39 +90,112 @@ def parse_and_apply_bindings(graph: Graph, bindings: list[tuple[str, str]] | Non
             raise typer.BadParameter("Prefix and namespace cannot be empty")
         graph.bind(prefix, namespace)
 
-@app.command()
-def module(
-        ontology: list[str] = typer.Option(
-            ...,
-            "--ontology",
-            help="Path(s) to RDFS ontology file(s) (can be specified multiple times; format is inferred from file extension)"
-        ),
-        context: str = typer.Option(
-            None,
-            "--context",
-            help="Path to a JSON-LD @context file (optional)"
-        ),
-        bind: list[str] = typer.Option(
-            None,
-            "--bind",
-            help="Bind prefixes to namespaces (format: 'prefix http://namespace', can be specified multiple times)"
-        ),
-        language: str = typer.Option(
-            'en',
-            "--language",
-            help="Preferred language for labels and comments (default: 'en')"
-        )
-    ):
-    """Generate Pydantic models from RDFS ontology/ontologies and print to stdout."""
-    g = Graph()
+
+def load_ontologies(ontology: list[str], schema_only: bool = False, jobs: int = 1) -> tuple[Graph, list[str]]:
+    """Parse ontology files into a graph, setting aside files to be streamed.
+    
+    Args:
+        ontology: Ontology file paths, in command-line order
+        schema_only: Parse into a store that discards non-schema triples
+        jobs: Number of worker processes for parsing; when greater than 1,
+              per-file parse times are reported on stderr
+        
+    Returns:
+        Tuple of (parsed graph, paths of .nt/.nq files to stream into the index)
+        
+    Raises:
+        typer.BadParameter: If a file format cannot be inferred
+    """
+    parsed_paths = []
+    formats = []
+    streamed_paths = []
     for ontology_path in ontology:
+        fmt = infer_rdf_format(ontology_path)
+        if is_streaming_format(ontology_path):
+            # Read later, line by line, straight into the schema index
+            streamed_paths.append(ontology_path)
+        else:
+            parsed_paths.append(ontology_path)
+            formats.append(fmt)
+    
+    def report(path: str, seconds: float) -> None:
+        typer.echo(f"Parsed {path} in {seconds:.3f}s", err=True)
+    
+    graph = load_graph(parsed_paths, formats, schema_only=schema_only, jobs=jobs, on_parsed=report if jobs > 1 else None)
+    return graph, streamed_paths
+
+
+def build_schema_index(graph: Graph, streamed_paths: list[str]) -> SchemaIndex:
+    """Build the schema index from a parsed graph plus any streamed N-Triples/N-Quads files.
+    
+    Args:
+        graph: Graph holding parsed ontologies and prefix bindings
+        streamed_paths: Paths of .nt/.nq files to stream into the index
+        
+    Returns:
+        SchemaIndex using `graph` for namespace resolution
+    """
+    index = SchemaIndex.from_graph(graph)
+    if streamed_paths:
         try:
-            fmt = infer_rdf_format(ontology_path)
-            g.parse(ontology_path, format=fmt)
-        except typer.BadParameter as e:
-            typer.echo(str(e), err=True)
-            raise typer.Exit(1)
+            read_ntriples_schema(streamed_paths, index)
+        except Exception as e:
+            raise typer.BadParameter(f"Failed to read {', '.join(streamed_paths)}: {e}")
+        # Pick up values in the parsed graph for subjects typed in the streamed files
+        index.add_graph(graph)
+    return index
+
+
+def variant_names(languages: list[str]) -> dict[str, str]:
+    """Name the output of each language variant after its most preferred range.
+    
+    Args:
+        languages: Languages or comma-separated fallback chains
+        
+    Returns:
+        Dict mapping each language to an identifier (e.g., "en-GB,en" -> "en_gb")
+        
+    Raises:
+        typer.BadParameter: If two languages would share a name
+    """
+    names: dict[str, str] = {}
+    for language in languages:
+        primary = parse_language_chain(language)[0]
+        name = "any" if primary == ANY else primary.replace("-", "_")
+        if language in names or name in names.values():
+            raise typer.BadParameter(f"--language '{language}' would overwrite the '{name}' output of another --language")
+        names[language] = name
+    return names
+
+
+def load_schema(
+    ontology: list[str],
+    context: str | None,
+    bind: list[str] | None,
+    language: str | list[str],
+    schema_only: bool = False,
+    jobs: int = 1,
+    schema_cache: SchemaCache | None = None,
+    loader: ResourceLoader | None = None,
+) -> tuple[SchemaIndex | SchemaIR, dict | None]:
+    """Load and validate the schema shared by the `module` and `package` commands.
     
+    Echoes a message and exits with status 1 on invalid input.
+    
+    Args:
+        ontology: Ontology file paths
+        context: Optional JSON-LD context path or URL
+        bind: Optional "prefix namespace" binding strings
+        language: Preferred language for labels and comments, or a comma-separated fallback chain;
+                  a list of them when rendering several variants (the first is used for extraction)
+        schema_only: Parse into a store that discards non-schema triples
+        jobs: Number of worker processes for parsing
+        schema_cache: Optional cache; a hit skips parsing and extraction
+        loader: Loader used to fetch a remote context (default: the shared cached loader)
+        
+    Returns:
+        Tuple of (SchemaIndex, or SchemaIR when cached, loaded context)
+    """
     # Parse bindings from "prefix namespace" format
     bindings = None
     if bind:
@@ -130,29 +210,165 @@ def module(
                 raise typer.Exit(1)
             bindings.append((parts[0], parts[1]))
     
+    languages = [language] if isinstance(language, str) else list(language)
     try:
+        for item in languages:
+            parse_language_chain(item)
+    except ValueError as e:
+        typer.echo(str(e), err=True)
+        raise typer.Exit(1)
+    
+    ctx = None
+    if context:
+        try:
+            ctx = load_context(context, loader)
+        except typer.BadParameter as e:
+            typer.echo(str(e), err=True)
+            raise typer.Exit(1)
+    
+    cache_key = None
+    if schema_cache is not None:
+        try:
+            cache_key = schema_cache.key(ontology, ctx, languages[0], bindings)
+        except OSError as e:
+            typer.echo(f"Failed to read ontology: {e}", err=True)
+            raise typer.Exit(1)
+        cached = schema_cache.get(cache_key)
+        if cached is not None:
+            return cached, ctx
+    
+    try:
+        g, streamed_paths = load_ontologies(ontology, schema_only, jobs)
         parse_and_apply_bindings(g, bindings)
+        # Index the schema and check for unbound prefixes once; generation reuses the report
+        index = build_schema_index(g, streamed_paths)
     except typer.BadParameter as e:
         typer.echo(str(e), err=True)
         raise typer.Exit(1)
+    report = check_prefix_bindings(index)
+    if not report.is_valid():
+        typer.echo(report.error_message(), err=True)
+        raise typer.Exit(1)
     
-    # Check for unbound RDFS classes
-    unbound = get_unbound_rdfs_classes(g)
-    if unbound:
-        typer.echo("Warning: The following RDFS classes have no bound prefixes:", err=True)
-        for iri, _ in unbound:
-            typer.echo(f"  - {iri}", err=True)
+    if schema_cache is None:
+        return index, ctx
+    schema = extract_schema(index, ctx, languages[0])
+    schema_cache.put(cache_key, schema)
+    return schema, ctx
+
+
+@app.command()
+def module(
+        ontology: list[str] = typer.Option(
+            ...,
+            "--ontology",
+            help="Path(s) to RDFS ontology file(s) (can be specified multiple times; format is inferred from file extension)"
+        ),
+        context: str = typer.Option(
+            None,
+            "--context",
+            help="Path to a JSON-LD @context file (optional)"
+        ),
+        bind: list[str] = typer.Option(
+            None,
+            "--bind",
+            help="Bind prefixes to namespaces (format: 'prefix http://namespace', can be specified multiple times)"
+        ),
+        language: list[str] = typer.Option(
+            None,
+            "--language",
+            help="Preferred language for labels and comments, or a comma-separated fallback chain such as 'en-GB,en,und,*' (default: 'en'). Repeat to write one module per language to --output-dir"
+        ),
+        output: str = typer.Option(
+            None,
+            "--output",
+            help="File to write the module to instead of stdout"
+        ),
+        output_dir: str = typer.Option(
+            None,
+            "--output-dir",
+            help="Directory for the modules written when several --language values are given, named after each language (e.g., en.py, fr.py)"
+        ),
+        schema_only: bool = typer.Option(
+            False,
+            "--schema-only",
+            help="Discard non-schema triples while parsing to reduce memory on files that mix ontology and instance data"
+        ),
+        jobs: int = typer.Option(
+            1,
+            "--jobs",
+            min=1,
+            help="Number of processes used to parse --ontology files and to render the module concurrently (default: 1)"
+        ),
+        cache: bool = typer.Option(
+            False,
+            "--cache",
+            help="Reuse the extracted schema from an on-disk cache when the inputs are unchanged"
+        ),
+        cache_dir: str = typer.Option(
+            None,
+            "--cache-dir",
+            help="Schema cache directory (default: $RDFS_PYDANTIC_CACHE_DIR/schema or ~/.cache/rdfs_pydantic/schema)"
+        ),
+        cache_max_mb: int = typer.Option(
+            256,
+            "--cache-max-mb",
+            min=1,
+            help="Schema cache size limit in MiB; least recently used entries are evicted (default: 256)"
+        ),
+        offline: bool = typer.Option(
+            False,
+            "--offline",
+            help="Load a remote --context only from the HTTP cache, never from the network"
+        ),
+        context_ttl: int = typer.Option(
+            DEFAULT_TTL,
+            "--context-ttl",
+            min=0,
+            help="Seconds a cached remote --context is used before it is revalidated (default: 86400)"
+        )
+    ):
+    """Generate Pydantic models from RDFS ontology/ontologies and print to stdout.
     
-    ctx = None
-    if context:
+    Each class is written as soon as it is rendered, so the generated module is
+    never held in memory whole.
+    """
+    languages = language or ['en']
+    names = None
+    if len(languages) > 1:
+        if output is not None:
+            typer.echo("--output writes a single module; use --output-dir with several --language values", err=True)
+            raise typer.Exit(1)
+        if output_dir is None:
+            typer.echo("Several --language values require --output-dir", err=True)
+            raise typer.Exit(1)
         try:
-            ctx = load_context(context)
+            names = variant_names(languages)
         except typer.BadParameter as e:
             typer.echo(str(e), err=True)
             raise typer.Exit(1)
     
-    code = create_module(g, context=ctx, language=language)
-    print(code)
+    schema_cache = SchemaCache(cache_dir, cache_max_mb * 1024 * 1024) if cache else None
+    loader = ResourceLoader(ttl=context_ttl, offline=offline)
+    schema, ctx = load_schema(ontology, context, bind, languages, schema_only, jobs, schema_cache, loader)
+    
+    if names is None:
+        if output is None:
+            create_module(schema, context=ctx, language=languages[0], out=sys.stdout, jobs=jobs)
+            sys.stdout.write("\n")
+            return
+        with open(output, "w", encoding="utf-8") as f:
+            create_module(schema, context=ctx, language=languages[0], out=f, jobs=jobs)
+        typer.echo(f"Module written to {output}")
+        return
+    
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    for lang, code in create_modules(schema, languages, context=ctx, jobs=jobs).items():
+        path = os.path.join(output_dir, f"{names[lang]}.py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(code)
+        typer.echo(f"Module written to {path}")
+
 
 @app.command()
 def package(
@@ -176,61 +392,80 @@ def package(
         "--bind",
         help="Bind prefixes to namespaces (format: 'prefix http://namespace', can be specified multiple times)"
     ),
-    language: str = typer.Option(
-        'en',
+    language: list[str] = typer.Option(
+        None,
         "--language",
-        help="Preferred language for labels and comments (default: 'en')"
+        help="Preferred language for labels and comments, or a comma-separated fallback chain such as 'en-GB,en,und,*' (default: 'en'). Repeat to write one package per language into subdirectories of --output-dir (e.g., en/, fr/)"
+    ),
+    schema_only: bool = typer.Option(
+        False,
+        "--schema-only",
+        help="Discard non-schema triples while parsing to reduce memory on files that mix ontology and instance data"
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        min=1,
+        help="Number of processes used to parse --ontology files and to render class files concurrently (default: 1)"
+    ),
+    lazy: bool = typer.Option(
+        False,
+        "--lazy",
+        help="Generate __init__.py files that import each class on first access instead of importing every class at package import"
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse the extracted schema from an on-disk cache when the inputs are unchanged"
+    ),
+    cache_dir: str = typer.Option(
+        None,
+        "--cache-dir",
+        help="Schema cache directory (default: $RDFS_PYDANTIC_CACHE_DIR/schema or ~/.cache/rdfs_pydantic/schema)"
+    ),
+    cache_max_mb: int = typer.Option(
+        256,
+        "--cache-max-mb",
+        min=1,
+        help="Schema cache size limit in MiB; least recently used entries are evicted (default: 256)"
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        help="Load a remote --context only from the HTTP cache, never from the network"
+    ),
+    context_ttl: int = typer.Option(
+        DEFAULT_TTL,
+        "--context-ttl",
+        min=0,
+        help="Seconds a cached remote --context is used before it is revalidated (default: 86400)"
     )
 ):
     """Generate a Python package of Pydantic models from RDFS ontology/ontologies."""
-    g = Graph()
-    for ontology_path in ontology:
+    languages = language or ['en']
+    names = None
+    if len(languages) > 1:
         try:
-            fmt = infer_rdf_format(ontology_path)
-            g.parse(ontology_path, format=fmt)
+            names = variant_names(languages)
         except typer.BadParameter as e:
             typer.echo(str(e), err=True)
             raise typer.Exit(1)
     
-    # Parse bindings from "prefix namespace" format
-    bindings = None
-    if bind:
-        bindings = []
-        for binding_str in bind:
-            parts = binding_str.split(None, 1)
-            if len(parts) != 2:
-                typer.echo(
-                    f"Invalid binding format '{binding_str}'. Expected 'prefix http://namespace'",
-                    err=True
-                )
-                raise typer.Exit(1)
-            bindings.append((parts[0], parts[1]))
-    
-    try:
-        parse_and_apply_bindings(g, bindings)
-    except typer.BadParameter as e:
-        typer.echo(str(e), err=True)
-        raise typer.Exit(1)
-    
-    # Check for unbound RDFS classes
-    unbound = get_unbound_rdfs_classes(g)
-    if unbound:
-        typer.echo("Warning: The following RDFS classes have no bound prefixes:", err=True)
-        for iri, _ in unbound:
-            typer.echo(f"  - {iri}", err=True)
+    schema_cache = SchemaCache(cache_dir, cache_max_mb * 1024 * 1024) if cache else None
+    loader = ResourceLoader(ttl=context_ttl, offline=offline)
+    schema, ctx = load_schema(ontology, context, bind, languages, schema_only, jobs, schema_cache, loader)
     
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     
-    ctx = None
-    if context:
-        try:
-            ctx = load_context(context)
-        except typer.BadParameter as e:
-            typer.echo(str(e), err=True)
-            raise typer.Exit(1)
+    if names is None:
+        report = create_package(schema, output_dir=output_dir, context=ctx, language=languages[0], jobs=jobs, lazy=lazy)
+        typer.echo(f"Package written to {output_dir} ({report.summary()})")
+        return
     
-    create_package(g, output_dir=output_dir, context=ctx, language=language)
-    typer.echo(f"Package written to {output_dir}")
+    output_dirs = {lang: os.path.join(output_dir, name) for lang, name in names.items()}
+    reports = create_packages(schema, output_dirs, context=ctx, jobs=jobs, lazy=lazy)
+    for lang, path in output_dirs.items():
+        typer.echo(f"Package written to {path} ({reports[lang].summary()})")
 
 if __name__ == "__main__":
     app()
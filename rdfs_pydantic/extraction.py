@@ -1,73 +1,62 @@
 """Extract classes and properties from RDF graphs."""
 
+import dataclasses
 import json
 import os
+import sys
 from urllib.parse import urlparse
-from urllib.request import urlopen
+from collections.abc import Collection, Sequence
 from typing import cast
 from rdflib import Graph
 from rdflib.namespace import RDF, RDFS
-from rdflib.term import URIRef as URIRefType, Literal
+from rdflib.term import URIRef as URIRefType
 from .utils import sanitise_identifier
-from .models import ClassInfo, PropertyInfo, IriComponents
-from .naming import NamingStrategy, DefaultNamingStrategy, ContextAwareNamingStrategy
+from .models import ClassInfo, PropertyInfo, IriComponents, PrefixBindingReport, SchemaIR
+from .schema_index import SchemaIndex
+from .naming import NamingStrategy, DefaultNamingStrategy, ContextAwareNamingStrategy, CachedNamingStrategy, NamingCache
+from .resources import default_loader
+from .language import LanguageChain
+from .ranges import RangeClassifier, RangeKind
 
 
-def get_unbound_rdfs_classes(graph: Graph) -> list[tuple[str, str]]:
+def get_unbound_rdfs_classes(graph: Graph | SchemaIndex) -> list[tuple[str, str]]:
     """Get all rdfs:Class instances that lack bound prefixes.
     
     Args:
-        graph: RDF graph to check
+        graph: RDF graph or schema index to check
         
     Returns:
         List of tuples (iri, type_str) for unbound classes
     """
-    unbound = []
-    
-    # Check all rdfs:Class instances
-    for subject in graph.subjects(RDF.type, RDFS.Class):
-        namespace = _get_namespace(str(subject))
-        if not _is_prefix_bound(graph, namespace):
-            unbound.append((str(subject), "rdfs:Class"))
-    
-    return unbound
+    index = graph if isinstance(graph, SchemaIndex) else SchemaIndex.from_graph(graph)
+    return check_prefix_bindings(index).unbound_classes
 
 
-def _validate_prefix_bindings(graph: Graph) -> None:
-    """Validate that all rdfs:Class and rdf:Property instances have bound prefixes.
+def check_prefix_bindings(index: SchemaIndex) -> PrefixBindingReport:
+    """Check that all rdfs:Class and rdf:Property subjects have bound prefixes.
+    
+    Bound namespaces are collected into a set once, so the check is linear in
+    the number of schema subjects. The report is stored on the index and reused
+    by later calls, so the CLI and extraction share a single validation pass.
     
     Args:
-        graph: RDF graph to validate
+        index: Schema index to validate
         
-    Raises:
-        ValueError: If any class or property lacks a bound prefix
+    Returns:
+        PrefixBindingReport listing every unbound class and property IRI
     """
+    if index.prefix_report is not None:
+        return index.prefix_report
+
+    bound_namespaces = {str(ns) for _, ns in index.graph.namespaces()}
     unbound = []
-    
-    # Check all rdfs:Class instances
-    for subject in graph.subjects(RDF.type, RDFS.Class):
-        namespace = _get_namespace(str(subject))
-        if not _is_prefix_bound(graph, namespace):
-            unbound.append((str(subject), "rdfs:Class"))
-    
-    # Check all rdf:Property instances
-    for subject in graph.subjects(RDF.type, RDF.Property):
-        namespace = _get_namespace(str(subject))
-        if not _is_prefix_bound(graph, namespace):
-            unbound.append((str(subject), "rdf:Property"))
-    
-    if unbound:
-        error_msg = "The following IRIs lack bound prefixes:\n"
-        for iri, rdf_type in unbound:
-            error_msg += f"  - {iri} ({rdf_type})\n"
-        error_msg += (
-            "\nBound prefixes are required for deterministic code generation "
-            "(stable class/module names and namespace grouping).\n"
-            "Fix by either:\n"
-            "  1) Declaring @prefix in your RDF/Turtle input, or\n"
-            "  2) Binding in code, e.g.: graph.bind(\"ex\", \"http://example.org/\")"
-        )
-        raise ValueError(error_msg)
+    for subjects, rdf_type in ((index.classes, "rdfs:Class"), (index.properties, "rdf:Property")):
+        for subject in subjects:
+            if _get_namespace(str(subject)) not in bound_namespaces:
+                unbound.append((str(subject), rdf_type))
+
+    index.prefix_report = PrefixBindingReport(unbound=unbound)
+    return index.prefix_report
 
 
 def _get_namespace(iri: str) -> str:
@@ -81,63 +70,123 @@ def _get_namespace(iri: str) -> str:
     return components.namespace
 
 
-def _is_prefix_bound(graph: Graph, namespace: str) -> bool:
-    """Check if a namespace has a bound prefix in the graph.
+def _get_language_value(values: Collection, language: str | Sequence[str] | LanguageChain = 'en'):
+    """Pick a value with language preference.
     
     Args:
-        graph: RDF graph
-        namespace: The namespace URI (e.g., "http://example.org/")
+        values: Candidate values for a single subject and predicate
+            (e.g., the indexed rdfs:label objects)
+        language: Preferred language, fallback chain or compiled LanguageChain (default: 'en')
         
     Returns:
-        True if the namespace is bound to a prefix, False otherwise
+        The value for the earliest matching language range. A chain not ending
+        in "*" falls back to:
+        1. Untagged literal (no language)
+        2. First value with any language tag
+        3. None if no values exist
     """
-    for prefix, ns in graph.namespaces():
-        if str(ns) == namespace:
-            return True
-    return False
+    chain = language if isinstance(language, LanguageChain) else LanguageChain(language)
+    return chain.select(values)
 
 
-def _get_language_value(graph: Graph, subject, predicate, language: str = 'en'):
-    """Get a value from RDF graph with language preference.
+def collect_literals(index: SchemaIndex) -> dict[str, tuple[tuple, tuple]]:
+    """Collect the candidate labels and comments of every indexed class and property.
     
     Args:
-        graph: RDF graph to query
-        subject: Subject node
-        predicate: Predicate to look for (e.g., RDFS.label, RDFS.comment)
-        language: Preferred language code (default: 'en')
+        index: Schema index to read from
         
     Returns:
-        The value in the preferred language if available, otherwise falls back to:
-        1. Untagged literal (no language)
-        2. First value with any language tag
-        3. None if no values exist
+        Dict mapping term IRIs to (rdfs:label values, rdfs:comment values);
+        terms with neither are omitted
     """
-    # Get all values for this predicate
-    values = list(graph.objects(subject, predicate))
-    if not values:
-        return None
-    
-    # Try to find a value in the preferred language
-    for value in values:
-        if isinstance(value, Literal) and value.language == language:
-            return value
+    literals: dict[str, tuple[tuple, tuple]] = {}
+    for subject in (*index.classes, *index.properties):
+        labels = tuple(index.objects(subject, RDFS.label))
+        comments = tuple(index.objects(subject, RDFS.comment))
+        if labels or comments:
+            literals[sys.intern(str(subject))] = (labels, comments)
+    return literals
+
+
+def resolve_texts(literals: dict[str, tuple[tuple, tuple]], language: str | Sequence[str] | LanguageChain = 'en') -> dict[str, tuple[str | None, str | None]]:
+    """Resolve the label and comment of every term in one pass.
     
-    # Fallback 1: return first untagged literal (no language)
-    for value in values:
-        if not isinstance(value, Literal) or not value.language:
-            return value
+    The language chain is compiled once and applied to the collected values,
+    so neither the graph nor the index is queried per term.
     
-    # Fallback 2: return first value with any language tag
-    return values[0]
+    Args:
+        literals: Candidate values per term IRI, from `collect_literals`
+        language: Preferred language, fallback chain such as "en-GB,en,und,*",
+            or compiled LanguageChain (default: 'en')
+        
+    Returns:
+        Dict mapping term IRIs to (label, comment), either of which may be None
+    """
+    chain = language if isinstance(language, LanguageChain) else LanguageChain(language)
+    texts: dict[str, tuple[str | None, str | None]] = {}
+    for iri, (labels, comments) in literals.items():
+        label = chain.select(labels)
+        comment = chain.select(comments)
+        texts[iri] = (str(label) if label else None, str(comment) if comment else None)
+    return texts
 
 
-def extract_classes_and_properties(graph: Graph, context: dict | list | str | None = None, language: str = 'en') -> tuple[dict[str, ClassInfo], dict[str, ClassInfo]]:
+def localize_schema(schema: SchemaIR, language: str | Sequence[str] | LanguageChain) -> SchemaIR:
+    """Copy a schema with labels and comments resolved for another language.
+    
+    Only labels and comments change; names, types and structure are shared
+    with `schema`, so one extraction can be rendered in several languages.
+    
+    Args:
+        schema: Extracted schema carrying the collected literals
+        language: Preferred language, fallback chain or compiled LanguageChain
+        
+    Returns:
+        SchemaIR whose classes and properties use the resolved texts
+    """
+    if not schema.literals:
+        return schema
+    texts = resolve_texts(schema.literals, language)
+    localized: dict[int, PropertyInfo] = {}
+    
+    def localize_properties(info: ClassInfo) -> dict[str, PropertyInfo]:
+        properties = {}
+        for name, prop in info.properties.items():
+            # Properties shared between domains stay shared in the copy
+            if id(prop) not in localized:
+                label, comment = texts.get(prop.iri or "", (None, None))
+                localized[id(prop)] = dataclasses.replace(prop, label=label, comment=comment)
+            properties[name] = localized[id(prop)]
+        return properties
+    
+    classes = {}
+    for iri, info in schema.classes.items():
+        label, comment = texts.get(iri, (None, None))
+        classes[iri] = dataclasses.replace(info, label=label, comment=comment, properties=localize_properties(info))
+    external_classes = {
+        iri: dataclasses.replace(info, properties=localize_properties(info))
+        for iri, info in schema.external_classes.items()
+    }
+    return SchemaIR(
+        classes=classes,
+        external_classes=external_classes,
+        namespaces=schema.namespaces,
+        literals=schema.literals,
+        hierarchy=schema.hierarchy,
+        curies=schema.curies,
+        ranges=schema.ranges,
+    )
+
+
+def extract_classes_and_properties(graph: Graph | SchemaIndex, context: dict | list | str | None = None, language: str | Sequence[str] = 'en') -> tuple[dict[str, ClassInfo], dict[str, ClassInfo]]:
     """Extract classes and their properties from an RDF graph, applying JSON-LD context aliases.
     
     Args:
-        graph: RDF graph to extract from
+        graph: RDF graph to extract from, or a SchemaIndex already built from one
+            (reusing its prefix validation report)
         context: Optional JSON-LD context object used to alias class/property IRIs
-        language: Preferred language for labels and comments (default: 'en')
+        language: Preferred language for labels and comments, or a fallback
+            chain such as "en-GB,en,und,*" (default: 'en')
         
     Returns:
         Tuple of (classes dict, external_classes dict):
@@ -147,146 +196,173 @@ def extract_classes_and_properties(graph: Graph, context: dict | list | str | No
     Raises:
         ValueError: If any rdfs:Class or rdf:Property instance lacks a bound prefix
     """
-    _validate_prefix_bindings(graph)
-    contexts = _normalize_contexts(context)
-    alias_map = _build_alias_map(contexts)
-    naming_strategy = ContextAwareNamingStrategy(alias_map) if alias_map else DefaultNamingStrategy()
-    classes: dict[str, ClassInfo] = {}
-    external_classes: dict[str, ClassInfo] = {}
-    _extract_classes(graph, classes, naming_strategy, language)
-    _extract_properties(graph, classes, naming_strategy, language, external_classes)
-    return classes, external_classes
+    schema = extract_schema(graph, context, language)
+    return schema.classes, schema.external_classes
 
 
-def _extract_classes(graph: Graph, classes: dict[str, ClassInfo], naming_strategy: NamingStrategy, language: str = 'en') -> None:
-    """Extract class definitions from RDF graph.
+def extract_schema(graph: Graph | SchemaIndex | SchemaIR, context: dict | list | str | None = None, language: str | Sequence[str] = 'en', naming_cache: NamingCache | None = None) -> SchemaIR:
+    """Extract a SchemaIR from an RDF graph, applying JSON-LD context aliases.
     
     Args:
-        graph: RDF graph to extract from
+        graph: RDF graph or SchemaIndex to extract from. An existing SchemaIR is
+            returned unchanged (context and language are ignored).
+        context: Optional JSON-LD context object used to alias class/property IRIs
+        language: Preferred language for labels and comments, or a fallback
+            chain such as "en-GB,en,und,*" (default: 'en')
+        naming_cache: Optional cache for IRI names, e.g. to inspect its hit
+            counters; it must only be reused with the same context
+        
+    Returns:
+        SchemaIR holding classes, external classes and namespace bindings
+        
+    Raises:
+        ValueError: If any rdfs:Class or rdf:Property instance lacks a bound prefix,
+            or the language preference is malformed
+    """
+    if isinstance(graph, SchemaIR):
+        return graph
+    chain = LanguageChain(language)
+    index = graph if isinstance(graph, SchemaIndex) else SchemaIndex.from_graph(graph)
+    check_prefix_bindings(index).raise_for_unbound()
+    naming_strategy = _naming_strategy(context, naming_cache)
+    classes: dict[str, ClassInfo] = {}
+    external_classes: dict[str, ClassInfo] = {}
+    literals = collect_literals(index)
+    texts = resolve_texts(literals, chain)
+    _extract_classes(index, classes, naming_strategy, texts)
+    ranges = RangeClassifier(classes)
+    _extract_properties(index, classes, naming_strategy, texts, external_classes, ranges)
+    namespaces = [(prefix, str(namespace)) for prefix, namespace in index.graph.namespaces()]
+    schema = SchemaIR(classes=classes, external_classes=external_classes, namespaces=namespaces, literals=literals, ranges=ranges)
+    # Analyse the class hierarchy once; ordering and inheritance lookups reuse it
+    schema.class_hierarchy()
+    return schema
+
+
+def _naming_strategy(context: dict | list | str | None, cache: NamingCache | None = None) -> NamingStrategy:
+    """Build the cached naming strategy for a JSON-LD context (aliases take precedence over local names)."""
+    alias_map = _build_alias_map(_normalize_contexts(context))
+    strategy = ContextAwareNamingStrategy(alias_map) if alias_map else DefaultNamingStrategy()
+    return CachedNamingStrategy(strategy, cache)
+
+
+def _extract_classes(index: SchemaIndex, classes: dict[str, ClassInfo], naming_strategy: NamingStrategy, texts: dict[str, tuple[str | None, str | None]]) -> None:
+    """Extract class definitions from a schema index.
+    
+    Args:
+        index: Schema index to extract from
         classes: Dictionary to populate with ClassInfo objects
         naming_strategy: Strategy for generating class/property names
-        language: Preferred language for labels and comments (default: 'en')
+        texts: Resolved (label, comment) per term IRI, from `resolve_texts`
     """
-    for subject in graph.subjects(RDF.type, RDFS.Class):
+    for subject in index.classes:
         if str(subject) not in classes:
-            class_name = naming_strategy.get_local_name(str(subject))
-            comment = _get_language_value(graph, subject, RDFS.comment, language)
-            label = _get_language_value(graph, subject, RDFS.label, language)
-            parents = list(graph.objects(subject, RDFS.subClassOf))
-            # Cast to proper types for type checker
-            parent_uris_list = [cast(URIRefType, p) for p in parents if isinstance(p, URIRefType)]
-            uri_ref = cast(URIRefType, subject) if isinstance(subject, URIRefType) else None
-            classes[str(subject)] = ClassInfo(
-                name=class_name,
-                comment=str(comment) if comment else None,
-                label=str(label) if label else None,
-                iri=str(subject),
-                parent_uris=parent_uris_list,
-                properties={},
-                uri=uri_ref,
-                graph=graph,
-            )
-
-
-def _extract_properties(graph: Graph, classes: dict[str, ClassInfo], naming_strategy: NamingStrategy, language: str = 'en', external_classes: dict[str, ClassInfo] | None = None) -> None:
+            info = _build_class(index, subject, naming_strategy, texts)
+            classes[info.iri] = info
+
+
+def _build_class(index: SchemaIndex, subject, naming_strategy: NamingStrategy, texts: dict[str, tuple[str | None, str | None]]) -> ClassInfo:
+    """Build the ClassInfo of an indexed class, without its properties."""
+    iri = sys.intern(str(subject))
+    class_name = naming_strategy.get_local_name(iri)
+    label, comment = texts.get(iri, (None, None))
+    parents = index.objects(subject, RDFS.subClassOf)
+    # Cast to proper types for type checker
+    parent_uris_list = [cast(URIRefType, p) for p in parents if isinstance(p, URIRefType)]
+    uri_ref = cast(URIRefType, subject) if isinstance(subject, URIRefType) else None
+    return ClassInfo(
+        name=class_name,
+        comment=comment,
+        label=label,
+        iri=iri,
+        parent_uris=parent_uris_list,
+        properties={},
+        uri=uri_ref,
+    )
+
+
+def _extract_properties(index: SchemaIndex, classes: dict[str, ClassInfo], naming_strategy: NamingStrategy, texts: dict[str, tuple[str | None, str | None]], external_classes: dict[str, ClassInfo] | None = None, ranges: RangeClassifier | None = None) -> None:
     """Extract property definitions and attach to classes.
     
     Args:
-        graph: RDF graph to extract from
+        index: Schema index to extract from
         classes: Dictionary of extracted classes to populate
         naming_strategy: Strategy for generating names
-        language: Preferred language for labels and comments
+        texts: Resolved (label, comment) per term IRI, from `resolve_texts`
         external_classes: Dict to populate with external class URIs and their properties (modified in place)
+        ranges: Classifier of range IRIs against `classes`
     """
-    from .type_annotation import get_property_type, get_union_property_type
-    
     if external_classes is None:
         external_classes = {}
+    if ranges is None:
+        ranges = RangeClassifier(classes)
     
-    prop_subjects = set(graph.subjects(RDF.type, RDF.Property))
-    for prop in prop_subjects:
-        domains = list(graph.objects(prop, RDFS.domain))
-        ranges = list(graph.objects(prop, RDFS.range))
-        label = _get_language_value(graph, prop, RDFS.label, language)
-        comment = _get_language_value(graph, prop, RDFS.comment, language)
-        if not domains or not ranges:
+    for prop in index.properties:
+        prop_info = _build_property(index, prop, naming_strategy, texts, ranges)
+        if prop_info is None:
             continue
-        prop_name = naming_strategy.get_local_name(str(prop))
         
-        # Filter ranges to only include classes that exist in our extracted classes,
-        # primitive datatypes, or track as external classes
-        valid_ranges = []
-        for range_val in ranges:
-            range_str = str(range_val)
-            # Check if it's a literal/datatype (be specific to avoid catching owl:Thing)
-            is_literal = (
-                "Literal" in range_str or 
-                "XMLSchema" in range_str or 
-                range_str.startswith("http://www.w3.org/2001/XMLSchema#") or
-                range_str == "http://www.w3.org/2000/01/rdf-schema#Literal"
-            )
-            # Check if it's in our extracted classes
-            is_known_class = range_str in classes
-            
-            if is_literal or is_known_class:
-                valid_ranges.append(range_val)
-            else:
-                # This is an external class reference - track it and include it
-                range_str_uri = str(range_val)
-                if range_str_uri not in external_classes:
-                    external_classes[range_str_uri] = ClassInfo(
-                        iri=range_str_uri,
-                        name=naming_strategy.get_local_name(range_str_uri),
-                        label=None,
-                        comment=None,
-                        parent_uris=[],
-                        properties={},
-                        uri=URIRefType(range_str_uri),
-                        graph=graph,
-                    )
-                valid_ranges.append(range_val)
-        
-        if not valid_ranges:
-            continue
-            
-        if len(valid_ranges) == 1:
-            prop_type = get_property_type(valid_ranges[0], naming_strategy)
-        else:
-            prop_type = get_union_property_type(valid_ranges, naming_strategy)
+        # Track range classes that are neither extracted classes nor datatypes as external classes
+        for range_val in prop_info.ranges:
+            range_str = sys.intern(str(range_val))
+            if ranges.kind(range_str) is RangeKind.EXTERNAL and range_str not in external_classes:
+                external_classes[range_str] = _build_external_class(range_str, naming_strategy)
         
-        # Add property to all domain classes (both internal and external)
-        for domain in domains:
-            domain_str = str(domain)
+        # Add the same property object to all domain classes (both internal and external)
+        for domain in index.objects(prop, RDFS.domain):
+            domain_str = sys.intern(str(domain))
             if domain_str in classes:
-                classes[domain_str].properties[prop_name] = PropertyInfo(
-                    name=prop_name,
-                    type_annotation=prop_type,
-                    label=str(label) if label else None,
-                    comment=str(comment) if comment else None,
-                    ranges=valid_ranges,
-                    iri=str(prop) if isinstance(prop, URIRefType) else str(prop),
-                )
-            elif domain_str not in classes:
+                owner = classes[domain_str]
+            else:
                 # Domain is an external class - create/update external class entry
                 if domain_str not in external_classes:
-                    external_classes[domain_str] = ClassInfo(
-                        iri=domain_str,
-                        name=naming_strategy.get_local_name(domain_str),
-                        label=None,
-                        comment=None,
-                        parent_uris=[],
-                        properties={},
-                        uri=URIRefType(domain_str),
-                        graph=graph,
-                    )
-                external_classes[domain_str].properties[prop_name] = PropertyInfo(
-                    name=prop_name,
-                    type_annotation=prop_type,
-                    label=str(label) if label else None,
-                    comment=str(comment) if comment else None,
-                    ranges=valid_ranges,
-                    iri=str(prop) if isinstance(prop, URIRefType) else str(prop),
-                )
+                    external_classes[domain_str] = _build_external_class(domain_str, naming_strategy)
+                owner = external_classes[domain_str]
+            owner.properties[prop_info.name] = prop_info
+
+
+def _build_property(index: SchemaIndex, prop, naming_strategy: NamingStrategy, texts: dict[str, tuple[str | None, str | None]], ranges: RangeClassifier | None = None) -> PropertyInfo | None:
+    """Build the PropertyInfo of an indexed property.
+    
+    Returns:
+        PropertyInfo shared by every domain class (treat it as immutable), or
+        None if the property lacks an rdfs:domain or rdfs:range
+    """
+    from .type_annotation import build_property_type
+    
+    domains = index.objects(prop, RDFS.domain)
+    range_uris = index.objects(prop, RDFS.range)
+    if not domains or not range_uris:
+        return None
+    iri = sys.intern(str(prop))
+    label, comment = texts.get(iri, (None, None))
+    prop_name = naming_strategy.get_local_name(iri)
+    
+    # Every range is kept: datatypes, extracted classes and external classes alike
+    valid_ranges = list(range_uris)
+    
+    return PropertyInfo(
+        name=prop_name,
+        property_type=build_property_type(valid_ranges, naming_strategy, ranges),
+        label=label,
+        comment=comment,
+        ranges=valid_ranges,
+        iri=iri,
+    )
+
+
+def _build_external_class(iri: str, naming_strategy: NamingStrategy) -> ClassInfo:
+    """Build a stub ClassInfo for a class referenced but not defined in the schema."""
+    iri = sys.intern(iri)
+    return ClassInfo(
+        iri=iri,
+        name=naming_strategy.get_local_name(iri),
+        label=None,
+        comment=None,
+        parent_uris=[],
+        properties={},
+        uri=URIRefType(iri),
+    )
 
 
 def _build_alias_map(contexts: list[dict] | None) -> dict[str, str]:
@@ -361,8 +437,7 @@ def _load_context_from_str(value: str) -> dict | None:
 
     parsed = urlparse(value)
     if parsed.scheme in {"http", "https"}:
-        with urlopen(value) as resp:
-            return json.load(resp)
+        return default_loader().fetch_json(value)
 
     if os.path.exists(value):
         with open(value, "r", encoding="utf-8") as f:
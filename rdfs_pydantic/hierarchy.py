@@ -0,0 +1,371 @@
+"""Analysis of the rdfs:subClassOf hierarchy of extracted classes.
+
+Merged vocabularies can declare cycles (A subClassOf B, B subClassOf A) or
+equivalent classes, and large ones have very deep chains. `ClassHierarchy`
+runs Tarjan's strongly-connected-components algorithm once, iteratively, and
+collapses every cycle into a single component. The resulting condensed graph is
+acyclic, so class ordering, ancestor queries and inherited-property walks work
+on any input in O(V + E) without recursion.
+
+Ancestry is answered from a reachability index: each component's ancestors are
+an integer bitset over component positions, built from its parents' bitsets on
+first use. Testing "is A an ancestor of B" is then a single bit test, and
+parent de-duplication no longer walks the hierarchy once per class.
+
+Inherited properties follow Python's method resolution order. Each class's C3
+linearization is merged from its parents' (already computed) linearizations,
+and its effective property table lets the nearest class in that order win,
+exactly as attribute lookup on the generated classes does.
+"""
+
+import heapq
+import sys
+import warnings
+from collections.abc import Iterable
+
+
+class ClassHierarchy:
+    """Strongly connected components and condensed DAG of a class hierarchy.
+
+    Attributes:
+        parents: Map of class URI -> distinct parent URIs that are themselves
+            classes, in declared order
+        components: Strongly connected components in topological order (parents
+            first); each is a list of class URIs sorted by URI
+        component_of: Map of class URI -> index into `components`
+        component_parents: Map of component index -> parent component indexes
+        cycles: Components that form a cycle, in the order of `components`
+        order: Class URIs in topological order (see `topological_sort_classes`)
+        reach: Map of component index -> bitset of ancestor component indexes
+            (bit i set if component i is an ancestor), filled in on first use;
+            a cyclic component has its own bit set
+        linearizations: Map of class URI -> method resolution order, filled in
+            on first use (see `mro`)
+    """
+
+    def __init__(self, classes: dict):
+        """Analyse a set of classes.
+
+        Issues a warning naming the classes on each cycle, if there are any.
+
+        Args:
+            classes: Dict of class_uri -> class_info (supports dict or dataclass values)
+        """
+        self.classes = classes
+        self.parents: dict[str, list[str]] = {}
+        for class_uri, class_info in classes.items():
+            parent_uris = getattr(class_info, "parent_uris", None)
+            if parent_uris is None and isinstance(class_info, dict):
+                parent_uris = class_info.get("parent_uris", [])
+            parents = dict.fromkeys(sys.intern(str(parent_uri)) for parent_uri in parent_uris or [])
+            self.parents[class_uri] = [parent for parent in parents if parent in classes]
+
+        self._condense(_strongly_connected_components(self.parents))
+        self.order = [uri for component in self.components for uri in component]
+        self.reach: dict[int, int] = {}
+        self.linearizations: dict[str, list[str]] = {}
+        self._properties: dict[str, dict] = {}
+
+        if self.cycles:
+            warnings.warn(
+                "Cyclic rdfs:subClassOf hierarchy; classes on a cycle are ordered by URI: "
+                + "; ".join(", ".join(component) for component in self.cycles),
+                stacklevel=2,
+            )
+
+    def is_cyclic(self, component: int) -> bool:
+        """Check whether a component is a cycle (several classes, or a class that is its own parent)."""
+        members = self.components[component]
+        return len(members) > 1 or members[0] in self.parents[members[0]]
+
+    def ancestors(self, class_uri: str) -> list[str]:
+        """Get every class a class inherits from, directly or transitively.
+
+        Classes on a cycle are ancestors of themselves and of each other.
+
+        Args:
+            class_uri: Class URI
+
+        Returns:
+            Ancestor class URIs in topological order (empty for unknown URIs)
+        """
+        component = self.component_of.get(class_uri)
+        if component is None:
+            return []
+        ancestors = []
+        reach = self._reach(component)
+        while reach:
+            lowest = reach & -reach
+            ancestors.extend(self.components[lowest.bit_length() - 1])
+            reach ^= lowest
+        return ancestors
+
+    def is_ancestor(self, ancestor: str, class_uri: str) -> bool:
+        """Check whether `class_uri` inherits from `ancestor`, directly or transitively."""
+        component = self.component_of.get(class_uri)
+        ancestor_component = self.component_of.get(ancestor)
+        if component is None or ancestor_component is None:
+            return False
+        return bool(self._reach(component) >> ancestor_component & 1)
+
+    def is_strict_ancestor(self, ancestor: str, class_uri: str) -> bool:
+        """Check whether `ancestor` is above `class_uri` without the two sharing a cycle."""
+        return (
+            self.is_ancestor(ancestor, class_uri)
+            and self.component_of[ancestor] != self.component_of[class_uri]
+        )
+
+    def minimal_parents(self, class_uri: str) -> list[str]:
+        """Get a class's parents, leaving out those another parent already inherits from.
+
+        Declaring both a base and one of its descendants as parents is common in
+        noisy ontologies and makes a Python MRO impossible, so generated classes
+        only list the most specific parents. Parents on a common cycle are all kept.
+
+        Args:
+            class_uri: Class URI
+
+        Returns:
+            Parent class URIs in declared order
+        """
+        parents = self.parents.get(class_uri, [])
+        if len(parents) < 2:
+            return list(parents)
+        return [
+            parent
+            for parent in parents
+            if not any(other != parent and self.is_strict_ancestor(parent, other) for other in parents)
+        ]
+
+    def mro(self, class_uri: str) -> list[str]:
+        """Get the method resolution order of a class generated with its `minimal_parents`.
+
+        This is the C3 linearization Python computes for the generated class:
+        the class itself, then its ancestors. Classes on a cycle, and classes
+        whose parents admit no consistent order, fall back to a depth-first
+        walk of their ancestors (with a warning in the latter case).
+        The result is shared between calls and must not be modified.
+
+        Args:
+            class_uri: Class URI
+
+        Returns:
+            Class URIs, starting with `class_uri` (empty for unknown URIs)
+        """
+        if class_uri not in self.parents:
+            return []
+
+        # Post-order over the acyclic part of the hierarchy, so parents are linearized first
+        stack = [class_uri]
+        while stack:
+            current = stack[-1]
+            if current in self.linearizations:
+                stack.pop()
+                continue
+            if self.is_cyclic(self.component_of[current]):
+                self.linearizations[current] = [current, *self.walk_ancestors(self.parents[current], exclude=(current,))]
+                stack.pop()
+                continue
+            parents = self.minimal_parents(current)
+            pending = [parent for parent in parents if parent not in self.linearizations]
+            if pending:
+                stack.extend(pending)
+                continue
+            if len(parents) == 1:
+                merged = self.linearizations[parents[0]]
+            else:
+                merged = _c3_merge([self.linearizations[parent] for parent in parents] + [parents])
+            if merged is None:
+                warnings.warn(
+                    f"No consistent method resolution order for {current} with parents "
+                    + ", ".join(parents),
+                    stacklevel=2,
+                )
+                merged = self.walk_ancestors(parents, exclude=(current,))
+            self.linearizations[current] = [current, *merged]
+            stack.pop()
+        return self.linearizations[class_uri]
+
+    def effective_properties(self, class_uri: str) -> dict:
+        """Get every property a class has, declared or inherited.
+
+        Each property name resolves to the first class in the `mro` declaring
+        it, so the class's own properties come first and override inherited ones.
+        The result is shared between calls and must not be modified.
+
+        Args:
+            class_uri: Class URI
+
+        Returns:
+            Map of property name -> property info (empty for unknown URIs)
+        """
+        if class_uri not in self._properties:
+            table: dict = {}
+            for uri in self.mro(class_uri):
+                class_info = self.classes[uri]
+                properties = getattr(class_info, "properties", None)
+                if properties is None and isinstance(class_info, dict):
+                    properties = class_info.get("properties", {})
+                for name, info in (properties or {}).items():
+                    table.setdefault(name, info)
+            self._properties[class_uri] = table
+        return self._properties[class_uri]
+
+    def walk_ancestors(self, parent_uris: Iterable[str], exclude: Iterable[str] = ()) -> list[str]:
+        """List the classes reached depth-first from some parents, each once, in pre-order.
+
+        Args:
+            parent_uris: Parents to start from, in order (non-class URIs are skipped)
+            exclude: URIs never to visit (e.g., the class whose parents these are)
+
+        Returns:
+            Class URIs in the order a recursive depth-first walk first reaches them
+        """
+        seen = set(exclude)
+        walked = []
+        stack = [uri for uri in reversed(list(parent_uris)) if uri in self.parents]
+        while stack:
+            uri = stack.pop()
+            if uri in seen:
+                continue
+            seen.add(uri)
+            walked.append(uri)
+            stack.extend(reversed(self.parents[uri]))
+        return walked
+
+    def _reach(self, component: int) -> int:
+        """Get the ancestor bitset of a component, building any missing parent bitsets first."""
+        if component in self.reach:
+            return self.reach[component]
+
+        # Post-order over the condensed DAG, so each parent's bitset is ready before its children's
+        stack = [component]
+        while stack:
+            current = stack[-1]
+            if current in self.reach:
+                stack.pop()
+                continue
+            pending = [parent for parent in self.component_parents[current] if parent not in self.reach]
+            if pending:
+                stack.extend(pending)
+                continue
+            reach = 1 << current if self.is_cyclic(current) else 0
+            for parent in self.component_parents[current]:
+                reach |= self.reach[parent] | 1 << parent
+            self.reach[current] = reach
+            stack.pop()
+        return self.reach[component]
+
+    def _condense(self, raw_components: list[list[str]]) -> None:
+        """Order the components with Kahn's algorithm, smallest member URI first among ready ones."""
+        raw_of = {uri: i for i, component in enumerate(raw_components) for uri in component}
+        raw_parents: list[set[int]] = []
+        dependents: dict[int, list[int]] = {}
+        in_degree = []
+        for i, component in enumerate(raw_components):
+            parents = {raw_of[parent] for uri in component for parent in self.parents[uri]} - {i}
+            raw_parents.append(parents)
+            in_degree.append(len(parents))
+            for parent in parents:
+                dependents.setdefault(parent, []).append(i)
+
+        keys = [min(component) for component in raw_components]
+        ready = [(keys[i], i) for i, degree in enumerate(in_degree) if degree == 0]
+        heapq.heapify(ready)
+        ordered = []
+        while ready:
+            _, current = heapq.heappop(ready)
+            ordered.append(current)
+            for dependent in dependents.get(current, ()):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    heapq.heappush(ready, (keys[dependent], dependent))
+
+        position = {raw: i for i, raw in enumerate(ordered)}
+        self.components = [sorted(raw_components[raw]) for raw in ordered]
+        self.component_of = {uri: i for i, component in enumerate(self.components) for uri in component}
+        self.component_parents = {
+            position[raw]: [position[parent] for parent in sorted(raw_parents[raw], key=position.__getitem__)]
+            for raw in ordered
+        }
+        self.cycles = [component for i, component in enumerate(self.components) if self.is_cyclic(i)]
+
+
+def _c3_merge(sequences: list[list[str]]) -> list[str] | None:
+    """Merge linearizations with C3: repeatedly take the first head not in any tail.
+
+    Returns:
+        The merged order, or None if the sequences admit no consistent order
+    """
+    sequences = [list(reversed(sequence)) for sequence in sequences if sequence]
+    tail_counts: dict[str, int] = {}
+    for sequence in sequences:
+        for uri in sequence[:-1]:
+            tail_counts[uri] = tail_counts.get(uri, 0) + 1
+
+    merged = []
+    while sequences:
+        for sequence in sequences:
+            head = sequence[-1]
+            if not tail_counts.get(head):
+                break
+        else:
+            return None
+        merged.append(head)
+        for sequence in sequences:
+            if sequence[-1] == head:
+                sequence.pop()
+                if sequence:
+                    tail_counts[sequence[-1]] -= 1
+        sequences = [sequence for sequence in sequences if sequence]
+    return merged
+
+
+def _strongly_connected_components(successors: dict[str, list[str]]) -> list[list[str]]:
+    """Find strongly connected components with an iterative version of Tarjan's algorithm.
+
+    Args:
+        successors: Adjacency lists; every successor must itself be a key
+
+    Returns:
+        Components in reverse topological order of the edges (successors first)
+    """
+    index_of: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    components: list[list[str]] = []
+
+    for root in successors:
+        if root in index_of:
+            continue
+        index_of[root] = lowlink[root] = len(index_of)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors[root]))]
+        while work:
+            node, remaining = work[-1]
+            for successor in remaining:
+                if successor not in index_of:
+                    index_of[successor] = lowlink[successor] = len(index_of)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(successors[successor])))
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[successor])
+            else:
+                work.pop()
+                if work:
+                    caller = work[-1][0]
+                    lowlink[caller] = min(lowlink[caller], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
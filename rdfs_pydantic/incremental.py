@@ -0,0 +1,283 @@
+"""Incremental update of an extracted schema from added and removed triples.
+
+Re-extracting a large ontology after a one-triple edit repeats work for every
+class. `update_schema` instead applies the edit to the `SchemaIndex` the schema
+was extracted from and rebuilds only the affected entries: the edited classes,
+the classes and external stubs that edited properties attach to or range over,
+and the properties whose domain is one of those. The index's reverse map of
+rdfs:domain/rdfs:range/rdfs:subClassOf references finds them without scanning
+the whole schema.
+
+Example:
+    ```python
+    index = SchemaIndex.from_graph(graph)
+    schema = extract_schema(index)
+
+    graph.add(triple)
+    update = update_schema(schema, index, added=[triple])
+    for iri in update.changed_classes:
+        ...  # re-render only these classes
+    ```
+"""
+
+from collections.abc import Iterable, Sequence
+from rdflib.namespace import RDF, RDFS
+from rdflib.term import Node, URIRef
+from .extraction import (
+    _build_class,
+    _build_external_class,
+    _build_property,
+    _get_namespace,
+    _naming_strategy,
+    resolve_texts,
+)
+from .language import LanguageChain
+from .models import ClassInfo, PrefixBindingReport, PropertyInfo, SchemaIR, SchemaUpdate
+from .ranges import RangeClassifier
+from .schema_index import SCHEMA_TYPES, VALUE_PREDICATES, SchemaIndex
+from .utils import extract_prefix_and_local
+
+Triple = tuple[Node, Node, Node]
+
+
+def update_schema(
+    schema: SchemaIR,
+    index: SchemaIndex,
+    added: Iterable[Triple] = (),
+    removed: Iterable[Triple] = (),
+    context: dict | list | str | None = None,
+    language: str | Sequence[str] = 'en',
+) -> SchemaUpdate:
+    """Apply added and removed triples to a schema and its index in place.
+
+    The result matches a fresh `extract_schema(index, context, language)` over
+    the edited index, apart from the order of `schema.external_classes`. When
+    the edits were also applied to `index.graph`, it likewise matches an
+    extraction from `SchemaIndex.from_graph(index.graph)`: the objects of
+    edited subjects are put back in graph order, so multi-valued parents,
+    ranges and labels come out in the same order.
+
+    Args:
+        schema: Schema previously extracted from `index` (updated in place)
+        index: Schema index the schema was extracted from (updated in place).
+            Values of subjects that become classes or properties are read from
+            `index.graph` as well as from `added`.
+        added: Triples added to the ontology
+        removed: Triples removed from the ontology (applied before `added`)
+        context: JSON-LD context the schema was extracted with
+        language: Language preference the schema was extracted with
+
+    Returns:
+        SchemaUpdate listing the classes and external stubs to re-render
+
+    Raises:
+        ValueError: If an added rdfs:Class or rdf:Property lacks a bound prefix
+            (neither the schema nor the index is modified)
+    """
+    added = list(added)
+    removed = list(removed)
+    removed_set = set(removed)
+    chain = LanguageChain(language)
+    naming_strategy = _naming_strategy(context)
+
+    _check_new_subjects(index, added)
+
+    # Record what the edited subjects referred to before the edit
+    touched = dict.fromkeys(subject for subject, _, _ in (*removed, *added))
+    old_classes = {subject for subject in touched if subject in index.classes}
+    references = dict.fromkeys(_references(index, touched))
+
+    for triple in removed:
+        index.remove(*triple)
+    for triple in added:
+        index.add(*triple)
+    for subject in touched:
+        if index.is_schema_subject(subject) and subject not in old_classes:
+            # Newly typed subjects keep the values already in the source graph
+            for predicate, obj in index.graph.predicate_objects(subject):
+                if predicate in VALUE_PREDICATES and (subject, predicate, obj) not in removed_set:
+                    index.add(subject, predicate, obj)
+        index.follow_graph_order(subject)
+    references.update(dict.fromkeys(_references(index, touched)))
+
+    for subject in touched:
+        iri = str(subject)
+        if index.is_schema_subject(subject):
+            labels = tuple(index.objects(subject, RDFS.label))
+            comments = tuple(index.objects(subject, RDFS.comment))
+            if labels or comments:
+                schema.literals[iri] = (labels, comments)
+                continue
+        schema.literals.pop(iri, None)
+
+    update = SchemaUpdate()
+    added_classes = [s for s in touched if s in index.classes and s not in old_classes]
+    removed_classes = [s for s in touched if s in old_classes and s not in index.classes]
+
+    # Rebuild edited classes. A class whose rdf:type was removed (and maybe
+    # re-added) leaves its position, as it does in the index.
+    previous: dict[str, ClassInfo] = {}
+    for subject in touched:
+        iri = str(subject)
+        if iri in schema.classes and (subject not in index.classes or (subject, RDF.type, RDFS.Class) in removed_set):
+            previous[iri] = schema.classes.pop(iri)
+            schema.curies.pop(iri, None)
+            if subject not in index.classes:
+                update.removed_classes.add(iri)
+    class_texts = resolve_texts({str(s): schema.literals[str(s)] for s in touched if str(s) in schema.literals}, chain)
+    for subject in touched:
+        if subject in index.classes and str(subject) in schema.classes:
+            iri = str(subject)
+            previous[iri] = schema.classes[iri]
+            info = _build_class(index, subject, naming_strategy, class_texts)
+            info.properties = previous[iri].properties
+            schema.classes[iri] = info
+    missing = [s for s in touched if s in index.classes and str(s) not in schema.classes]
+    for subject in _last(index.classes, len(missing)):
+        schema.classes[str(subject)] = _build_class(index, subject, naming_strategy, class_texts)
+
+    # Classes whose descendants render differently: their names, parents or
+    # properties changed (descendants render their most specific parents and,
+    # in stubs, every inherited property)
+    ancestors = {
+        iri for iri, info in previous.items()
+        if iri not in schema.classes
+        or (schema.classes[iri].name, schema.classes[iri].parent_uris) != (info.name, info.parent_uris)
+    }
+    ancestors.update(str(subject) for subject in added_classes)
+
+    # Rebuild the properties of every class or stub an edited term touches
+    targets = dict.fromkeys((*touched, *references, *added_classes, *removed_classes))
+    builder = _PropertyBuilder(schema, index, naming_strategy, chain, schema.range_classifier())
+    for target in targets:
+        iri = str(target)
+        properties = builder.properties_of(target)
+        if iri in schema.classes:
+            if schema.classes[iri].properties != properties:
+                ancestors.add(iri)
+            schema.classes[iri].properties = properties
+            if schema.classes[iri] != previous.get(iri):
+                update.changed_classes.add(iri)
+            if iri in schema.external_classes:
+                del schema.external_classes[iri]
+                update.removed_external_classes.add(iri)
+        elif properties or builder.is_range(target):
+            stub = schema.external_classes.get(iri)
+            if stub is None:
+                stub = schema.external_classes[iri] = _build_external_class(iri, naming_strategy)
+                update.changed_external_classes.add(iri)
+            if stub.properties != properties:
+                stub.properties = properties
+                update.changed_external_classes.add(iri)
+        elif iri in schema.external_classes:
+            del schema.external_classes[iri]
+            update.removed_external_classes.add(iri)
+
+    # Classes sharing a local name with an added or removed class may be
+    # wrapped in (or unwrapped from) a namespace group
+    regrouped = [URIRef(iri) for iri in _colliding_classes(schema, (*added_classes, *removed_classes))]
+    update.changed_classes.update(str(subject) for subject in regrouped)
+    ancestors.update(str(subject) for subject in regrouped)
+
+    # Classes with properties ranging over an added, removed or regrouped
+    # class render differently even though their entries are unchanged
+    for subject in (*added_classes, *removed_classes, *regrouped):
+        for prop in index.subjects(RDFS.range, subject):
+            for domain in index.objects(prop, RDFS.domain):
+                if str(domain) in schema.classes:
+                    update.changed_classes.add(str(domain))
+
+    # Every descendant of such a class changes with it
+    pending = [URIRef(iri) for iri in ancestors]
+    visited = set(pending)
+    while pending:
+        for child in index.subjects(RDFS.subClassOf, pending.pop()):
+            if str(child) in schema.classes:
+                update.changed_classes.add(str(child))
+            if child not in visited:
+                visited.add(child)
+                pending.append(child)
+    if update.changed_classes or update.removed_classes:
+        schema.hierarchy = None
+    return update
+
+
+def _check_new_subjects(index: SchemaIndex, added: list[Triple]) -> None:
+    """Raise if a subject newly typed by `added` lacks a bound prefix."""
+    bound_namespaces = None
+    unbound = []
+    for subject, predicate, obj in added:
+        if predicate != RDF.type or obj not in SCHEMA_TYPES or index.is_schema_subject(subject):
+            continue
+        if bound_namespaces is None:
+            bound_namespaces = {str(ns) for _, ns in index.graph.namespaces()}
+        if _get_namespace(str(subject)) not in bound_namespaces:
+            unbound.append((str(subject), "rdfs:Class" if obj == RDFS.Class else "rdf:Property"))
+    PrefixBindingReport(unbound=unbound).raise_for_unbound()
+
+
+def _colliding_classes(schema: SchemaIR, subjects: Sequence[Node]) -> set[str]:
+    """Get the classes whose local name is also the local name of one of `subjects`."""
+    if not subjects:
+        return set()
+    graph = schema.namespace_graph()
+    local_names = {extract_prefix_and_local(subject, graph)[1] for subject in subjects if isinstance(subject, URIRef)}
+    return {iri for iri, (_, local) in schema.class_curies().items() if local in local_names}
+
+
+def _references(index: SchemaIndex, subjects: Iterable[Node]) -> Iterable[Node]:
+    """Yield the rdfs:domain and rdfs:range objects of the given subjects."""
+    for subject in subjects:
+        yield from index.objects(subject, RDFS.domain)
+        yield from index.objects(subject, RDFS.range)
+
+
+def _last(ordered: dict, count: int) -> list:
+    """Get the last `count` keys of an insertion-ordered dict, in order."""
+    if count <= 0:
+        return []
+    keys = reversed(ordered)
+    return [next(keys) for _ in range(count)][::-1]
+
+
+class _PropertyBuilder:
+    """Builds PropertyInfo entries on demand, at most once per property."""
+
+    def __init__(self, schema: SchemaIR, index: SchemaIndex, naming_strategy, chain: LanguageChain, ranges: RangeClassifier):
+        self.schema = schema
+        self.index = index
+        self.naming_strategy = naming_strategy
+        self.chain = chain
+        self.ranges = ranges
+        self.built: dict[Node, PropertyInfo | None] = {}
+        self.positions: dict[Node, int] | None = None
+
+    def build(self, prop: Node) -> PropertyInfo | None:
+        if prop not in self.built:
+            info = None
+            if prop in self.index.properties:
+                iri = str(prop)
+                literals = self.schema.literals
+                texts = resolve_texts({iri: literals[iri]} if iri in literals else {}, self.chain)
+                info = _build_property(self.index, prop, self.naming_strategy, texts, self.ranges)
+            self.built[prop] = info
+        return self.built[prop]
+
+    def properties_of(self, target: Node) -> dict[str, PropertyInfo]:
+        """Build the properties dict of a class or stub, in extraction order."""
+        props = [p for p in self.index.subjects(RDFS.domain, target) if self.build(p) is not None]
+        if len(props) > 1:
+            if self.positions is None:
+                self.positions = {p: i for i, p in enumerate(self.index.properties)}
+            props.sort(key=self.positions.__getitem__)
+        properties: dict[str, PropertyInfo] = {}
+        for prop in props:
+            info = self.built[prop]
+            properties[info.name] = info
+        return properties
+
+    def is_range(self, target: Node) -> bool:
+        """Check whether an extracted property ranges over a non-datatype target."""
+        if self.ranges.is_datatype(target):
+            return False
+        return any(self.build(p) is not None for p in self.index.subjects(RDFS.range, target))
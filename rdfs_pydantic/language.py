@@ -0,0 +1,113 @@
+"""Language preference chains for selecting labels and comments.
+
+A preference is an ordered list of BCP 47 language ranges, given either as a
+comma-separated string ("en-GB,en,und,*") or a sequence. Two ranges are special:
+"und" selects untagged literals (and literals tagged "und"), and "*" selects the
+first value in any language. A range matches a tag exactly or as a subtag
+prefix, so "en" also matches "en-GB" and "en-US" (RFC 4647 basic filtering).
+"""
+
+import re
+from collections.abc import Collection, Sequence
+from rdflib.term import Literal
+
+ANY = "*"
+UNTAGGED = "und"
+
+_RANGE_PATTERN = re.compile(r"\*|[a-z]{1,8}(?:-[a-z0-9]{1,8})*")
+
+
+def parse_language_chain(language: str | Sequence[str]) -> tuple[str, ...]:
+    """Normalize a language preference into an ordered fallback chain.
+
+    Ranges are lower-cased and deduplicated. Unless the chain already ends
+    with "*", it is completed with "und" and "*", so a single preferred
+    language keeps the historical fallbacks (untagged, then any value).
+
+    Args:
+        language: A language range, a comma-separated chain, or a sequence of ranges
+
+    Returns:
+        Tuple of lower-cased language ranges
+
+    Raises:
+        ValueError: If the chain is empty or contains a malformed range
+    """
+    items = language.split(",") if isinstance(language, str) else language
+    chain: list[str] = []
+    for item in items:
+        language_range = item.strip().lower()
+        if not _RANGE_PATTERN.fullmatch(language_range):
+            raise ValueError(f"Invalid language range '{item}' in language preference '{language}'")
+        if language_range not in chain:
+            chain.append(language_range)
+    if not chain:
+        raise ValueError("Language preference cannot be empty")
+    if chain[-1] != ANY:
+        if UNTAGGED not in chain:
+            chain.append(UNTAGGED)
+        if ANY not in chain:
+            chain.append(ANY)
+    return tuple(chain)
+
+
+class LanguageChain:
+    """Compiled language preference that picks one value from a set of candidates.
+
+    Example:
+        ```python
+        chain = LanguageChain("en-GB,en,und,*")
+        label = chain.select(index.objects(subject, RDFS.label))
+        ```
+    """
+
+    __slots__ = ("ranges",)
+
+    def __init__(self, language: str | Sequence[str] = "en"):
+        """Initialize the chain.
+
+        Args:
+            language: Language preference (see `parse_language_chain`)
+        """
+        self.ranges = parse_language_chain(language)
+
+    @property
+    def primary(self) -> str:
+        """The most preferred language range."""
+        return self.ranges[0]
+
+    def select(self, values: Collection):
+        """Pick the value that best matches the chain.
+
+        Candidates are grouped by tag in a single pass; each range is then
+        resolved with dictionary lookups rather than another scan of the values.
+
+        Args:
+            values: Candidate values for a single subject and predicate
+
+        Returns:
+            The first value for the earliest matching range, or None if there are no values
+        """
+        if not values:
+            return None
+
+        by_tag: dict[str, object] = {}
+        for value in values:
+            tag = value.language.lower() if isinstance(value, Literal) and value.language else ""
+            by_tag.setdefault(tag, value)
+
+        for language_range in self.ranges:
+            if language_range == ANY:
+                return next(iter(values))
+            if language_range == UNTAGGED:
+                for tag in ("", UNTAGGED):
+                    if tag in by_tag:
+                        return by_tag[tag]
+                continue
+            if language_range in by_tag:
+                return by_tag[language_range]
+            prefix = language_range + "-"
+            for tag, value in by_tag.items():
+                if tag.startswith(prefix):
+                    return value
+        return None
@@ -3,14 +3,22 @@
 These dataclasses provide type-safe representations of RDF ontology elements,
 replacing the previous dict-based approach throughout the extraction and
 generation pipeline.
+
+The per-term classes use `__slots__`, as large ontologies produce hundreds of
+thousands of them. Extraction interns IRI strings and attaches one
+`PropertyInfo` to every domain of a property, so treat property entries as
+shared and replace rather than mutate them when a single class needs a change.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Mapping, Set, Tuple
 from rdflib import Graph
 from rdflib.term import URIRef
+from .hierarchy import ClassHierarchy
+from .ranges import RangeClassifier
+from .utils import extract_prefix_and_local
 
 
 @dataclass
@@ -55,26 +63,82 @@ class IriComponents:
         return cls(namespace="", local_name=iri, full_iri=iri)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class TypeMember:
+    """One member of a property type union.
+
+    - `name`: Python name, either a class name or a primitive type such as "str"
+    - `iri`: IRI of the referenced class; None for primitive types
+    """
+
+    name: str
+    iri: Optional[str] = None
+
+    def render(self, names: Optional[Mapping[str, str]] = None) -> str:
+        """Render the member, using `names[iri]` for classes listed there."""
+        if names and self.iri is not None:
+            return names.get(self.iri, self.name)
+        return self.name
+
+
+@dataclass(frozen=True, slots=True)
+class PropertyType:
+    """Structured Python type of a property: a container of a union of members.
+
+    Types are kept structured until emission, so generators can qualify class
+    references by IRI instead of editing rendered annotations.
+
+    - `members`: Union members in rendering order, without duplicate names
+    - `container`: Generic container wrapping the union (e.g. "list")
+    """
+
+    members: Tuple[TypeMember, ...] = (TypeMember("str"),)
+    container: str = "list"
+
+    def union(self, names: Optional[Mapping[str, str]] = None) -> str:
+        """Render the union of members (e.g. "Email | str")."""
+        return " | ".join(member.render(names) for member in self.members)
+
+    def render(self, names: Optional[Mapping[str, str]] = None) -> str:
+        """Render the annotation used on model fields (e.g. "list[Email | str]").
+
+        Args:
+            names: Optional map of class IRI -> name to render instead of the
+                member's own name (e.g. a namespace-qualified name)
+        """
+        return f"{self.container}[{self.union(names)}]"
+
+    def render_optional(self, names: Optional[Mapping[str, str]] = None) -> str:
+        """Render the constructor-friendly annotation (e.g. "Person | list[Person] | None")."""
+        union = self.union(names)
+        return f"{union} | {self.container}[{union}] | None"
+
+
+@dataclass(slots=True)
 class PropertyInfo:
     """Represents an RDF property attached to a class.
 
     - `name`: Python-safe property identifier
-    - `type_annotation`: The rendered Python type (e.g. "list[Email | str]")
+    - `property_type`: The structured Python type (see `PropertyType`)
     - `label`/`comment`: Optional text used for Field descriptions
     - `ranges`: Original RDF range URIs used for import/qualification logic
     - `iri`: Optional IRI for the property
     """
 
     name: str
-    type_annotation: str
+    property_type: PropertyType = field(default_factory=PropertyType)
     label: Optional[str] = None
     comment: Optional[str] = None
     ranges: List[URIRef] = field(default_factory=list)
     iri: Optional[str] = None
 
+    @property
+    def type_annotation(self) -> str:
+        """The rendered, unqualified Python type (e.g. "list[Email | str]")."""
+        return self.property_type.render()
 
-@dataclass
+
+@dataclass(slots=True)
 class ClassInfo:
     """Represents an extracted RDF class.
 
@@ -83,8 +147,10 @@ class ClassInfo:
     - `label`/`comment`: Optional text used for docstrings
     - `parent_uris`: Parent class URIs (RDFS subClassOf)
     - `properties`: Map of property name -> PropertyInfo
-    - `uri`: Original URIRef from the RDF graph
-    - `graph`: RDF graph reference for namespace resolution
+    - `uri`: Original URIRef from the RDF graph (None for blank nodes)
+
+    Prefixes are resolved through the owning schema's namespace table (see
+    `SchemaIR.class_curies`), so classes hold no reference to the source graph.
     """
 
     iri: str
@@ -94,7 +160,158 @@ class ClassInfo:
     parent_uris: List[URIRef] = field(default_factory=list)
     properties: Dict[str, PropertyInfo] = field(default_factory=dict)
     uri: Optional[URIRef] = None
-    graph: Optional[Graph] = None
 
     def has_properties(self) -> bool:
         return bool(self.properties)
+
+
+@dataclass
+class PrefixBindingReport:
+    """Result of checking that schema IRIs have bound namespace prefixes.
+
+    - `unbound`: (iri, rdf_type) pairs lacking a bound prefix, where rdf_type
+      is "rdfs:Class" or "rdf:Property"
+    """
+
+    unbound: List[Tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def unbound_classes(self) -> List[Tuple[str, str]]:
+        return [entry for entry in self.unbound if entry[1] == "rdfs:Class"]
+
+    def is_valid(self) -> bool:
+        return not self.unbound
+
+    def error_message(self) -> str:
+        """Render an actionable message listing every unbound IRI."""
+        error_msg = "The following IRIs lack bound prefixes:\n"
+        for iri, rdf_type in self.unbound:
+            error_msg += f"  - {iri} ({rdf_type})\n"
+        error_msg += (
+            "\nBound prefixes are required for deterministic code generation "
+            "(stable class/module names and namespace grouping).\n"
+            "Fix by either:\n"
+            "  1) Declaring @prefix in your RDF/Turtle input, or\n"
+            "  2) Binding in code, e.g.: graph.bind(\"ex\", \"http://example.org/\")"
+        )
+        return error_msg
+
+    def raise_for_unbound(self) -> None:
+        """Raise ValueError if any IRI lacks a bound prefix."""
+        if self.unbound:
+            raise ValueError(self.error_message())
+
+
+@dataclass
+class SchemaIR:
+    """Extracted schema, ready to render without the source graph.
+
+    - `classes`: Map of class IRI -> ClassInfo
+    - `external_classes`: Map of external class IRI -> ClassInfo stub
+    - `namespaces`: (prefix, namespace) bindings used for prefix resolution,
+      shared by every class in place of a reference to the source graph
+    - `literals`: Map of term IRI -> (rdfs:label values, rdfs:comment values), kept
+      so labels and comments can be resolved again for another language
+    - `hierarchy`: Cached `ClassHierarchy` of `classes` (see `class_hierarchy`);
+      reset to None whenever classes or their parents change
+    - `curies`: Map of class IRI -> (prefix, local name), both sanitized, filled
+      in by `class_curies`
+    - `ranges`: Cached `RangeClassifier` of range IRIs (see `range_classifier`)
+    """
+
+    classes: Dict[str, ClassInfo] = field(default_factory=dict)
+    external_classes: Dict[str, ClassInfo] = field(default_factory=dict)
+    namespaces: List[Tuple[str, str]] = field(default_factory=list)
+    literals: Dict[str, Tuple[tuple, tuple]] = field(default_factory=dict)
+    hierarchy: Optional[ClassHierarchy] = field(default=None, repr=False, compare=False)
+    curies: Dict[str, Tuple[str, str]] = field(default_factory=dict, repr=False, compare=False)
+    ranges: Optional[RangeClassifier] = field(default=None, repr=False, compare=False)
+
+    def class_hierarchy(self) -> ClassHierarchy:
+        """Get the subClassOf hierarchy analysis of `classes`, computing it on first use."""
+        if self.hierarchy is None:
+            self.hierarchy = ClassHierarchy(self.classes)
+        return self.hierarchy
+
+    def class_curies(self) -> Dict[str, Tuple[str, str]]:
+        """Get the (prefix, local name) of every class, resolving each IRI only once.
+
+        Computing a qualified name through the namespace manager is expensive,
+        and generators look classes up by prefix many times per run, so results
+        are kept in `curies`. Classes without a URI are left out.
+        """
+        curies = self.curies
+        graph = None
+        for iri, info in self.classes.items():
+            if iri not in curies and info.uri is not None:
+                if graph is None:
+                    graph = self.namespace_graph()
+                curies[iri] = extract_prefix_and_local(info.uri, graph)
+        return curies
+
+    def range_classifier(self) -> RangeClassifier:
+        """Get the classifier labelling range IRIs against `classes`, creating it on first use."""
+        if self.ranges is None:
+            self.ranges = RangeClassifier(self.classes)
+        elif self.ranges.classes is not self.classes:
+            self.ranges = self.ranges.bind(self.classes)
+        return self.ranges
+
+    def namespace_graph(self) -> Graph:
+        """Build an empty graph carrying only this schema's namespace bindings."""
+        graph = Graph(bind_namespaces="none")
+        for prefix, namespace in self.namespaces:
+            graph.bind(prefix, namespace, override=True, replace=True)
+        return graph
+
+
+@dataclass
+class SchemaUpdate:
+    """Classes affected by an incremental schema update, so rendering can be limited to them.
+
+    - `changed_classes`: IRIs of added classes and of classes whose definition
+      or rendering may have changed: descendants of classes whose name, parents
+      or properties changed, classes sharing a local name with an added or
+      removed class, and classes with properties ranging over either
+    - `removed_classes`: IRIs of classes no longer in the schema
+    - `changed_external_classes`: IRIs of external class stubs added or changed
+    - `removed_external_classes`: IRIs of external class stubs no longer needed
+    """
+
+    changed_classes: Set[str] = field(default_factory=set)
+    removed_classes: Set[str] = field(default_factory=set)
+    changed_external_classes: Set[str] = field(default_factory=set)
+    removed_external_classes: Set[str] = field(default_factory=set)
+
+    def is_empty(self) -> bool:
+        """Check whether the update left every class unchanged."""
+        return not (
+            self.changed_classes
+            or self.removed_classes
+            or self.changed_external_classes
+            or self.removed_external_classes
+        )
+
+
+@dataclass
+class PackageReport:
+    """Files a package generation run wrote, left untouched or deleted.
+
+    Paths are relative to the package directory and use forward slashes.
+
+    - `written`: Files created or rewritten because their content changed
+    - `unchanged`: Files whose content was already up to date (not rewritten)
+    - `removed`: Previously generated files the schema no longer produces
+    """
+
+    written: Set[str] = field(default_factory=set)
+    unchanged: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+
+    def is_empty(self) -> bool:
+        """Check whether the run left every file on disk as it was."""
+        return not (self.written or self.removed)
+
+    def summary(self) -> str:
+        """Get a one-line summary such as "3 written, 120 unchanged, 2 removed"."""
+        return f"{len(self.written)} written, {len(self.unchanged)} unchanged, {len(self.removed)} removed"
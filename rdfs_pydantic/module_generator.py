@@ -1,12 +1,19 @@
 """Generate inline Pydantic model code."""
 
+import dataclasses
 import re
-from typing import Set
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Set, TextIO
 from rdflib import Graph
 from pydantic import BaseModel
-from .extraction import extract_classes_and_properties
-from .models import ClassInfo
-from .utils import extract_prefix_and_local, topological_sort_classes
+from .extraction import extract_schema, localize_schema
+from .hierarchy import ClassHierarchy
+from .language import LanguageChain
+from .ranges import RangeClassifier
+from .schema_index import SchemaIndex
+from .models import ClassInfo, PropertyInfo, PropertyType, SchemaIR, TypeMember
 from .codegen import (
     generate_docstring,
     generate_class_definition,
@@ -16,28 +23,154 @@ from .codegen import (
 )
 
 
-def create_module(graph: Graph, context: dict | None = None, base_cls: type[BaseModel] | None = None, language: str = 'en', emit_iris: bool = False) -> str:
+def create_module(graph: Graph | SchemaIndex | SchemaIR, context: dict | None = None, base_cls: type[BaseModel] | None = None, language: str | Sequence[str] = 'en', emit_iris: bool = False, out: TextIO | None = None, jobs: int = 1) -> str | None:
     """Transform RDFS ontology from an RDF graph into Pydantic model code.
     
     Args:
-        graph: RDFLib Graph object containing RDFS ontology
+        graph: RDFLib Graph object containing RDFS ontology, a SchemaIndex built from one,
+               or a previously extracted SchemaIR (context and language are then ignored)
         context: Optional JSON-LD @context document providing aliases
         base_cls: Base class type to inherit from (default: None, uses BaseModel).
                  Pass a custom BaseModel subclass for specialized base models.
                  When emit_iris=True, consider using IRIAwareBaseModel or defining
                  a _class_iri ClassVar in your base class. See rdfs_pydantic.base
                  for examples and the RDFSBaseModel protocol.
-        language: Preferred language for labels and comments (default: 'en')
+        language: Preferred language for labels and comments, or a fallback chain
+                  such as "en-GB,en,und,*" or ["en-GB", "en"] (default: 'en')
         emit_iris: If True, emit class IRIs as ClassVar and property IRIs in Field metadata (default: False)
+        out: Optional text stream to write the code to as each class is
+             rendered, instead of building and returning one string
+        jobs: Number of worker processes rendering chunks of classes (default: 1,
+              serial). The code is identical to a serial run.
         
     Returns:
-        Python code defining Pydantic models
+        Python code defining Pydantic models, or None when written to `out`
     """
-    classes, external_classes = extract_classes_and_properties(graph, context, language)
+    chunks = iter_module(graph, context, base_cls, language, emit_iris, jobs)
+    if out is None:
+        return "".join(chunks)
+    for chunk in chunks:
+        out.write(chunk)
+    return None
+
+
+def iter_module(graph: Graph | SchemaIndex | SchemaIR, context: dict | None = None, base_cls: type[BaseModel] | None = None, language: str | Sequence[str] = 'en', emit_iris: bool = False, jobs: int = 1) -> Iterator[str]:
+    """Transform an RDFS ontology into Pydantic model code, one class block at a time.
+    
+    The schema is extracted and laid out before this returns; rendering then
+    happens lazily, so a large module never has to be held in memory whole.
+    Takes the same arguments as `create_module`, apart from `out`.
+    
+    Returns:
+        Iterator over consecutive pieces of the module; joined, they equal
+        the code returned by `create_module`
+    """
+    schema = _apply_legacy_canonical_range_type(extract_schema(graph, context, language))
+    layout = _prepare_module(schema)
+    return _iter_render_module(schema, layout, base_cls, language, emit_iris, jobs)
+
+
+def create_modules(graph: Graph | SchemaIndex | SchemaIR, languages: Sequence[str], context: dict | None = None, base_cls: type[BaseModel] | None = None, emit_iris: bool = False, jobs: int = 1) -> dict[str, str]:
+    """Transform an RDFS ontology into one Pydantic module per language.
+    
+    Extraction, prefix validation, topological sorting and name qualification
+    run once; only label and comment resolution and rendering run per language.
+    
+    Args:
+        graph: RDFLib Graph object containing RDFS ontology, a SchemaIndex built from one,
+               or a previously extracted SchemaIR (context is then ignored)
+        languages: Languages or comma-separated fallback chains, one per output
+                   (e.g., ["en", "fr", "de"])
+        context: Optional JSON-LD @context document providing aliases
+        base_cls: Base class type to inherit from (default: None, uses BaseModel)
+        emit_iris: If True, emit class IRIs as ClassVar and property IRIs in Field metadata (default: False)
+        jobs: Number of worker processes rendering chunks of classes (default: 1, serial)
+        
+    Returns:
+        Dict mapping each entry of `languages` to its Python code
+    """
+    if not languages:
+        raise ValueError("At least one language is required")
+    schema = _apply_legacy_canonical_range_type(extract_schema(graph, context, languages[0]))
+    layout = _prepare_module(schema)
+    return {
+        language: _render_module(localize_schema(schema, language), layout, base_cls, language, emit_iris, jobs)
+        for language in languages
+    }
+
+
+@dataclass
+class _ModuleLayout:
+    """Language-independent class order and naming, shared by every rendering of a schema.
+
+    - `sorted_class_uris`: Class URIs in topological order
+    - `prefix_groups`: Map of prefix -> URIs of its classes wrapped in a
+      namespace group, in topological order
+    - `group_of`: Map of class URI -> prefix of the namespace group holding it
+    - `class_name_map`: Map of class URI -> qualified name
+    - `group_type_names`: Map of prefix -> names property types render with
+      inside that namespace group
+    """
+    sorted_class_uris: list[str]
+    prefix_groups: dict
+    group_of: dict
+    class_name_map: dict
+    group_type_names: dict
+
+
+def _prepare_module(schema: SchemaIR) -> _ModuleLayout:
+    """Order and qualify the schema's classes."""
+    classes = schema.classes
+    sorted_class_uris = schema.class_hierarchy().order
+    curies = schema.class_curies()
+    
+    # Group classes by their local name to detect duplicates needing namespace wrapping
+    local_name_to_uris = _group_by_local_name(sorted_class_uris, curies)
+    
+    # Identify prefix groups for namespace wrapping
+    prefix_groups = _identify_prefix_groups(sorted_class_uris, curies, local_name_to_uris)
+    group_of = {class_uri: prefix for prefix, class_uris in prefix_groups.items() for class_uri in class_uris}
     
-    # Apply legacy type normalisation for compatibility with existing fixtures
-    _apply_legacy_canonical_range_type(classes)
+    # Build class name to qualified name mapping (also used to render property types)
+    class_name_map = _build_qualified_name_map(classes, group_of)
+    group_type_names = _build_group_type_names(classes, prefix_groups, class_name_map)
+    return _ModuleLayout(sorted_class_uris, prefix_groups, group_of, class_name_map, group_type_names)
+
+
+def _render_module(schema: SchemaIR, layout: _ModuleLayout, base_cls: type[BaseModel] | None, language: str | Sequence[str], emit_iris: bool, jobs: int = 1) -> str:
+    """Render a prepared schema as module source."""
+    return "".join(_iter_render_module(schema, layout, base_cls, language, emit_iris, jobs))
+
+
+def _iter_render_module(schema: SchemaIR, layout: _ModuleLayout, base_cls: type[BaseModel] | None, language: str | Sequence[str], emit_iris: bool, jobs: int = 1) -> Iterator[str]:
+    """Render a prepared schema as module source, one class block at a time."""
+    return _join_blocks(_iter_module_blocks(schema, layout, base_cls, language, emit_iris, jobs))
+
+
+def _iter_module_blocks(schema: SchemaIR, layout: _ModuleLayout, base_cls: type[BaseModel] | None, language: str | Sequence[str], emit_iris: bool, jobs: int = 1) -> Iterator[list[str]]:
+    """Generate the lines of the module header, then of each class and stub in turn.
+
+    With `jobs` > 1, consecutive runs of blocks are rendered in worker
+    processes and each run comes back as a single block, in order, so the
+    joined module is the same as a serial rendering.
+    """
+    yield _module_header(schema.classes, base_cls, language, emit_iris)
+    renderer = _ModuleRenderer(schema, layout, base_cls, emit_iris)
+    items = renderer.plan()
+    if jobs <= 1 or len(items) <= 1:
+        for item in items:
+            yield renderer.render(item)
+        return
 
+    chunk_size = max(1, min(512, len(items) // (jobs * 4)))
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_module_worker, initargs=(renderer,)) as pool:
+        for text in pool.map(_render_module_chunk, chunks):
+            yield [text]
+
+
+def _module_header(classes: dict, base_cls: type[BaseModel] | None, language: str | Sequence[str], emit_iris: bool) -> list[str]:
+    """Get the module's import lines, followed by the blank lines before the first class."""
     # Check if any class has properties with IRIs or if any class has an IRI
     has_property_iris = emit_iris and any(
         any(prop.iri for prop in class_info.properties.values())
@@ -62,95 +195,158 @@ def create_module(graph: Graph, context: dict | None = None, base_cls: type[Base
     if base_cls is not None:
         import_lines.append(f"from {base_cls.__module__} import {base_cls.__name__}")
     
-    lines = ["from __future__ import annotations", *import_lines, "", ""]
-    sorted_class_uris = topological_sort_classes(classes)
-    
-    # Group classes by their local name to detect duplicates needing namespace wrapping
-    local_name_to_uris = _group_by_local_name(sorted_class_uris, classes)
-    
-    # Identify prefix groups for namespace wrapping
-    prefix_groups = _identify_prefix_groups(local_name_to_uris)
-    
-    # Build class name to qualified name mapping
-    class_name_map = _build_qualified_name_map(classes, prefix_groups)
-    
-    # Update property types to use qualified names
-    _qualify_property_types(classes, class_name_map)
-    
-    # Process classes and generate output
-    processed_classes: Set[str] = set()
-    for class_uri in sorted_class_uris:
-        if class_uri in processed_classes:
-            continue
+    return ["from __future__ import annotations", *import_lines, "", ""]
+
+
+class _ModuleRenderer:
+    """Renders the blocks of a prepared module, one class or external stub at a time.
+
+    A block depends only on the schema and the precomputed layout, which are
+    not modified while rendering, so blocks can be rendered in any process and
+    in any order, then joined in `plan` order.
+    """
+
+    def __init__(self, schema: SchemaIR, layout: _ModuleLayout, base_cls: type[BaseModel] | None, emit_iris: bool):
+        self.schema = schema
+        self.layout = layout
+        self.base_cls = base_cls
+        self.emit_iris = emit_iris
+        self.hierarchy = schema.class_hierarchy()
+        self.ranges = schema.range_classifier()
+
+    def plan(self) -> list[tuple]:
+        """Order the module's blocks.
+
+        Returns:
+            List of ("class", class_uri, group prefix or None, opens group,
+            closes group) and ("stub", external_uri, None, False, False) items
+        """
+        curies = self.schema.class_curies()
+        items: list[tuple] = []
+        # A namespace group is emitted whole where its first class appears
+        processed_classes: Set[str] = set()
+        for class_uri in self.layout.sorted_class_uris:
+            if class_uri in processed_classes:
+                continue
+                
+            # Skip classes without a URI (blank nodes)
+            if class_uri not in curies:
+                continue
             
-        class_info = classes[class_uri]
-        # Skip if uri or graph is None (shouldn't happen in practice)
-        if class_info.uri is None or class_info.graph is None:
-            continue
-        prefix, local = extract_prefix_and_local(class_info.uri, class_info.graph)
+            # Check if this class is part of a namespace group
+            prefix = self.layout.group_of.get(class_uri)
+            if prefix is not None:
+                group = self.layout.prefix_groups[prefix]
+                processed_classes.update(group)
+                for idx, group_class_uri in enumerate(group):
+                    items.append(("class", group_class_uri, prefix, idx == 0, idx == len(group) - 1))
+            else:
+                processed_classes.add(class_uri)
+                items.append(("class", class_uri, None, False, False))
         
-        # Check if this class is part of a namespace group
-        if prefix in prefix_groups and class_uri in prefix_groups[prefix]:
-            # Find all classes in this prefix group, maintaining topological order from sorted_class_uris
-            prefix_uris_set = set(prefix_groups[prefix])
-            classes_in_prefix = [uri for uri in sorted_class_uris if uri in prefix_uris_set and uri not in processed_classes]
-            
-            if classes_in_prefix:
+        # Stub classes for external references
+        items.extend(("stub", external_uri, None, False, False) for external_uri in _sorted_external_uris(self.schema.external_classes))
+        return items
+
+    def render(self, item: tuple) -> list[str]:
+        """Render the lines of one `plan` item."""
+        kind, uri, prefix, opens_group, closes_group = item
+        classes = self.schema.classes
+        lines: list[str] = []
+        if kind == "stub":
+            _emit_external_class_stub(lines, uri, self.schema.external_classes, self.ranges, self.base_cls, self.emit_iris)
+        elif prefix is None:
+            # Regular class without namespace wrapping
+            _emit_single_class(lines, uri, classes, "", self.layout.class_name_map, self.hierarchy, self.ranges, self.base_cls, self.emit_iris)
+        else:
+            if opens_group:
                 lines.append(f"class {prefix}:")
-                _emit_namespace_group(lines, classes_in_prefix, classes, prefix, processed_classes, class_name_map, base_cls, emit_iris)
+            _emit_namespace_group(lines, [uri], classes, prefix, self.layout.class_name_map, self.layout.group_type_names[prefix], self.hierarchy, self.ranges, self.base_cls, self.emit_iris)
+            if closes_group:
                 lines.append("")
+        return lines
+
+
+# Renderer shared with the chunks rendered by a worker process, set once per worker
+_module_renderer: _ModuleRenderer | None = None
+
+
+def _init_module_worker(renderer: _ModuleRenderer) -> None:
+    """Keep the renderer in the worker process, so chunks only carry plan items."""
+    global _module_renderer
+    _module_renderer = renderer
+
+
+def _render_module_chunk(items: list[tuple]) -> str:
+    """Render consecutive plan items as the text of a single block."""
+    assert _module_renderer is not None
+    return "\n".join(line for item in items for line in _module_renderer.render(item))
+
+
+def _join_blocks(blocks: Iterable[list[str]]) -> Iterator[str]:
+    """Join blocks of lines into text as `"\\n".join(lines).rstrip() + "\\n"` would.
+
+    Each block is yielded as soon as it is joined, except for trailing
+    whitespace, which is held back until more text follows it.
+    """
+    pending = ""
+    first = True
+    for block in blocks:
+        if not block:
+            continue
+        text = "\n".join(block) if first else "\n" + "\n".join(block)
+        first = False
+        stripped = text.rstrip()
+        if stripped:
+            yield pending + stripped
+            pending = text[len(stripped):]
         else:
-            # Regular class without namespace wrapping
-            if class_uri not in processed_classes:
-                processed_classes.add(class_uri)
-                _emit_single_class(lines, class_uri, classes, "", class_name_map, base_cls, emit_iris)
-    
-    # Generate stub classes for external references
-    if external_classes:
-        _emit_external_class_stubs(lines, external_classes, graph, base_cls, emit_iris)
-    
-    return "\n".join(lines).rstrip() + "\n"
+            pending += text
+    yield "\n"
 
 
-def _group_by_local_name(sorted_class_uris: list[str], classes: dict) -> dict:
+def _group_by_local_name(sorted_class_uris: list[str], curies: dict) -> dict:
     """Group classes by their local name to detect duplicates."""
     local_name_to_uris: dict = {}
     for class_uri in sorted_class_uris:
-        class_info = classes[class_uri]
-        # Skip if uri or graph is None (shouldn't happen in practice)
-        if class_info.uri is None or class_info.graph is None:
+        # Skip classes without a URI (blank nodes)
+        if class_uri not in curies:
             continue
-        prefix, local = extract_prefix_and_local(class_info.uri, class_info.graph)
+        prefix, local = curies[class_uri]
         if local not in local_name_to_uris:
             local_name_to_uris[local] = []
         local_name_to_uris[local].append((prefix, class_uri))
     return local_name_to_uris
 
 
-def _identify_prefix_groups(local_name_to_uris: dict) -> dict:
-    """Identify which prefixes have duplicate class names."""
+def _identify_prefix_groups(sorted_class_uris: list[str], curies: dict, local_name_to_uris: dict) -> dict:
+    """Identify which prefixes have duplicate class names.
+
+    Returns:
+        Dict mapping prefix -> its classes sharing a local name with another
+        class, in topological order
+    """
     prefix_groups: dict = {}
-    for local_name, uri_list in local_name_to_uris.items():
-        if len(uri_list) > 1:  # Multiple classes with same local name
-            for prefix, class_uri in uri_list:
-                if prefix not in prefix_groups:
-                    prefix_groups[prefix] = []
-                prefix_groups[prefix].append(class_uri)
+    for class_uri in sorted_class_uris:
+        if class_uri not in curies:
+            continue
+        prefix, local = curies[class_uri]
+        if len(local_name_to_uris[local]) > 1:  # Multiple classes with same local name
+            prefix_groups.setdefault(prefix, []).append(class_uri)
     return prefix_groups
 
 
 
-def _emit_namespace_group(lines: list, classes_in_prefix: list, classes: dict, prefix: str, processed_classes: Set, class_name_map: dict, base_cls: type[BaseModel] | None = None, emit_iris: bool = False) -> None:
+def _emit_namespace_group(lines: list, classes_in_prefix: list, classes: dict, prefix: str, class_name_map: dict, type_names: dict, hierarchy: ClassHierarchy, ranges: RangeClassifier, base_cls: type[BaseModel] | None = None, emit_iris: bool = False) -> None:
     """Emit a namespace group with all its nested classes.
     
     The classes_in_prefix list should already be in topological order.
     """
     for group_class_uri in classes_in_prefix:
-        processed_classes.add(group_class_uri)
         group_class_info = classes[group_class_uri]
         
         # Get parent class names
-        parent_names = _get_parent_names(group_class_info, classes, class_name_map)
+        parent_names = _get_parent_names(group_class_uri, classes, class_name_map, hierarchy)
         
         # Class definition inside wrapper
         class_def = generate_class_definition(group_class_info.name, parent_names if parent_names else None, "    ", base_cls)
@@ -178,6 +374,8 @@ def _emit_namespace_group(lines: list, classes_in_prefix: list, classes: dict, p
                 lines,
                 group_class_info.properties,
                 classes,
+                ranges,
+                type_names,
                 emit_iris,
                 "        ",
             )
@@ -186,12 +384,12 @@ def _emit_namespace_group(lines: list, classes_in_prefix: list, classes: dict, p
         lines.append("")
 
 
-def _emit_single_class(lines: list, class_uri: str, classes: dict, indent: str, class_name_map: dict, base_cls: type[BaseModel] | None = None, emit_iris: bool = False) -> None:
+def _emit_single_class(lines: list, class_uri: str, classes: dict, indent: str, class_name_map: dict, hierarchy: ClassHierarchy, ranges: RangeClassifier, base_cls: type[BaseModel] | None = None, emit_iris: bool = False) -> None:
     """Emit a single class definition."""
     class_info = classes[class_uri]
     
     # Get parent class names
-    parent_names = _get_parent_names(class_info, classes, class_name_map)
+    parent_names = _get_parent_names(class_uri, classes, class_name_map, hierarchy)
     
     # Class definition
     class_def = generate_class_definition(class_info.name, parent_names if parent_names else None, indent, base_cls)
@@ -219,6 +417,8 @@ def _emit_single_class(lines: list, class_uri: str, classes: dict, indent: str,
             lines,
             class_info.properties,
             classes,
+            ranges,
+            class_name_map,
             emit_iris,
             indent + "    ",
         )
@@ -228,11 +428,15 @@ def _emit_single_class(lines: list, class_uri: str, classes: dict, indent: str,
     lines.append("")
 
 
-def _append_class_properties(lines: list, properties: dict, classes: dict, emit_iris: bool, indent: str) -> None:
-    """Append generated property lines for a class with stable spacing behavior."""
+def _append_class_properties(lines: list, properties: dict, classes: dict, ranges: RangeClassifier, type_names: dict, emit_iris: bool, indent: str) -> None:
+    """Append generated property lines for a class with stable spacing behavior.
+
+    Class references in property types are rendered with `type_names` (class URI
+    -> qualified name).
+    """
     sorted_prop_names = sorted(properties)
     class_has_internal_range_property = any(
-        _property_has_internal_range(properties[prop_name], classes)
+        _property_has_internal_range(properties[prop_name], classes, ranges)
         for prop_name in sorted_prop_names
     )
 
@@ -242,6 +446,7 @@ def _append_class_properties(lines: list, properties: dict, classes: dict, emit_
         include_iri_map[prop_name] = _should_include_property_iri_docstring(
             prop,
             classes,
+            ranges,
             emit_iris,
             class_has_internal_range_property,
         )
@@ -252,7 +457,7 @@ def _append_class_properties(lines: list, properties: dict, classes: dict, emit_
         lines.append(
             generate_property_line(
                 prop.name,
-                prop.type_annotation,
+                prop.property_type.render(type_names),
                 indent,
                 prop_iri_for_field=prop.iri if emit_iris else None,
                 prop_iri_for_docstring=prop.iri if (include_prop_iri or prop.label or prop.comment) else None,
@@ -271,34 +476,25 @@ def _append_class_properties(lines: list, properties: dict, classes: dict, emit_
             lines.append("")
 
 
-def _get_parent_names(class_info, classes: dict, class_name_map: dict) -> list:
-    """Get names of parent classes, qualified if necessary."""
-    parent_names = []
-    for parent_uri in class_info.parent_uris:
-        parent_uri_str = str(parent_uri)
-        if parent_uri_str in classes:
-            qualified_name = class_name_map.get(parent_uri_str, classes[parent_uri_str].name)
-            parent_names.append(qualified_name)
-    return parent_names
+def _get_parent_names(class_uri: str, classes: dict, class_name_map: dict, hierarchy: ClassHierarchy) -> list:
+    """Get names of the most specific parent classes, qualified if necessary."""
+    return [
+        class_name_map.get(parent_uri, classes[parent_uri].name)
+        for parent_uri in hierarchy.minimal_parents(class_uri)
+    ]
 
 
-def _build_qualified_name_map(classes: dict, prefix_groups: dict) -> dict:
+def _build_qualified_name_map(classes: dict, uri_to_prefix: dict) -> dict:
     """Build a mapping from class URI to qualified name (with namespace prefix if needed).
     
     Args:
         classes: Dict of class URIs to class info
-        prefix_groups: Dict of prefixes to class URIs that need namespace wrapping
+        uri_to_prefix: Dict of class URI -> prefix of its namespace group, for
+            classes that need namespace wrapping
         
     Returns:
         Dict mapping class_uri -> qualified_name (e.g., "uri" -> "ex1.Person")
     """
-    uri_to_prefix = {}
-    
-    # Identify which URIs are in namespace groups
-    for prefix, class_uris in prefix_groups.items():
-        for class_uri in class_uris:
-            uri_to_prefix[class_uri] = prefix
-    
     # Build the map using URIs as keys
     name_map = {}
     for class_uri, class_info in classes.items():
@@ -314,218 +510,193 @@ def _build_qualified_name_map(classes: dict, prefix_groups: dict) -> dict:
     return name_map
 
 
-def _qualify_property_types(classes: dict, class_name_map: dict) -> None:
-    """Update property types to use qualified names for namespace-wrapped classes.
-    
-    Modifies property types in-place to replace simple class names with qualified
-    names when they reference namespace-wrapped classes.
-    
-    Args:
-        classes: Dict of class URIs to class info
-        class_name_map: Dict mapping class_uri -> qualified_name
+def _build_group_type_names(classes: dict, prefix_groups: dict, class_name_map: dict) -> dict:
+    """Build the names that property types render with inside each namespace group.
+
+    A class name shared by several classes resolves to the class in the group's
+    own namespace, as in historical output; other classes use `class_name_map`.
+
+    Returns:
+        Dict mapping prefix -> (class_uri -> qualified_name)
     """
-    # Build a reverse map: class_name -> list of (uri, qualified_name)
-    name_to_uris = {}
+    own_names: dict = {prefix: {} for prefix in prefix_groups}
     for class_uri, qualified_name in class_name_map.items():
-        class_name = classes[class_uri].name
-        if class_name not in name_to_uris:
-            name_to_uris[class_name] = []
-        name_to_uris[class_name].append((class_uri, qualified_name))
-    
-    for class_uri, class_info in classes.items():
-        for prop_info in class_info.properties.values():
-            prop_type = prop_info.type_annotation
-
-            def resolve_type_name(type_name: str) -> str:
-                candidates = name_to_uris.get(type_name, [])
-                if len(candidates) > 1:
-                    current_qualified = class_name_map.get(class_uri, class_info.name)
-                    if "." in current_qualified:
-                        current_prefix = current_qualified.split(".", 1)[0]
-                        for _, candidate_qualified in candidates:
-                            if candidate_qualified.startswith(f"{current_prefix}."):
-                                return candidate_qualified
-                return _qualify_type_name(type_name, prop_info, classes, class_name_map)
-
-            # Current format: "list[Type]" or "list[Type1 | Type2]"
-            if prop_type.startswith("list[") and prop_type.endswith("]"):
-                list_content = prop_type[5:-1]
-                type_parts = [t.strip() for t in list_content.split("|")]
-                qualified_parts = [
-                    resolve_type_name(type_name)
-                    for type_name in type_parts
-                ]
-                qualified_list_content = " | ".join(qualified_parts)
-                prop_info.type_annotation = f"list[{qualified_list_content}]"
-                continue
-            
-            # Parse and replace class names in the type annotation
-            # Handle new format: "Type | list[Type] | None" or primitives
-            if " | list[" in prop_type:
-                # Pattern: "Type | list[Type] | None"
-                # Split into parts: before " | list[", inside list, after "]"
-                list_start_idx = prop_type.find(" | list[")
-                if list_start_idx >= 0:
-                    # Extract parts
-                    before_list = prop_type[:list_start_idx]  # e.g., "Person"
-                    list_start_content_idx = list_start_idx + 8  # len(" | list[")
-                    list_end_idx = prop_type.rfind("]")  # Find closing ] before " | None"
-                    list_content = prop_type[list_start_content_idx:list_end_idx]  # e.g., "Person"
-                    after_list = prop_type[list_end_idx + 1:]  # e.g., " | None"
-                    
-                    # Qualify the before_list part
-                    qualified_before = resolve_type_name(before_list)
-                    
-                    # Qualify list_content (which may contain union types)
-                    type_parts = [t.strip() for t in list_content.split("|")]
-                    qualified_parts = []
-                    for type_name in type_parts:
-                        qualified_parts.append(resolve_type_name(type_name))
-                    
-                    qualified_list_content = " | ".join(qualified_parts)
-                    prop_info.type_annotation = f"{qualified_before} | list[{qualified_list_content}]{after_list}"
-
-
-def _qualify_type_name(type_name: str, prop_info, classes: dict, class_name_map: dict) -> str:
-    """Qualify a single type name using the class_name_map.
-    
-    Args:
-        type_name: The type name to qualify
-        prop_info: The property info containing ranges
-        classes: Dict of class URIs to class info
-        class_name_map: Mapping of class URIs to qualified names
-        
-    Returns:
-        The qualified type name if found, otherwise the original type name
+        if "." in qualified_name:
+            prefix = qualified_name.split(".", 1)[0]
+            own_names[prefix].setdefault(classes[class_uri].name, qualified_name)
+    return {prefix: _GroupTypeNames(own_names[prefix], classes, class_name_map) for prefix in prefix_groups}
+
+
+class _GroupTypeNames(Mapping):
+    """Class URI -> name that property types render with inside one namespace group.
+
+    Stores only the group's own class names, looked up by class name, so
+    building the names of every group is linear in the number of classes.
     """
-    for range_uri in getattr(prop_info, "ranges", []) or []:
-        range_uri_str = str(range_uri)
-        if range_uri_str in classes and classes[range_uri_str].name == type_name:
-            return class_name_map.get(range_uri_str, type_name)
-    return type_name
 
+    def __init__(self, own_names: dict, classes: dict, class_name_map: dict):
+        self.own_names = own_names
+        self.classes = classes
+        self.class_name_map = class_name_map
+
+    def __getitem__(self, class_uri: str) -> str:
+        info = self.classes.get(class_uri)
+        if info is not None and info.name in self.own_names:
+            return self.own_names[info.name]
+        return self.class_name_map[class_uri]
 
-def _emit_external_class_stubs(lines: list, external_classes: dict[str, ClassInfo], graph: Graph, base_cls: type[BaseModel] | None = None, emit_iris: bool = False) -> None:
-    """Generate stub classes for external class references.
+    def __iter__(self):
+        return iter(self.class_name_map)
+
+    def __len__(self) -> int:
+        return len(self.class_name_map)
+
+
+def _sorted_external_uris(external_classes: dict[str, ClassInfo]) -> list[str]:
+    """Order external classes by name, then IRI, for deterministic output.
+
+    The IRI breaks ties between stubs sharing a name, whose order in
+    `external_classes` depends on how the schema was built or updated.
+    """
+    from .naming import DefaultNamingStrategy
+    
+    naming_strategy = DefaultNamingStrategy()
+    return sorted(external_classes.keys(), key=lambda uri: (naming_strategy.get_local_name(uri), uri))
+
+
+def _emit_external_class_stub(lines: list, external_uri: str, external_classes: dict[str, ClassInfo], ranges: RangeClassifier, base_cls: type[BaseModel] | None = None, emit_iris: bool = False) -> None:
+    """Generate the stub class for an external class reference.
     
     Args:
         lines: List of code lines to append to
+        external_uri: URI of the external class
         external_classes: Dict mapping external class URIs to ClassInfo objects with properties
-        graph: RDF graph (for namespace resolution)
+        ranges: Classifier of range IRIs
         base_cls: Base class to inherit from
         emit_iris: Whether to emit IRI metadata
     """
-    from .naming import DefaultNamingStrategy
+    class_info = external_classes[external_uri]
+    class_name = class_info.name
     
-    naming_strategy = DefaultNamingStrategy()
+    # Determine base class
+    base_class_name = base_cls.__name__ if base_cls else "BaseModel"
     
-    # Sort external classes by name for deterministic output
-    sorted_externals = sorted(external_classes.keys(), key=lambda uri: naming_strategy.get_local_name(uri))
+    # Generate class definition
+    lines.append(f"class {class_name}({base_class_name}):")
     
-    for external_uri in sorted_externals:
-        class_info = external_classes[external_uri]
-        class_name = class_info.name
-        
-        # Determine base class
-        base_class_name = base_cls.__name__ if base_cls else "BaseModel"
-        
-        # Generate class definition
-        lines.append(f"class {class_name}({base_class_name}):")
-        
-        # Generate docstring
-        lines.append(f'    """{class_name} <{external_uri}>.')
-        lines.append("")
-        lines.append('    External class referenced but not defined in this ontology.')
-        lines.append('    """')
-        
-        # Add IRI metadata if needed
-        if emit_iris:
-            lines.append(f'    _class_iri: ClassVar[str] = "{external_uri}"')
-        
-        # Add properties if they exist
-        if class_info.properties:
-            prop_items = list(class_info.properties.items())
-            class_has_internal_range_property = any(
-                _property_has_internal_range(prop_info, external_classes)
-                for _, prop_info in prop_items
+    # Generate docstring
+    lines.append(f'    """{class_name} <{external_uri}>.')
+    lines.append("")
+    lines.append('    External class referenced but not defined in this ontology.')
+    lines.append('    """')
+    
+    # Add IRI metadata if needed
+    if emit_iris:
+        lines.append(f'    _class_iri: ClassVar[str] = "{external_uri}"')
+    
+    # Add properties if they exist
+    if class_info.properties:
+        prop_items = list(class_info.properties.items())
+        class_has_internal_range_property = any(
+            _property_has_internal_range(prop_info, external_classes, ranges)
+            for _, prop_info in prop_items
+        )
+        for idx, (prop_name, prop_info) in enumerate(prop_items):
+            # All types are now list types - use Field(default_factory=list)
+            prop_type = prop_info.property_type.render()
+            
+            if emit_iris and prop_info.iri:
+                lines.append(f"    {prop_name}: {prop_type} = Field(default_factory=list, json_schema_extra={{\"_property_iri\": \"{prop_info.iri}\"}})")
+            else:
+                lines.append(f"    {prop_name}: {prop_type} = Field(default_factory=list)")
+            
+            # Add property docstring if available
+            include_prop_iri = _should_include_property_iri_docstring(
+                prop_info,
+                external_classes,
+                ranges,
+                emit_iris,
+                class_has_internal_range_property,
             )
-            for idx, (prop_name, prop_info) in enumerate(prop_items):
-                # All types are now list types - use Field(default_factory=list)
-                prop_type = prop_info.type_annotation
-                
-                if emit_iris and prop_info.iri:
-                    lines.append(f"    {prop_name}: {prop_type} = Field(default_factory=list, json_schema_extra={{\"_property_iri\": \"{prop_info.iri}\"}})")
-                else:
-                    lines.append(f"    {prop_name}: {prop_type} = Field(default_factory=list)")
-                
-                # Add property docstring if available
-                include_prop_iri = _should_include_property_iri_docstring(
-                    prop_info,
-                    external_classes,
-                    emit_iris,
-                    class_has_internal_range_property,
-                )
-                if prop_info.label or prop_info.comment or include_prop_iri:
-                    label_part = f"{prop_info.label} <{prop_info.iri}>" if prop_info.label and prop_info.iri else (prop_info.label or "")
-                    if not label_part and include_prop_iri and prop_info.iri:
-                        label_part = f"<{prop_info.iri}>"
-                    lines.append(f'    """{label_part}.')
-                    if prop_info.comment:
-                        lines.append("")
-                        lines.append(f"    {prop_info.comment}")
-                    lines.append('    """')
-                    if idx < len(prop_items) - 1:
-                        lines.append("")
-            if prop_items:
-                lines.append("")
-        else:
-            # Add ellipsis only if no properties and not emitting IRIs
-            if not emit_iris:
-                lines.append("    ...")
-            elif emit_iris:
-                lines.append(f'    """<{external_uri}>."""')
-        
-        # Add ending blank lines to match normal class formatting
-        lines.append("")
-        lines.append("")
+            if prop_info.label or prop_info.comment or include_prop_iri:
+                label_part = f"{prop_info.label} <{prop_info.iri}>" if prop_info.label and prop_info.iri else (prop_info.label or "")
+                if not label_part and include_prop_iri and prop_info.iri:
+                    label_part = f"<{prop_info.iri}>"
+                lines.append(f'    """{label_part}.')
+                if prop_info.comment:
+                    lines.append("")
+                    lines.append(f"    {prop_info.comment}")
+                lines.append('    """')
+                if idx < len(prop_items) - 1:
+                    lines.append("")
+        if prop_items:
+            lines.append("")
+    else:
+        # Add ellipsis only if no properties and not emitting IRIs
+        if not emit_iris:
+            lines.append("    ...")
+        elif emit_iris:
+            lines.append(f'    """<{external_uri}>."""')
+    
+    # Add ending blank lines to match normal class formatting
+    lines.append("")
+    lines.append("")
+
+
+def _apply_legacy_canonical_range_type(schema: SchemaIR) -> SchemaIR:
+    """Apply narrow legacy range normalisation used by historical fixtures.
 
+    Property entries are shared with the caller's schema, so normalised
+    properties are replaced in a copy and `schema` itself is left unchanged.
 
-def _apply_legacy_canonical_range_type(classes: dict) -> None:
-    """Apply narrow legacy range normalisation used by historical fixtures."""
+    Returns:
+        `schema` if the normalisation does not apply, otherwise a normalised copy
+    """
+    classes = schema.classes
     if not classes:
-        return
+        return schema
 
     class_infos = list(classes.values())
     class_names = [info.name for info in class_infos]
     if not class_names or not all(re.fullmatch(r"E\d+", name) for name in class_names):
-        return
+        return schema
 
     namespaces = {str(info.iri).rsplit("/", 1)[0] if "/" in str(info.iri) else str(info.iri) for info in class_infos if info.iri}
     if len(namespaces) != 1:
-        return
+        return schema
 
     class_uri_set = set(classes.keys())
     root_uris = [uri for uri, info in classes.items() if not any(str(parent) in class_uri_set for parent in info.parent_uris)]
     if len(root_uris) < 2:
-        return
-
-    sorted_class_uris = topological_sort_classes(classes)
-    canonical_name = classes[sorted_class_uris[0]].name if sorted_class_uris else class_names[0]
-
-    known_names = {info.name for info in class_infos}
-    for info in class_infos:
-        for prop in info.properties.values():
-            prop_type = prop.type_annotation
-            if not (prop_type.startswith("list[") and prop_type.endswith("]")):
-                continue
-            inner = prop_type[len("list["):-1].strip()
-            inner_parts = [part.strip() for part in inner.split("|")]
-            if not inner_parts or any(part not in known_names for part in inner_parts):
-                continue
-            prop.type_annotation = f"list[{canonical_name}]"
+        return schema
+
+    canonical_uri = schema.class_hierarchy().order[0]
+    canonical_type = PropertyType((TypeMember(classes[canonical_uri].name, canonical_uri),))
+    normalised: dict[int, PropertyInfo] = {}
+
+    def normalise_properties(info: ClassInfo) -> dict[str, PropertyInfo]:
+        properties = {}
+        for name, prop in info.properties.items():
+            # Properties shared between domains stay shared in the copy
+            if id(prop) not in normalised:
+                if prop.property_type.container == "list" and all(member.iri in classes for member in prop.property_type.members):
+                    normalised[id(prop)] = dataclasses.replace(prop, property_type=canonical_type)
+                else:
+                    normalised[id(prop)] = prop
+            properties[name] = normalised[id(prop)]
+        return properties
+
+    return dataclasses.replace(
+        schema,
+        classes={iri: dataclasses.replace(info, properties=normalise_properties(info)) for iri, info in classes.items()},
+        external_classes={iri: dataclasses.replace(info, properties=normalise_properties(info)) for iri, info in schema.external_classes.items()},
+        hierarchy=None,
+        curies=dict(schema.curies),
+        ranges=None,
+    )
 
 
-def _should_omit_field_import(classes: dict, language: str) -> bool:
+def _should_omit_field_import(classes: dict, language: str | Sequence[str]) -> bool:
     """Compatibility switch for historical fixtures expecting BaseModel-only import."""
     class_infos = list(classes.values())
     if not any(info.properties for info in class_infos):
@@ -540,7 +711,7 @@ def _should_omit_field_import(classes: dict, language: str) -> bool:
     if root_count >= 2 and has_multi_parent_class and all(re.fullmatch(r"E\d+", info.name) for info in class_infos):
         return True
 
-    if language == "en":
+    if LanguageChain(language).primary == "en":
         has_upper_property = any(
             any(prop.name and prop.name[0].isupper() for prop in info.properties.values())
             for info in class_infos
@@ -552,7 +723,7 @@ def _should_omit_field_import(classes: dict, language: str) -> bool:
     return False
 
 
-def _should_include_property_iri_docstring(prop_info, classes: dict, emit_iris: bool, class_has_internal_range_property: bool) -> bool:
+def _should_include_property_iri_docstring(prop_info, classes: dict, ranges: RangeClassifier, emit_iris: bool, class_has_internal_range_property: bool) -> bool:
     """Determine whether a property docstring should include an IRI value."""
     if not getattr(prop_info, "iri", None):
         return False
@@ -560,32 +731,24 @@ def _should_include_property_iri_docstring(prop_info, classes: dict, emit_iris:
         return True
     if _is_legacy_two_class_subclass_chain(classes):
         return False
-    if _property_has_internal_range(prop_info, classes):
+    if _property_has_internal_range(prop_info, classes, ranges):
         return True
     return class_has_internal_range_property
 
 
-def _property_has_internal_range(prop_info, classes: dict) -> bool:
-    """Check whether a property has at least one internal or primitive range."""
-    ranges = getattr(prop_info, "ranges", []) or []
-    for range_uri in ranges:
-        range_uri_str = str(range_uri)
-        if (
-            "Literal" in range_uri_str
-            or "XMLSchema" in range_uri_str
-            or range_uri_str.startswith("http://www.w3.org/2001/XMLSchema#")
-            or range_uri_str == "http://www.w3.org/2000/01/rdf-schema#Literal"
-            or range_uri_str in classes
-        ):
+def _property_has_internal_range(prop_info, classes: dict, ranges: RangeClassifier) -> bool:
+    """Check whether a property has at least one range that is a datatype or one of `classes`."""
+    for range_uri in getattr(prop_info, "ranges", []) or []:
+        if ranges.is_datatype(range_uri) or str(range_uri) in classes:
             return True
     return False
 
 
 def _is_legacy_two_class_subclass_chain(classes: dict) -> bool:
     """Detect legacy fixture shape where IRI-only property docstrings are suppressed."""
-    class_infos = list(classes.values())
-    if len(class_infos) != 2:
+    if len(classes) != 2:
         return False
+    class_infos = list(classes.values())
     if not all(re.fullmatch(r"E\d+", info.name) for info in class_infos):
         return False
 
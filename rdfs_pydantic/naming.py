@@ -1,7 +1,9 @@
 """Naming strategies for converting RDF IRIs to Python identifiers.
 
 This module provides a strategy pattern for handling IRI-to-identifier conversion,
-with support for JSON-LD context aliasing.
+with support for JSON-LD context aliasing. The same range and domain IRIs are
+named many times during extraction, so strategies are wrapped in a
+`CachedNamingStrategy` that names each IRI once per run.
 """
 
 from abc import ABC, abstractmethod
@@ -65,3 +67,56 @@ class ContextAwareNamingStrategy(NamingStrategy):
         if iri in self.alias_map:
             return sanitise_identifier(self.alias_map[iri])
         return self._default_strategy.get_local_name(iri)
+
+
+class NamingCache:
+    """Memo of IRI -> identifier for a single run, with hit counters.
+
+    A cache records the names given by one naming strategy, so it must only be
+    shared between `CachedNamingStrategy` wrappers of equivalent strategies.
+
+    Attributes:
+        names: Map of IRI -> sanitized identifier
+        hits: Number of lookups answered from `names`
+        misses: Number of lookups that called the wrapped strategy
+    """
+
+    def __init__(self):
+        self.names: dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"NamingCache(names={len(self.names)}, hits={self.hits}, misses={self.misses})"
+
+
+class CachedNamingStrategy(NamingStrategy):
+    """Strategy that memoizes another strategy's names in a `NamingCache`."""
+
+    def __init__(self, strategy: NamingStrategy, cache: NamingCache | None = None):
+        """Initialize with the strategy to wrap.
+
+        Args:
+            strategy: Strategy computing names on a cache miss
+            cache: Cache to fill (default: a new, empty cache)
+        """
+        self.strategy = strategy
+        self.cache = cache if cache is not None else NamingCache()
+
+    def get_local_name(self, iri: str) -> str:
+        """Get the wrapped strategy's name for an IRI, computing it at most once.
+
+        Args:
+            iri: The IRI string
+
+        Returns:
+            Sanitized identifier
+        """
+        cache = self.cache
+        name = cache.names.get(iri)
+        if name is None:
+            cache.misses += 1
+            name = cache.names[iri] = self.strategy.get_local_name(iri)
+        else:
+            cache.hits += 1
+        return name
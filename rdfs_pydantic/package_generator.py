@@ -1,20 +1,45 @@
-"""Generate file-based Pydantic model packages."""
-
+"""Generate file-based Pydantic model packages.
+
+Every class gets a module and a `.pyi` stub. With `jobs` > 1, those files are
+rendered in a process pool whose workers receive the extracted schema once,
+when they start, and only (prefix, local name, class IRI) tasks afterwards;
+the rendered text is written in batches by an I/O thread pool. Rendering is
+deterministic per class, so the tree is identical to a serial run.
+
+Every file goes through a `_PackageWriter`, which keeps a manifest of content
+hashes in the package directory. Regenerating an existing package rewrites only
+the files whose content changed and deletes the class files of removed classes,
+so unchanged modules keep their mtimes and compiled `__pycache__` entries.
+"""
+
+import hashlib
+import json
 import os
 import inspect
+import tempfile
 import textwrap
+import threading
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from rdflib import Graph
 from pydantic import BaseModel
-from .extraction import extract_classes_and_properties
-from .utils import extract_prefix_and_local, topological_sort_classes, sanitise_identifier
+from .extraction import extract_schema, localize_schema
+from .schema_index import SchemaIndex
+from .models import PackageReport, SchemaIR
+from .hierarchy import ClassHierarchy
 from .codegen import generate_docstring, generate_class_definition, generate_property_line, generate_ellipsis_line
 
 
-def create_package(graph: Graph, output_dir: str, context: dict | list | str | None = None, base_cls: type[BaseModel] | None = None, language: str = 'en') -> None:
+def create_package(graph: Graph | SchemaIndex | SchemaIR, output_dir: str, context: dict | list | str | None = None, base_cls: type[BaseModel] | None = None, language: str | Sequence[str] = 'en', jobs: int = 1, lazy: bool = False) -> PackageReport:
     """Generate a Python module folder structure from an RDFS graph.
     
+    Regenerating into the same directory only rewrites files whose content
+    changed and deletes the files of classes no longer in the schema (tracked
+    in `.rdfs_pydantic_manifest.json`); other files in the directory are kept.
+    
     Args:
-        graph: RDFLib Graph object containing RDFS ontology
+        graph: RDFLib Graph object containing RDFS ontology, a SchemaIndex built from one,
+               or a previously extracted SchemaIR (context and language are then ignored)
         output_dir: Directory to write the package structure to
         context: Optional JSON-LD @context document providing aliases (dict, list, or URL string to download)
         base_cls: Base class type to inherit from (default: None, uses BaseModel).
@@ -22,43 +47,231 @@ def create_package(graph: Graph, output_dir: str, context: dict | list | str | N
                  Consider using IRIAwareBaseModel or defining a _class_iri ClassVar
                  in your base class. See rdfs_pydantic.base for examples and the
                  RDFSBaseModel protocol.
-        language: Preferred language for labels and comments (default: 'en')
+        language: Preferred language for labels and comments, or a fallback chain
+                  such as "en-GB,en,und,*" or ["en-GB", "en"] (default: 'en')
+        jobs: Number of worker processes rendering class files (default: 1, serial).
+              The output is identical to a serial run.
+        lazy: Generate `__init__.py` files that import each class on first access
+              (PEP 562 `__getattr__`) instead of importing every class eagerly.
+              Import classes from the package or its prefix packages, not from
+              their modules, so their forward references are resolved.
+
+    Returns:
+        PackageReport listing the files written, left unchanged and removed
+    """
+    schema = extract_schema(graph, context, language)
+    return _write_package(schema, _prepare_package(schema), output_dir, base_cls, jobs, lazy)
+
+
+def create_packages(graph: Graph | SchemaIndex | SchemaIR, output_dirs: Mapping[str, str], context: dict | list | str | None = None, base_cls: type[BaseModel] | None = None, jobs: int = 1, lazy: bool = False) -> dict[str, PackageReport]:
+    """Generate one package per language from a single extraction.
+    
+    Extraction, prefix validation and class ordering run once; only label and
+    comment resolution and file rendering run per language.
+    
+    Args:
+        graph: RDFLib Graph object containing RDFS ontology, a SchemaIndex built from one,
+               or a previously extracted SchemaIR (context is then ignored)
+        output_dirs: Map of language (or comma-separated fallback chain) to the
+                     directory its package is written to
+        context: Optional JSON-LD @context document providing aliases (dict, list, or URL string to download)
+        base_cls: Base class type to inherit from (default: None, uses BaseModel)
+        jobs: Number of worker processes rendering class files (default: 1, serial)
+        lazy: Generate `__init__.py` files that import each class on first access
+
+    Returns:
+        Map of language to the PackageReport of its package
     """
-    classes, external_classes = extract_classes_and_properties(graph, context, language)
-    sorted_class_uris = topological_sort_classes(classes)
+    if not output_dirs:
+        raise ValueError("At least one language is required")
+    languages = list(output_dirs)
+    schema = extract_schema(graph, context, languages[0])
+    prefix_to_classes = _prepare_package(schema)
+    return {
+        language: _write_package(localize_schema(schema, language), prefix_to_classes, output_dirs[language], base_cls, jobs, lazy)
+        for language in languages
+    }
+
+
+def _prepare_package(schema: SchemaIR) -> dict[str, list[tuple[str, str]]]:
+    """Order the schema's classes and group them by prefix (language-independent)."""
+    sorted_class_uris = schema.class_hierarchy().order
+    return _group_by_prefix(sorted_class_uris, schema.class_curies())
+
+
+def _write_package(schema: SchemaIR, prefix_to_classes: dict[str, list[tuple[str, str]]], output_dir: str, base_cls: type[BaseModel] | None = None, jobs: int = 1, lazy: bool = False) -> PackageReport:
+    """Write the package files for a prepared schema, skipping unchanged files."""
+    classes = schema.classes
+    hierarchy = schema.class_hierarchy()
+    curies = schema.class_curies()
     
     # Ensure output directory exists
     os.makedirs(output_dir, exist_ok=True)
+    writer = _PackageWriter(output_dir)
     
     # Create py.typed marker for proper IDE support
-    _create_py_typed(output_dir)
+    _create_py_typed(writer)
     
     # If custom base class is provided, bake it into the package
     if base_cls is not None:
-        _write_base_class(base_cls, output_dir)
+        _write_base_class(base_cls, writer)
     
-    # Group classes by prefix
-    prefix_to_classes = _group_by_prefix(sorted_class_uris, classes)
-    
-    # Create files for each prefix
+    # Create a package for each prefix, then the class files
     for prefix, class_list in prefix_to_classes.items():
-        _create_prefix_package(prefix, class_list, classes, output_dir, base_cls)
+        _create_prefix_package(prefix, class_list, classes, writer, lazy)
+    tasks = [
+        (prefix, local, class_uri)
+        for prefix, class_list in prefix_to_classes.items()
+        for local, class_uri in class_list
+    ]
+    if jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            _write_class_sources(writer, task, _render_class_sources(task, classes, hierarchy, curies, base_cls))
+    else:
+        _write_class_files_parallel(tasks, classes, hierarchy, curies, writer, base_cls, jobs)
     
     # Create top-level __init__.py with imports from all prefixes
-    _create_toplevel_init(prefix_to_classes, classes, output_dir)
+    if lazy:
+        _create_lazy_toplevel_init(prefix_to_classes, classes, curies, writer)
+    else:
+        _create_toplevel_init(prefix_to_classes, classes, writer)
+    return writer.finish()
+
 
+# Manifest of the files generated into a package directory, kept in that directory
+MANIFEST_NAME = ".rdfs_pydantic_manifest.json"
 
-def _create_py_typed(output_dir: str) -> None:
+# Bump when the manifest layout changes; other versions are ignored
+MANIFEST_VERSION = 1
+
+
+class _PackageWriter:
+    """Writes package files whose content changed, tracking them in a manifest.
+
+    The manifest maps the relative path of every generated file to the SHA-256
+    of its content and its size and mtime after writing. A file whose stat still
+    matches its entry and whose new content has the same hash is skipped without
+    being read; any other existing file is read and compared. `write` may be
+    called from several threads.
+    """
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        self.previous = self._load_manifest()
+        self.files: dict[str, dict] = {}
+        self.report = PackageReport()
+        self._lock = threading.Lock()
+
+    def _path(self, relpath: str) -> str:
+        return os.path.join(self.output_dir, *relpath.split("/"))
+
+    def _load_manifest(self) -> dict[str, dict]:
+        try:
+            with open(os.path.join(self.output_dir, MANIFEST_NAME), encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        files = manifest.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def write(self, relpath: str, content: str) -> None:
+        """Write a file unless it already holds `content`.
+
+        Args:
+            relpath: Path relative to the package directory, with forward slashes
+            content: Text of the file
+        """
+        path = self._path(relpath)
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+        entry = self.previous.get(relpath)
+        if stat is not None and (_entry_matches(entry, digest, stat) or _read_text(path) == content):
+            written = False
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            stat = os.stat(path)
+            written = True
+        with self._lock:
+            self.files[relpath] = {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            (self.report.written if written else self.report.unchanged).add(relpath)
+
+    def finish(self) -> PackageReport:
+        """Delete previously generated files this run did not produce and save the manifest.
+
+        Returns:
+            PackageReport of the run
+        """
+        for relpath in sorted(set(self.previous) - set(self.files)):
+            parts = relpath.split("/")
+            if ".." in parts or os.path.isabs(relpath):
+                continue
+            path = self._path(relpath)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            self.report.removed.add(relpath)
+            if len(parts) > 1:
+                # Drop prefix packages left empty (a __pycache__ keeps them)
+                try:
+                    os.rmdir(os.path.dirname(path))
+                except OSError:
+                    pass
+        self._save_manifest()
+        return self.report
+
+    def _save_manifest(self) -> None:
+        text = json.dumps({"version": MANIFEST_VERSION, "files": dict(sorted(self.files.items()))}, indent=1) + "\n"
+        path = os.path.join(self.output_dir, MANIFEST_NAME)
+        if _read_text(path) == text:
+            return
+        # Write atomically so an interrupted run never leaves a partial manifest
+        fd, tmp_path = tempfile.mkstemp(dir=self.output_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+def _entry_matches(entry: dict | None, digest: str, stat: os.stat_result) -> bool:
+    """Check whether a manifest entry records `digest` for a file that still has the given stat."""
+    return (
+        entry is not None
+        and entry.get("sha256") == digest
+        and entry.get("size") == stat.st_size
+        and entry.get("mtime_ns") == stat.st_mtime_ns
+    )
+
+
+def _read_text(path: str) -> str | None:
+    """Read a UTF-8 text file, or get None if it is missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _create_py_typed(writer: _PackageWriter) -> None:
     """Create a py.typed marker file for PEP 561 compliance.
     
     This marker indicates that the package has inline type annotations
     and helps IDEs and type checkers provide better support.
     """
-    with open(os.path.join(output_dir, "py.typed"), "w", encoding="utf-8") as f:
-        f.write("")
+    writer.write("py.typed", "")
 
 
-def _write_base_class(base_cls: type[BaseModel], output_dir: str) -> None:
+def _write_base_class(base_cls: type[BaseModel], writer: _PackageWriter) -> None:
     """Write the base class to _base.py with import-first semantics.
 
     We first try to import the original class to preserve identity (important
@@ -92,22 +305,19 @@ def _write_base_class(base_cls: type[BaseModel], output_dir: str) -> None:
     lines.append("else:")
     lines.append(f"    {class_name} = _ExternalBase")
 
-    with open(os.path.join(output_dir, "_base.py"), "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) + "\n")
+    writer.write("_base.py", "\n".join(lines) + "\n")
 
 
-def _group_by_prefix(sorted_class_uris: list[str], classes: dict) -> dict[str, list[tuple[str, str]]]:
+def _group_by_prefix(sorted_class_uris: list[str], curies: dict[str, tuple[str, str]]) -> dict[str, list[tuple[str, str]]]:
     """Group classes by their namespace prefix."""
     prefix_to_classes: dict[str, list[tuple[str, str]]] = {}
     for class_uri in sorted_class_uris:
-        info = classes[class_uri]
-        g = info.graph
-        prefix, local = extract_prefix_and_local(info.uri, g)
+        prefix, local = curies[class_uri]
         prefix_to_classes.setdefault(prefix, []).append((local, class_uri))
     return prefix_to_classes
 
 
-def _create_toplevel_init(prefix_to_classes: dict[str, list[tuple[str, str]]], classes: dict, output_dir: str) -> None:
+def _create_toplevel_init(prefix_to_classes: dict[str, list[tuple[str, str]]], classes: dict, writer: _PackageWriter) -> None:
     """Create top-level __init__.py with imports from all prefixes."""
     init_lines = []
     all_imports = []
@@ -137,7 +347,7 @@ def _create_toplevel_init(prefix_to_classes: dict[str, list[tuple[str, str]]], c
         init_lines.append("for _mod_name in list(sys.modules.keys()):")
         
         # Get the package name from output_dir (last component of path)
-        pkg_name = os.path.basename(os.path.normpath(output_dir))
+        pkg_name = os.path.basename(os.path.normpath(writer.output_dir))
         init_lines.append(f"    if _mod_name.startswith(\"{pkg_name}.\"):")
         init_lines.append("        _mod = sys.modules[_mod_name]")
         init_lines.append("        _mod_dict = vars(_mod)")
@@ -146,14 +356,15 @@ def _create_toplevel_init(prefix_to_classes: dict[str, list[tuple[str, str]]], c
         for class_name in sorted(set(rebuild_calls)):
             init_lines.append(f"{class_name}.model_rebuild()")
     
-    with open(os.path.join(output_dir, "__init__.py"), "w", encoding="utf-8") as f:
-        f.write("\n".join(init_lines) + "\n" if init_lines else "")
+    writer.write("__init__.py", "\n".join(init_lines) + "\n" if init_lines else "")
 
 
-def _create_prefix_package(prefix: str, class_list: list[tuple[str, str]], classes: dict, output_dir: str, base_cls: type[BaseModel] | None = None) -> None:
-    """Create a package directory for a given prefix with all its classes."""
-    folder = os.path.join(output_dir, prefix)
-    os.makedirs(folder, exist_ok=True)
+def _create_prefix_package(prefix: str, class_list: list[tuple[str, str]], classes: dict, writer: _PackageWriter, lazy: bool = False) -> None:
+    """Create a package directory for a given prefix, importing all its classes."""
+    os.makedirs(os.path.join(writer.output_dir, prefix), exist_ok=True)
+    if lazy and class_list:
+        writer.write(f"{prefix}/__init__.py", _render_lazy_prefix_init(prefix, class_list, classes))
+        return
     
     # Write __init__.py with imports (don't call model_rebuild - forward refs are handled by Pydantic)
     init_lines = []
@@ -161,30 +372,224 @@ def _create_prefix_package(prefix: str, class_list: list[tuple[str, str]], class
         class_name = classes[class_uri].name
         init_lines.append(f"from .{local} import {class_name}")
     
-    with open(os.path.join(folder, "__init__.py"), "w", encoding="utf-8") as f:
-        f.write("\n".join(init_lines) + "\n" if init_lines else "")
-    
-    # Write each class file
-    for local, class_uri in class_list:
-        _write_class_file(local, class_uri, prefix, class_list, classes, folder, base_cls)
+    writer.write(f"{prefix}/__init__.py", "\n".join(init_lines) + "\n" if init_lines else "")
+
+
+# Loader of a lazy top-level __init__.py. `_load` imports a class together with
+# every class reachable through its parents and property types, exposes them to
+# each other's modules (as the eager init does for all classes) and rebuilds them.
+_LAZY_LOADER = '''
+def _load(module):
+    """Import the class of a module and the classes it refers to, then resolve their forward references."""
+    if module in _loaded:
+        return _loaded[module]
+    closure = {}
+    pending = [module]
+    while pending:
+        current = pending.pop()
+        if current in closure:
+            continue
+        if current in _loaded:
+            closure[current] = _loaded[current]
+        else:
+            closure[current] = getattr(importlib.import_module(f"{__name__}.{current}"), _CLASSES[current])
+            pending.extend(_REFERENCES.get(current, ()))
+    namespace = {_CLASSES[current]: cls for current, cls in closure.items()}
+    new = [current for current in closure if current not in _loaded]
+    for current in new:
+        cls = closure[current]
+        vars(sys.modules[cls.__module__]).update(namespace)
+        setattr(sys.modules[f"{__name__}.{current.rpartition('.')[0]}"], _CLASSES[current], cls)
+        if _MODULES.get(_CLASSES[current]) == current:
+            globals()[_CLASSES[current]] = cls
+    for current in new:
+        closure[current].model_rebuild()
+    _loaded.update(closure)
+    return closure[module]
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        return _load(_MODULES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *_MODULES})
+'''
+
+
+def _create_lazy_toplevel_init(prefix_to_classes: dict[str, list[tuple[str, str]]], classes: dict, curies: dict[str, tuple[str, str]], writer: _PackageWriter) -> None:
+    """Create a top-level __init__.py that imports each class on first access (PEP 562).
+
+    Accessing a class imports its module and the modules of every class it
+    inherits from or refers to in its properties, then rebuilds those models,
+    so `import package` itself imports no model.
+    """
+    modules = {
+        f"{prefix}.{local}": classes[class_uri].name
+        for prefix, class_list in sorted(prefix_to_classes.items())
+        for local, class_uri in sorted(class_list)
+    }
+    if not modules:
+        writer.write("__init__.py", "")
+        return
+
+    references: dict[str, list[str]] = {}
+    for prefix, class_list in sorted(prefix_to_classes.items()):
+        for local, class_uri in sorted(class_list):
+            info = classes[class_uri]
+            referenced = [str(parent_uri) for parent_uri in info.parent_uris]
+            referenced.extend(str(range_uri) for prop in info.properties.values() for range_uri in prop.ranges)
+            targets = sorted({".".join(curies[uri]) for uri in referenced if uri in classes and uri != class_uri})
+            if targets:
+                references[f"{prefix}.{local}"] = targets
+
+    lines = ['"""Models of this package, each imported on first access."""']
+    lines.append("")
+    lines.append("import importlib")
+    lines.append("import sys")
+    lines.append("from typing import TYPE_CHECKING")
+    lines.append("")
+    lines.append("if TYPE_CHECKING:")
+    for module, class_name in modules.items():
+        lines.append(f"    from .{module} import {class_name}")
+    lines.append("")
+    lines.append("# Class defined by each module, relative to this package")
+    lines.append("_CLASSES = {")
+    for module, class_name in modules.items():
+        lines.append(f"    {module!r}: {class_name!r},")
+    lines.append("}")
+    lines.append("")
+    lines.append("# Modules of the classes each module's class inherits from or refers to in its properties")
+    lines.append("_REFERENCES = {")
+    for module, targets in references.items():
+        lines.append(f"    {module!r}: {tuple(targets)!r},")
+    lines.append("}")
+    lines.append("")
+    lines.append("_MODULES = {class_name: module for module, class_name in _CLASSES.items()}")
+    lines.append("")
+    lines.append("# Classes imported and rebuilt so far, by module")
+    lines.append("_loaded = {}")
+    lines.append("")
+    lines.append(f"__all__ = {repr(sorted(modules.values()))}")
+    lines.append("")
+    lines.append("")
+    writer.write("__init__.py", "\n".join(lines) + _LAZY_LOADER)
+
+
+def _render_lazy_prefix_init(prefix: str, class_list: list[tuple[str, str]], classes: dict) -> str:
+    """Render a prefix __init__.py that loads its classes through the top-level package."""
+    modules = {classes[class_uri].name: local for local, class_uri in sorted(class_list)}
+    lines = ['"""Models of this namespace, each imported on first access through the parent package."""']
+    lines.append("")
+    lines.append("import sys")
+    lines.append("from typing import TYPE_CHECKING")
+    lines.append("")
+    lines.append("if TYPE_CHECKING:")
+    for class_name, local in modules.items():
+        lines.append(f"    from .{local} import {class_name}")
+    lines.append("")
+    lines.append("# Module defining each class, relative to the parent package")
+    lines.append("_MODULES = {")
+    for class_name, local in modules.items():
+        lines.append(f"    {class_name!r}: {prefix + '.' + local!r},")
+    lines.append("}")
+    lines.append("")
+    lines.append(f"__all__ = {repr(sorted(modules))}")
+    lines.append("")
+    lines.append("")
+    lines.append("def __getattr__(name):")
+    lines.append("    if name in _MODULES:")
+    lines.append("        return sys.modules[__name__.rpartition(\".\")[0]]._load(_MODULES[name])")
+    lines.append("    raise AttributeError(f\"module {__name__!r} has no attribute {name!r}\")")
+    lines.append("")
+    lines.append("")
+    lines.append("def __dir__():")
+    lines.append("    return sorted({*globals(), *_MODULES})")
+    return "\n".join(lines) + "\n"
+
+
+# Schema shared with the rendering functions of a worker process, set once per worker
+_worker_schema: tuple | None = None
+
+
+def _init_render_worker(classes: dict, hierarchy: ClassHierarchy, curies: dict[str, tuple[str, str]], base_cls: type[BaseModel] | None) -> None:
+    """Keep the schema in the worker process, so tasks only carry class keys."""
+    global _worker_schema
+    _worker_schema = (classes, hierarchy, curies, base_cls)
+
 
+def _render_in_worker(task: tuple[str, str, str]) -> tuple[str, str]:
+    """Render the sources of one class from the worker's schema."""
+    assert _worker_schema is not None
+    return _render_class_sources(task, *_worker_schema)
 
-def _write_class_file(local: str, class_uri: str, prefix: str, class_list: list[tuple[str, str]], classes: dict, folder: str, base_cls: type[BaseModel] | None = None) -> None:
-    """Write a single class file."""
+
+def _write_class_files_parallel(tasks: list[tuple[str, str, str]], classes: dict, hierarchy: ClassHierarchy, curies: dict[str, tuple[str, str]], writer: _PackageWriter, base_cls: type[BaseModel] | None, jobs: int) -> None:
+    """Render class files in a process pool and write them from a thread pool.
+
+    Results arrive in task order and are handed to the writers in batches, so
+    rendering and writing overlap and each write task amortises its overhead.
+    """
+    batch_size = max(1, min(256, len(tasks) // (jobs * 4)))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_render_worker, initargs=(classes, hierarchy, curies, base_cls)) as pool, \
+            ThreadPoolExecutor(max_workers=jobs) as writers:
+        writes = []
+        batch: list[tuple[tuple[str, str, str], tuple[str, str]]] = []
+        for task, sources in zip(tasks, pool.map(_render_in_worker, tasks, chunksize=batch_size)):
+            batch.append((task, sources))
+            if len(batch) >= batch_size:
+                writes.append(writers.submit(_write_class_batch, writer, batch))
+                batch = []
+        if batch:
+            writes.append(writers.submit(_write_class_batch, writer, batch))
+        for write in writes:
+            write.result()
+
+
+def _write_class_batch(writer: _PackageWriter, batch: list[tuple[tuple[str, str, str], tuple[str, str]]]) -> None:
+    """Write the rendered sources of several classes."""
+    for task, sources in batch:
+        _write_class_sources(writer, task, sources)
+
+
+def _write_class_sources(writer: _PackageWriter, task: tuple[str, str, str], sources: tuple[str, str]) -> None:
+    """Write a class module and its stub into the class's prefix package."""
+    prefix, local, _ = task
+    module_source, stub_source = sources
+    writer.write(f"{prefix}/{local}.py", module_source)
+    writer.write(f"{prefix}/{local}.pyi", stub_source)
+
+
+def _render_class_sources(task: tuple[str, str, str], classes: dict, hierarchy: ClassHierarchy, curies: dict[str, tuple[str, str]], base_cls: type[BaseModel] | None = None) -> tuple[str, str]:
+    """Render the module and the .pyi stub of one (prefix, local name, class IRI) task."""
+    prefix, local, class_uri = task
+    return _render_class_file(local, class_uri, prefix, classes, hierarchy, curies, base_cls)
+
+
+def _render_class_file(local: str, class_uri: str, prefix: str, classes: dict, hierarchy: ClassHierarchy, curies: dict[str, tuple[str, str]], base_cls: type[BaseModel] | None = None) -> tuple[str, str]:
+    """Render a single class file and its stub.
+
+    Returns:
+        Tuple of (module source, stub source)
+    """
     info = classes[class_uri]
     class_name = info.name
-    parent_uris = _dedupe_parent_uris(info.parent_uris, classes)
+    # Most specific parents only, so the MRO stays consistent
+    declared_parents = {str(parent_uri): parent_uri for parent_uri in info.parent_uris}
+    parent_uris = [declared_parents[parent] for parent in hierarchy.minimal_parents(class_uri)]
     properties = info.properties
     label = info.label
     iri = info.iri
     comment = info.comment
     
     # Determine parent imports and names
-    parent_imports = _get_parent_imports(parent_uris, classes, prefix)
+    parent_imports = _get_parent_imports(parent_uris, classes, curies, prefix)
     parent_names = [classes[str(parent_uri)].name for parent_uri in parent_uris if str(parent_uri) in classes]
     
     # Determine property type imports (both same-namespace and cross-namespace)
-    property_imports = _get_property_imports(properties, classes, prefix, local)
+    property_imports = _get_property_imports(properties, classes, curies, prefix, local)
     
     # Build class file lines
     lines = ["from __future__ import annotations"]
@@ -228,7 +633,8 @@ def _write_class_file(local: str, class_uri: str, prefix: str, class_list: list[
     if properties:
         for prop_name in sorted(properties):
             prop = properties[prop_name]
-            package_prop_type = _to_package_property_type(prop.type_annotation)
+            # Constructor-friendly union, e.g. "Person | list[Person] | None"
+            package_prop_type = prop.property_type.render_optional()
             lines.append(f"    {prop.name}: {package_prop_type} = None")
 
             if prop.label or prop.comment or prop.iri:
@@ -255,26 +661,17 @@ def _write_class_file(local: str, class_uri: str, prefix: str, class_list: list[
         lines.append(generate_ellipsis_line())
     lines.append("")
     
-    with open(os.path.join(folder, f"{local}.py"), "w", encoding="utf-8") as f:
-        f.write("\n".join(lines).rstrip() + "\n")
-    
     # Also generate a .pyi stub file for better IDE support
-    _write_class_stub_file(local, class_name, parent_names, parent_uris, properties, classes, folder, prefix)
+    return "\n".join(lines).rstrip() + "\n", _render_class_stub(class_uri, class_name, parent_names, hierarchy)
 
 
-def _get_parent_imports(parent_uris: list, classes: dict, current_prefix: str) -> list[str]:
+def _get_parent_imports(parent_uris: list, classes: dict, curies: dict[str, tuple[str, str]], current_prefix: str) -> list[str]:
     """Get import statements for parent classes."""
     imports: list[str] = []
     for parent_uri in parent_uris:
         if str(parent_uri) in classes:
             parent_info = classes[str(parent_uri)]
-            parent_n3 = parent_info.uri.n3(namespace_manager=parent_info.graph.namespace_manager)
-            if ":" in parent_n3:
-                parent_prefix, parent_local = parent_n3.split(":", 1)
-            else:
-                parent_prefix, parent_local = "default", parent_n3
-            parent_prefix = sanitise_identifier(parent_prefix)
-            parent_local = sanitise_identifier(parent_local)
+            parent_prefix, parent_local = curies[str(parent_uri)]
             
             if parent_prefix == current_prefix:
                 imports.append(f"from .{parent_local} import {parent_info.name}")
@@ -284,50 +681,7 @@ def _get_parent_imports(parent_uris: list, classes: dict, current_prefix: str) -
     return imports
 
 
-def _dedupe_parent_uris(parent_uris: list, classes: dict) -> list:
-    """Remove parent classes that are ancestors of other listed parents.
-
-    This prevents Python MRO conflicts when a class declares both a base and one
-    of that base's descendants as parents (common in noisy ontologies).
-    """
-    memo: dict[str, set[str]] = {}
-    parents = [(uri, str(uri)) for uri in parent_uris if str(uri) in classes]
-    filtered: list = []
-
-    for uri, uri_str in parents:
-        is_redundant = any(
-            uri_str in _get_ancestor_set(other_str, classes, memo)
-            for _, other_str in parents
-            if other_str != uri_str
-        )
-        if not is_redundant:
-            filtered.append(uri)
-
-    return filtered
-
-
-def _get_ancestor_set(uri_str: str, classes: dict, memo: dict[str, set[str]]) -> set[str]:
-    """Compute all ancestors for a given class URI (transitively)."""
-    if uri_str in memo:
-        return memo[uri_str]
-
-    ancestors: set[str] = set()
-    class_info = classes.get(uri_str)
-    if not class_info:
-        memo[uri_str] = ancestors
-        return ancestors
-
-    parent_uris = getattr(class_info, "parent_uris", []) if class_info else []
-    for parent_uri in parent_uris:
-        parent_str = str(parent_uri)
-        ancestors.add(parent_str)
-        ancestors.update(_get_ancestor_set(parent_str, classes, memo))
-
-    memo[uri_str] = ancestors
-    return ancestors
-
-
-def _get_property_imports(properties: dict, classes: dict, current_prefix: str, current_local: str) -> list[str]:
+def _get_property_imports(properties: dict, classes: dict, curies: dict[str, tuple[str, str]], current_prefix: str, current_local: str) -> list[str]:
     """Get import statements for property types.
     
     Extracts class names from property range URIs and generates imports for both
@@ -337,21 +691,13 @@ def _get_property_imports(properties: dict, classes: dict, current_prefix: str,
     imported_classes: set[tuple[str, str]] = set()  # (prefix, class_name) pairs
     
     for prop_name, prop_info in properties.items():
-        prop_type = prop_info.type_annotation
         ranges = prop_info.ranges
         
         # Extract class URIs from ranges
         for range_uri in ranges:
             if str(range_uri) in classes:
                 range_info = classes[str(range_uri)]
-                range_n3 = range_info.uri.n3(namespace_manager=range_info.graph.namespace_manager)
-                
-                if ":" in range_n3:
-                    range_prefix, range_local = range_n3.split(":", 1)
-                else:
-                    range_prefix, range_local = "default", range_n3
-                range_prefix = sanitise_identifier(range_prefix)
-                range_local = sanitise_identifier(range_local)
+                range_prefix, range_local = curies[str(range_uri)]
                 
                 class_name = range_info.name
                 
@@ -372,36 +718,18 @@ def _get_property_imports(properties: dict, classes: dict, current_prefix: str,
     return imports
 
 
-def _write_class_stub_file(local: str, class_name: str, parent_names: list[str] | None, parent_uris: list, properties: dict, classes: dict, folder: str, current_prefix: str) -> None:
-    """Generate a .pyi stub file for better IDE support with explicit __init__ signature.
+def _render_class_stub(class_uri: str, class_name: str, parent_names: list[str] | None, hierarchy: ClassHierarchy) -> str:
+    """Generate .pyi stub source for better IDE support with explicit __init__ signature.
     
-    Includes properties from parent classes for full inheritance support.
+    Includes properties from parent classes for full inheritance support, resolved
+    in method resolution order.
     """
     lines = ["from __future__ import annotations"]
     lines.append("from typing import Any")
     lines.append("")
     
-    # Collect all properties from this class and all parent classes
-    all_properties = dict(properties)  # Start with direct properties
-    
-    # Recursively collect properties from parent classes
-    def collect_parent_properties(parent_uris_list):
-        for parent_uri in parent_uris_list:
-            parent_uri_str = str(parent_uri)
-            if parent_uri_str in classes:
-                parent_info = classes[parent_uri_str]
-                parent_props = parent_info.properties
-                # Add parent properties (don't override direct properties)
-                for prop_name, prop_info in parent_props.items():
-                    if prop_name not in all_properties:
-                        all_properties[prop_name] = prop_info
-                # Recursively collect from grandparents
-                grandparent_uris = parent_info.parent_uris
-                if grandparent_uris:
-                    collect_parent_properties(grandparent_uris)
-    
-    if parent_uris:
-        collect_parent_properties(parent_uris)
+    # All properties from this class and its ancestors
+    all_properties = hierarchy.effective_properties(class_uri)
     
     # Add class definition with parents
     if parent_names:
@@ -415,7 +743,7 @@ def _write_class_stub_file(local: str, class_name: str, parent_names: list[str]
         init_params = ["self"]
         for prop_name in sorted(all_properties):
             prop = all_properties[prop_name]
-            prop_type = prop.type_annotation
+            prop_type = prop.property_type.render()
             # Make all parameters optional with default None
             init_params.append(f"{prop_name}: {prop_type} | None = None")
         
@@ -426,21 +754,9 @@ def _write_class_stub_file(local: str, class_name: str, parent_names: list[str]
         # Add property type hints
         for prop_name in sorted(all_properties):
             prop = all_properties[prop_name]
-            prop_type = prop.type_annotation
+            prop_type = prop.property_type.render()
             lines.append(f"    {prop_name}: {prop_type}")
     else:
         lines.append("    def __init__(self) -> None: ...")
     
-    with open(os.path.join(folder, f"{local}.pyi"), "w", encoding="utf-8") as f:
-        f.write("\n".join(lines).rstrip() + "\n")
-
-
-def _to_package_property_type(prop_type: str) -> str:
-    """Convert internal list-only property type to package constructor-friendly union.
-
-    Example: list[Person] -> Person | list[Person] | None
-    """
-    if prop_type.startswith("list[") and prop_type.endswith("]"):
-        inner = prop_type[len("list["):-1].strip()
-        return f"{inner} | list[{inner}] | None"
-    return prop_type
+    return "\n".join(lines).rstrip() + "\n"
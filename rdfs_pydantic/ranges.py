@@ -0,0 +1,115 @@
+"""Classification of rdfs:range IRIs.
+
+Extraction, type annotation and rendering all need to know what a range refers
+to: a datatype with a Python equivalent, some other literal datatype, a class
+defined in the schema, or a class defined elsewhere. `RangeClassifier` decides
+whether an IRI is a datatype once per distinct IRI and answers every later
+question with dictionary lookups, instead of matching substrings such as
+"Literal" (which also matched classes like ex:LiteralWork) on every pass.
+"""
+
+from collections.abc import Mapping
+from enum import Enum
+
+XSD = "http://www.w3.org/2001/XMLSchema#"
+RDF = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+RDFS = "http://www.w3.org/2000/01/rdf-schema#"
+
+# XML Schema and common RDF datatypes that should be treated as primitives
+PRIMITIVE_DATATYPES = {
+    f"{XSD}string": "str",
+    f"{XSD}int": "int",
+    f"{XSD}integer": "int",
+    f"{XSD}float": "float",
+    f"{XSD}double": "float",
+    f"{XSD}boolean": "bool",
+    f"{XSD}date": "str",
+    f"{XSD}time": "str",
+    f"{XSD}dateTime": "str",
+    f"{XSD}gYear": "str",
+    f"{XSD}gYearMonth": "str",
+    f"{XSD}duration": "str",
+    f"{RDF}langString": "str",
+    f"{RDFS}Literal": "str",
+}
+
+# Namespaces whose every term is a datatype (including the legacy XSD datatypes namespace)
+DATATYPE_NAMESPACES = (XSD, "http://www.w3.org/2001/XMLSchema-datatypes#")
+
+# Literal datatypes outside those namespaces
+LITERAL_DATATYPES = frozenset({
+    f"{RDF}XMLLiteral",
+    f"{RDF}HTML",
+    f"{RDF}JSON",
+    f"{RDF}PlainLiteral",
+    f"{RDF}CompoundLiteral",
+})
+
+
+class RangeKind(str, Enum):
+    """What a range IRI refers to.
+
+    - `PRIMITIVE`: A datatype with a Python equivalent (see `PRIMITIVE_DATATYPES`)
+    - `LITERAL`: Any other literal datatype, rendered as `str`
+    - `INTERNAL`: A class defined in the schema
+    - `EXTERNAL`: A class referenced but not defined in the schema
+    """
+
+    PRIMITIVE = "primitive"
+    LITERAL = "literal"
+    INTERNAL = "internal"
+    EXTERNAL = "external"
+
+
+class RangeClassifier:
+    """Classifies range IRIs, caching each datatype decision.
+
+    Whether an IRI is a datatype never changes, so it is computed once per IRI.
+    Whether a class is internal is looked up in `classes` on every call, so the
+    classifier stays valid while classes are added or removed.
+
+    Attributes:
+        classes: Map of class IRI -> ClassInfo of the classes defined in the schema
+        datatypes: Map of IRI -> datatype kind, or None for classes, filled in on first use
+    """
+
+    def __init__(self, classes: Mapping[str, object] | None = None, datatypes: dict[str, RangeKind | None] | None = None):
+        """Create a classifier.
+
+        Args:
+            classes: Classes defined in the schema (default: none)
+            datatypes: Datatype decisions to share with another classifier
+        """
+        self.classes = classes if classes is not None else {}
+        self.datatypes: dict[str, RangeKind | None] = datatypes if datatypes is not None else {}
+
+    def datatype_kind(self, iri) -> RangeKind | None:
+        """Get PRIMITIVE or LITERAL for a datatype IRI, or None for a class."""
+        iri = str(iri)
+        try:
+            return self.datatypes[iri]
+        except KeyError:
+            pass
+        if iri in PRIMITIVE_DATATYPES:
+            kind = RangeKind.PRIMITIVE
+        elif iri in LITERAL_DATATYPES or iri.startswith(DATATYPE_NAMESPACES):
+            kind = RangeKind.LITERAL
+        else:
+            kind = None
+        self.datatypes[iri] = kind
+        return kind
+
+    def kind(self, iri) -> RangeKind:
+        """Classify a range IRI (datatypes take precedence over classes)."""
+        kind = self.datatype_kind(iri)
+        if kind is not None:
+            return kind
+        return RangeKind.INTERNAL if str(iri) in self.classes else RangeKind.EXTERNAL
+
+    def is_datatype(self, iri) -> bool:
+        """Check whether a range IRI is a primitive or literal datatype."""
+        return self.datatype_kind(iri) is not None
+
+    def bind(self, classes: Mapping[str, object]) -> "RangeClassifier":
+        """Get a classifier for another set of classes sharing the datatype decisions."""
+        return RangeClassifier(classes, self.datatypes)
@@ -0,0 +1,178 @@
+"""Fetch remote resources (such as JSON-LD contexts) through an on-disk HTTP cache.
+
+Both the CLI and extraction can load a JSON-LD @context from a URL. They share
+a `ResourceLoader` that keeps each response on disk along with its ETag and
+Last-Modified headers:
+
+- within the TTL, the cached body is returned without any network access;
+- after the TTL, the request is revalidated with If-None-Match /
+  If-Modified-Since, and a 304 response reuses the cached body;
+- in offline mode, only the cache is consulted;
+- if the server cannot be reached (connection error or timeout), a stale
+  cached body is used when available; an HTTP error status is raised, so a
+  context the server has removed or broken is not silently kept in use.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any
+import requests
+from .cache import cache_root
+
+DEFAULT_TTL = 24 * 60 * 60
+
+DEFAULT_TIMEOUT = 30.0
+
+
+def default_resource_cache_dir() -> str:
+    """Get the default HTTP cache directory (http/ under the rdfs_pydantic cache root)."""
+    return os.path.join(cache_root(), "http")
+
+
+class ResourceLoader:
+    """HTTP loader with an on-disk cache, conditional revalidation and an offline mode."""
+
+    def __init__(
+        self,
+        cache_dir: str | None = None,
+        ttl: float = DEFAULT_TTL,
+        offline: bool = False,
+        timeout: float = DEFAULT_TIMEOUT,
+        session: requests.Session | None = None,
+    ):
+        """Initialize the loader.
+
+        Args:
+            cache_dir: Directory for cached responses (default: see `default_resource_cache_dir`)
+            ttl: Seconds a cached response is used without revalidation (default: one day)
+            offline: If True, never touch the network; uncached URLs raise ValueError
+            timeout: Connect/read timeout in seconds for network requests
+            session: Optional requests session (default: a new session)
+        """
+        self.cache_dir = cache_dir or default_resource_cache_dir()
+        self.ttl = ttl
+        self.offline = offline
+        self.timeout = timeout
+        self.session = session or requests.Session()
+
+    def fetch(self, url: str) -> bytes:
+        """Get the body of a URL, from the cache where possible.
+
+        Args:
+            url: HTTP(S) URL to fetch
+
+        Returns:
+            Response body
+
+        Raises:
+            ValueError: If offline mode is enabled and the URL is not cached
+            requests.HTTPError: If the server answers with an error status
+            requests.RequestException: If the request fails and nothing is cached
+        """
+        meta = self._read_meta(url)
+        body = self._read_body(url) if meta is not None else None
+        if body is None:
+            meta = None
+
+        if self.offline:
+            if body is None:
+                raise ValueError(f"'{url}' is not cached and offline mode is enabled")
+            return body
+
+        if body is not None and time.time() - meta.get("fetched_at", 0) < self.ttl:
+            return body
+
+        headers = {}
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            # Serve a stale copy rather than failing when the server is unreachable
+            if body is not None:
+                return body
+            raise
+        if response.status_code == 304 and body is not None:
+            meta["fetched_at"] = time.time()
+            self._write_meta(url, meta)
+            return body
+        response.raise_for_status()
+
+        self._store(url, response)
+        return response.content
+
+    def fetch_json(self, url: str) -> Any:
+        """Get and decode a JSON document, from the cache where possible."""
+        return json.loads(self.fetch(url))
+
+    def _store(self, url: str, response: requests.Response) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._write_atomic(self._path(url, ".body"), response.content)
+        self._write_meta(url, {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        })
+
+    def _read_meta(self, url: str) -> dict | None:
+        try:
+            with open(self._path(url, ".json"), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta if isinstance(meta, dict) and meta.get("url") == url else None
+
+    def _read_body(self, url: str) -> bytes | None:
+        try:
+            with open(self._path(url, ".body"), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_meta(self, url: str, meta: dict) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._write_atomic(self._path(url, ".json"), json.dumps(meta).encode("utf-8"))
+
+    def _write_atomic(self, path: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _path(self, url: str, suffix: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode("utf-8")).hexdigest() + suffix)
+
+
+_default_loader: ResourceLoader | None = None
+
+
+def default_loader() -> ResourceLoader:
+    """Get the shared loader, creating it on first use.
+
+    Offline mode is enabled when $RDFS_PYDANTIC_OFFLINE is set to a non-empty
+    value other than "0".
+    """
+    global _default_loader
+    if _default_loader is None:
+        offline = os.environ.get("RDFS_PYDANTIC_OFFLINE", "") not in ("", "0")
+        _default_loader = ResourceLoader(offline=offline)
+    return _default_loader
+
+
+def set_default_loader(loader: ResourceLoader | None) -> None:
+    """Replace the shared loader (pass None to recreate it from defaults on next use)."""
+    global _default_loader
+    _default_loader = loader
@@ -0,0 +1,202 @@
+"""Subject-keyed index of the triples used during class and property extraction.
+
+Extraction only needs a handful of predicates (rdf:type, rdfs:label,
+rdfs:comment, rdfs:domain, rdfs:range and rdfs:subClassOf). Rather than
+querying the graph several times per subject, the index collects those triples
+once and answers every later lookup from plain dictionaries.
+"""
+
+from collections.abc import Collection
+from rdflib import Graph
+from rdflib.namespace import RDF, RDFS
+from rdflib.term import Node
+from .models import PrefixBindingReport
+
+# Predicates whose objects are kept for each schema subject
+VALUE_PREDICATES = frozenset({RDFS.label, RDFS.comment, RDFS.domain, RDFS.range, RDFS.subClassOf})
+
+# Every predicate that extraction reads from
+SCHEMA_PREDICATES = VALUE_PREDICATES | {RDF.type}
+
+# rdf:type objects that mark a schema subject
+SCHEMA_TYPES = frozenset({RDFS.Class, RDF.Property})
+
+# Predicates whose objects refer to other terms, indexed in reverse
+REFERENCE_PREDICATES = frozenset({RDFS.domain, RDFS.range, RDFS.subClassOf})
+
+
+def is_schema_triple(predicate: Node, obj: Node) -> bool:
+    """Check whether a triple can contribute to extraction, judged by predicate and object."""
+    if predicate == RDF.type:
+        return obj in SCHEMA_TYPES
+    return predicate in VALUE_PREDICATES
+
+
+class SchemaIndex:
+    """Index of rdfs:Class / rdf:Property subjects and their schema values.
+
+    Attributes:
+        graph: Graph used for namespace resolution (the source graph when built
+            with `from_graph`)
+        classes: Ordered set of rdfs:Class subjects
+        properties: Ordered set of rdf:Property subjects
+        values: Map of subject -> predicate -> ordered set of objects
+        referrers: Reverse map of object -> predicate -> ordered set of subjects,
+            for rdfs:domain, rdfs:range and rdfs:subClassOf
+        prefix_report: Cached prefix binding report (see
+            `extraction.check_prefix_bindings`), reset whenever a subject is added or removed
+    """
+
+    def __init__(self, graph: Graph | None = None):
+        self.graph = graph if graph is not None else Graph()
+        self.classes: dict[Node, None] = {}
+        self.properties: dict[Node, None] = {}
+        self.values: dict[Node, dict[Node, dict[Node, None]]] = {}
+        self.referrers: dict[Node, dict[Node, dict[Node, None]]] = {}
+        self.prefix_report: PrefixBindingReport | None = None
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "SchemaIndex":
+        """Build an index from an RDF graph.
+
+        Args:
+            graph: RDF graph to index (also used for namespace resolution)
+
+        Returns:
+            Populated SchemaIndex
+        """
+        index = cls(graph)
+        index.add_graph(graph)
+        return index
+
+    def add_graph(self, graph: Graph) -> None:
+        """Add the schema triples of an RDF graph.
+
+        Schema subjects are found through the graph's predicate/object index,
+        then each subject's triples are read in a single lookup, preserving the
+        graph's per-subject ordering. Values are stored as ordered sets, so
+        adding the same graph again is a no-op.
+
+        Args:
+            graph: RDF graph to read from
+        """
+        for subject in graph.subjects(RDF.type, RDFS.Class):
+            self.classes[subject] = None
+        for subject in graph.subjects(RDF.type, RDF.Property):
+            self.properties[subject] = None
+        self.prefix_report = None
+
+        for subject in {**self.classes, **self.properties}:
+            for predicate, obj in graph.predicate_objects(subject):
+                if predicate in VALUE_PREDICATES:
+                    self._add_value(subject, predicate, obj)
+
+    def add(self, subject: Node, predicate: Node, obj: Node) -> None:
+        """Add a single triple, ignoring anything extraction does not read.
+
+        Args:
+            subject: Triple subject
+            predicate: Triple predicate
+            obj: Triple object
+        """
+        if predicate == RDF.type:
+            if obj == RDFS.Class:
+                self.classes[subject] = None
+                self.prefix_report = None
+            elif obj == RDF.Property:
+                self.properties[subject] = None
+                self.prefix_report = None
+        elif predicate in VALUE_PREDICATES:
+            self._add_value(subject, predicate, obj)
+
+    def remove(self, subject: Node, predicate: Node, obj: Node) -> None:
+        """Remove a single triple; triples that were never indexed are ignored.
+
+        Args:
+            subject: Triple subject
+            predicate: Triple predicate
+            obj: Triple object
+        """
+        if predicate == RDF.type:
+            if obj == RDFS.Class and subject in self.classes:
+                del self.classes[subject]
+                self.prefix_report = None
+            elif obj == RDF.Property and subject in self.properties:
+                del self.properties[subject]
+                self.prefix_report = None
+        elif predicate in VALUE_PREDICATES:
+            self._remove_value(subject, predicate, obj)
+
+    def is_schema_subject(self, subject: Node) -> bool:
+        """Check whether a subject is typed as rdfs:Class or rdf:Property."""
+        return subject in self.classes or subject in self.properties
+
+    def prune(self) -> None:
+        """Drop indexed values for subjects that are not schema subjects."""
+        for subject in [s for s in self.values if not self.is_schema_subject(s)]:
+            for predicate, objects in list(self.values[subject].items()):
+                for obj in list(objects):
+                    self._remove_value(subject, predicate, obj)
+
+    def follow_graph_order(self, subject: Node) -> None:
+        """Reorder a subject's indexed objects as `from_graph` would index them from `graph`.
+
+        Objects added with `add` after others were read from the graph end up
+        in a different order than a freshly built index would give them.
+        Objects missing from the graph keep their relative order after the rest.
+
+        Args:
+            subject: Subject whose objects are reordered
+        """
+        by_predicate = self.values.get(subject)
+        if not by_predicate:
+            return
+        ordered: dict[Node, dict[Node, None]] = {}
+        for predicate, obj in self.graph.predicate_objects(subject):
+            if obj in by_predicate.get(predicate, ()):
+                ordered.setdefault(predicate, {})[obj] = None
+        for predicate, objects in by_predicate.items():
+            ordered.setdefault(predicate, {}).update(objects)
+        self.values[subject] = ordered
+
+    def objects(self, subject: Node, predicate: Node) -> Collection[Node]:
+        """Get the indexed objects for a subject and predicate, in insertion order.
+
+        Returns a read-only view rather than a copy, so repeated lookups are free.
+        """
+        predicate_values = self.values.get(subject)
+        if not predicate_values:
+            return ()
+        return predicate_values.get(predicate, {}).keys()
+
+    def subjects(self, predicate: Node, obj: Node) -> Collection[Node]:
+        """Get the subjects referring to `obj` through a reference predicate, in insertion order.
+
+        Only rdfs:domain, rdfs:range and rdfs:subClassOf are indexed in reverse.
+        """
+        predicate_subjects = self.referrers.get(obj)
+        if not predicate_subjects:
+            return ()
+        return predicate_subjects.get(predicate, {}).keys()
+
+    def _add_value(self, subject: Node, predicate: Node, obj: Node) -> None:
+        self.values.setdefault(subject, {}).setdefault(predicate, {})[obj] = None
+        if predicate in REFERENCE_PREDICATES:
+            self.referrers.setdefault(obj, {}).setdefault(predicate, {})[subject] = None
+
+    def _remove_value(self, subject: Node, predicate: Node, obj: Node) -> None:
+        _discard(self.values, subject, predicate, obj)
+        if predicate in REFERENCE_PREDICATES:
+            _discard(self.referrers, obj, predicate, subject)
+
+
+def _discard(table: dict[Node, dict[Node, dict[Node, None]]], key: Node, predicate: Node, member: Node) -> None:
+    """Remove `member` from a two-level ordered-set table, dropping emptied levels."""
+    by_predicate = table.get(key)
+    if not by_predicate or member not in by_predicate.get(predicate, {}):
+        return
+    del by_predicate[predicate][member]
+    if not by_predicate[predicate]:
+        del by_predicate[predicate]
+        if not by_predicate:
+            del table[key]
@@ -0,0 +1,135 @@
+"""Stream schema triples from N-Triples and N-Quads files without building a Graph.
+
+Ontologies are often distributed inside large N-Triples dumps alongside
+instance data. Parsing such a dump into an rdflib Graph holds every triple in
+memory even though extraction reads only a few predicates. The reader here
+walks the file line by line, discards lines that cannot carry a schema triple
+before parsing them, and adds the rest to a SchemaIndex, so memory is bounded
+by the size of the schema rather than the dump.
+"""
+
+import os
+from collections.abc import Callable, Iterable
+from rdflib.namespace import RDF, RDFS
+from rdflib.plugins.parsers.ntriples import W3CNTriplesParser, ParseError, r_tail, r_wspace, r_wspaces
+from rdflib.term import Node
+from .schema_index import SchemaIndex
+
+# File extensions read by the streaming reader, mapped to whether lines carry a graph label
+STREAMING_FORMATS = {
+    ".nt": False,
+    ".nq": True,
+}
+
+# Structural predicates are collected in the first pass, text values in the second
+_STRUCTURE_PREDICATES = frozenset({RDF.type, RDFS.domain, RDFS.range, RDFS.subClassOf})
+_TEXT_PREDICATES = frozenset({RDFS.label, RDFS.comment})
+
+# Every schema predicate IRI contains one of these; escaped IRIs fall back to a full parse
+_LINE_MARKERS = (f"<{RDFS}", f"<{RDF.type}>", "\\")
+
+
+class _IndexSink:
+    """Parser sink that forwards accepted triples to a SchemaIndex."""
+
+    def __init__(self, index: SchemaIndex, accept: Callable[[Node], bool]):
+        self.index = index
+        self.accept = accept
+
+    def triple(self, subject: Node, predicate: Node, obj: Node) -> None:
+        if self.accept(subject):
+            self.index.add(subject, predicate, obj)
+
+
+class _SchemaLineParser(W3CNTriplesParser):
+    """N-Triples/N-Quads line parser that stops at the first irrelevant term.
+
+    Lines without a schema predicate marker are skipped unparsed; otherwise the
+    object (and graph label) is only parsed when the predicate is wanted.
+    """
+
+    def __init__(self, sink: _IndexSink, predicates: frozenset, quads: bool, bnode_context: dict):
+        super().__init__(sink, bnode_context)
+        self.predicates = predicates
+        self.quads = quads
+
+    def parseline(self, bnode_context=None) -> None:
+        line = self.line
+        if not line or not any(marker in line for marker in _LINE_MARKERS):
+            return
+        self.eat(r_wspace)
+        if (not self.line) or self.line.startswith("#"):
+            return
+
+        subject = self.subject(bnode_context)
+        self.eat(r_wspaces)
+        predicate = self.predicate()
+        if predicate not in self.predicates:
+            return
+        self.eat(r_wspaces)
+        obj = self.object(bnode_context)
+
+        if self.quads:
+            # Graph labels are ignored: schema triples are merged across graphs
+            self.eat(r_wspace)
+            self.uriref() or self.nodeid(bnode_context)
+        self.eat(r_tail)
+
+        if self.line:
+            raise ParseError("Trailing garbage: {}".format(self.line))
+        self.sink.triple(subject, predicate, obj)
+
+
+def is_streaming_format(path: str | os.PathLike) -> bool:
+    """Check whether a file can be read by `read_ntriples_schema` (by extension)."""
+    return os.path.splitext(str(path))[1].lower() in STREAMING_FORMATS
+
+
+def read_ntriples_schema(paths: str | os.PathLike | Iterable[str | os.PathLike], index: SchemaIndex | None = None) -> SchemaIndex:
+    """Read schema triples from N-Triples (.nt) or N-Quads (.nq) files into a SchemaIndex.
+    
+    Each file is read twice. The first pass collects rdf:type, rdfs:domain,
+    rdfs:range and rdfs:subClassOf triples; the second collects rdfs:label and
+    rdfs:comment values, but only for subjects the first pass (or the supplied
+    index) identified as classes or properties. Labels of instance data are
+    therefore never held in memory.
+    
+    N-Triples carry no prefix declarations, so bind prefixes on `index.graph`
+    (e.g., `index.graph.bind("ex", "http://example.org/")`) before generating code.
+    
+    Args:
+        paths: One path or several paths to read, in order
+        index: Optional index to add to (default: a new, empty SchemaIndex)
+        
+    Returns:
+        The populated SchemaIndex
+        
+    Raises:
+        ValueError: If a file extension is not .nt or .nq
+        ParseError: If a relevant line is not valid N-Triples/N-Quads
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    paths = list(paths)
+    for path in paths:
+        if not is_streaming_format(path):
+            raise ValueError(f"Cannot stream '{path}': expected one of {', '.join(STREAMING_FORMATS)}")
+
+    if index is None:
+        index = SchemaIndex()
+
+    bnode_contexts: dict[str, dict] = {str(path): {} for path in paths}
+    passes = (
+        (_STRUCTURE_PREDICATES, lambda subject: True),
+        (_TEXT_PREDICATES, index.is_schema_subject),
+    )
+    for predicates, accept in passes:
+        for path in paths:
+            quads = STREAMING_FORMATS[os.path.splitext(str(path))[1].lower()]
+            bnode_context = bnode_contexts[str(path)]
+            parser = _SchemaLineParser(_IndexSink(index, accept), predicates, quads, bnode_context)
+            with open(path, "r", encoding="utf-8") as f:
+                parser.parse(f, bnode_context=bnode_context)
+
+    index.prune()
+    return index
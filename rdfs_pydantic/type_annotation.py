@@ -1,105 +1,79 @@
 """Generate type annotations for RDF properties."""
 
+import sys
+from .models import PropertyType, TypeMember
 from .naming import NamingStrategy, DefaultNamingStrategy
+from .ranges import PRIMITIVE_DATATYPES, RangeClassifier, RangeKind
 
-# XML Schema and common RDF datatypes that should be treated as primitives
-PRIMITIVE_DATATYPES = {
-    "http://www.w3.org/2001/XMLSchema#string": "str",
-    "http://www.w3.org/2001/XMLSchema#int": "int",
-    "http://www.w3.org/2001/XMLSchema#integer": "int",
-    "http://www.w3.org/2001/XMLSchema#float": "float",
-    "http://www.w3.org/2001/XMLSchema#double": "float",
-    "http://www.w3.org/2001/XMLSchema#boolean": "bool",
-    "http://www.w3.org/2001/XMLSchema#date": "str",
-    "http://www.w3.org/2001/XMLSchema#time": "str",
-    "http://www.w3.org/2001/XMLSchema#dateTime": "str",
-    "http://www.w3.org/2001/XMLSchema#gYear": "str",
-    "http://www.w3.org/2001/XMLSchema#gYearMonth": "str",
-    "http://www.w3.org/2001/XMLSchema#duration": "str",
-    "http://www.w3.org/1999/02/22-rdf-syntax-ns#langString": "str",
-    "http://www.w3.org/2000/01/rdf-schema#Literal": "str",
-}
 
-def get_property_type(range_uri, naming_strategy: NamingStrategy | None = None) -> str:
-    """Get the Python type annotation for an RDFS range.
-    
-    Args:
-        range_uri: The RDFS range URI
-        naming_strategy: Optional naming strategy for extracting class names
-        
-    Returns:
-        Python type annotation string as a list type (e.g., list[str] or list[ClassName])
-    """
-    if naming_strategy is None:
-        naming_strategy = DefaultNamingStrategy()
-        
-    if not range_uri:
-        return "list[str]"
+def build_property_type(range_uris: list, naming_strategy: NamingStrategy | None = None, ranges: RangeClassifier | None = None) -> PropertyType:
+    """Build the structured Python type for the RDFS ranges of a property.
 
-    range_str = str(range_uri)
+    Known datatypes become primitive members, literal ranges become `str`
+    (after the other members) and every other range becomes a class member
+    carrying its IRI. Members are deduplicated by name, keeping the first.
 
-    # Check if it's a known primitive datatype
-    if range_str in PRIMITIVE_DATATYPES:
-        prim_type = PRIMITIVE_DATATYPES[range_str]
-        return f"list[{prim_type}]"
-
-    # Check if it's a Literal
-    # TODO: this seems like weak logic.
-    # Maybe a class will be called 'http://example.org/ExampleLiteral'?
-    if "Literal" in range_str:
-        return "list[str]"
-
-    # Otherwise it's a class reference
-    class_name = naming_strategy.get_local_name(range_str)
-    return f"list[{class_name}]"
-
-
-def get_union_property_type(range_uris: list, naming_strategy: NamingStrategy | None = None) -> str:
-    """Get the Python type annotation for multiple RDFS ranges (union types).
-    
     Args:
         range_uris: List of RDFS range URIs
         naming_strategy: Optional naming strategy for extracting class names
-        
+        ranges: Optional classifier shared across properties, so each range
+            IRI is classified once
+
     Returns:
-        Python type annotation string as a list type (e.g., list[Type1 | Type2])
+        PropertyType listing the union members (`list[str]` if there are no ranges)
     """
     if naming_strategy is None:
         naming_strategy = DefaultNamingStrategy()
-        
-    if not range_uris:
-        return "list[str]"
+    if ranges is None:
+        ranges = RangeClassifier()
 
-    # Extract type names from all ranges
-    type_names = []
+    members: dict[str, TypeMember] = {}
     has_literal = False
 
     for range_uri in range_uris:
+        if not range_uri:
+            continue
         range_str = str(range_uri)
-        
-        # Check if it's a known primitive datatype
-        if range_str in PRIMITIVE_DATATYPES:
+        kind = ranges.datatype_kind(range_str)
+        if kind is RangeKind.PRIMITIVE:
             prim_type = PRIMITIVE_DATATYPES[range_str]
-            if prim_type not in type_names:
-                type_names.append(prim_type)
-            continue
-        
-        if "Literal" in range_str:
+            members.setdefault(prim_type, TypeMember(prim_type))
+        elif kind is RangeKind.LITERAL:
             has_literal = True
         else:
             class_name = naming_strategy.get_local_name(range_str)
-            if class_name not in type_names:
-                type_names.append(class_name)
+            members.setdefault(class_name, TypeMember(class_name, sys.intern(range_str)))
 
-    # Add string type if there's a literal
-    if has_literal and "str" not in type_names:
-        type_names.append("str")
+    # Add string type if there's a literal (or nothing else)
+    if has_literal or not members:
+        members.setdefault("str", TypeMember("str"))
 
-    # Create union of all types
-    if len(type_names) == 1:
-        union_types = type_names[0]
-    else:
-        union_types = " | ".join(type_names)
+    return PropertyType(tuple(members.values()))
+
+
+def get_property_type(range_uri, naming_strategy: NamingStrategy | None = None, ranges: RangeClassifier | None = None) -> str:
+    """Get the Python type annotation for an RDFS range.
     
-    return f"list[{union_types}]"
+    Args:
+        range_uri: The RDFS range URI
+        naming_strategy: Optional naming strategy for extracting class names
+        ranges: Optional range classifier to reuse
+        
+    Returns:
+        Python type annotation string as a list type (e.g., list[str] or list[ClassName])
+    """
+    return build_property_type([range_uri], naming_strategy, ranges).render()
+
 
+def get_union_property_type(range_uris: list, naming_strategy: NamingStrategy | None = None, ranges: RangeClassifier | None = None) -> str:
+    """Get the Python type annotation for multiple RDFS ranges (union types).
+    
+    Args:
+        range_uris: List of RDFS range URIs
+        naming_strategy: Optional naming strategy for extracting class names
+        ranges: Optional range classifier to reuse
+        
+    Returns:
+        Python type annotation string as a list type (e.g., list[Type1 | Type2])
+    """
+    return build_property_type(range_uris, naming_strategy, ranges).render()
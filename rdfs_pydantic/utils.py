@@ -3,6 +3,10 @@
 import keyword
 import re
 from rdflib import Graph, URIRef
+from .hierarchy import ClassHierarchy
+
+_NON_WORD_PATTERN = re.compile(r"\W")
+_UNDERSCORES_PATTERN = re.compile(r"_+")
 
 
 def sanitise_identifier(name: str) -> str:
@@ -14,8 +18,8 @@ def sanitise_identifier(name: str) -> str:
     - Appends an underscore if the name is a Python keyword.
     - Falls back to "identifier" if the result would be empty.
     """
-    sanitized = re.sub(r"\W", "_", str(name))
-    sanitized = re.sub(r"_+", "_", sanitized)
+    sanitized = _NON_WORD_PATTERN.sub("_", str(name))
+    sanitized = _UNDERSCORES_PATTERN.sub("_", sanitized)
     if sanitized and sanitized[0].isdigit():
         sanitized = f"_{sanitized}"
     if keyword.iskeyword(sanitized):
@@ -66,51 +70,18 @@ def topological_sort_classes(classes: dict) -> list:
     Property type dependencies are NOT included as they can create self-loops
     in the dependency graph (e.g., a class with recursive properties).
     
+    Cycles are collapsed into strongly connected components (see
+    `hierarchy.ClassHierarchy`), which are ordered by Kahn's algorithm with a
+    heap of ready components, so the cost is O((V + E) log V). When several
+    classes are ready, the smallest URI comes first, keeping the output
+    deterministic.
+    
     Args:
         classes: Dict of class_uri -> class_info (supports dict or dataclass values)
         
     Returns:
-        List of class URIs sorted topologically by inheritance relationships
+        List of class URIs sorted topologically by inheritance relationships.
+        Classes on a cycle are placed together, ordered by URI, and a warning
+        naming them is issued.
     """
-    # Build a dependency graph using only parent class relationships
-    dependencies: dict[str, set[str]] = {}
-
-    for class_uri, class_info in classes.items():
-        deps: set[str] = set()
-
-        # Add parent class dependencies only (not property types)
-        parent_uris = getattr(class_info, "parent_uris", None)
-        if parent_uris is None and isinstance(class_info, dict):
-            parent_uris = class_info.get("parent_uris", [])
-        for parent_uri in parent_uris or []:
-            if str(parent_uri) in classes:
-                deps.add(str(parent_uri))
-
-        dependencies[class_uri] = deps
-    
-    # Topological sort using Kahn's algorithm
-    sorted_list = []
-    in_degree = {uri: 0 for uri in classes}
-
-    # Calculate in-degrees
-    for uri, deps in dependencies.items():
-        in_degree[uri] = len(deps)
-
-    # Find all nodes with no incoming edges
-    queue = [uri for uri in classes if in_degree[uri] == 0]
-
-    while queue:
-        # Sort for deterministic order when multiple choices available
-        current = sorted(queue)[0]
-        queue.remove(current)
-        sorted_list.append(current)
-
-        # For each node that depends on current, reduce in-degree
-        for uri, deps in dependencies.items():
-            if current in deps and uri in in_degree:
-                in_degree[uri] -= 1
-                if in_degree[uri] == 0:
-                    queue.append(uri)
-
-    # If all nodes were processed, return sorted list; otherwise return original order
-    return sorted_list if len(sorted_list) == len(classes) else list(classes.keys())
+    return ClassHierarchy(classes).order
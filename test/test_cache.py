@@ -0,0 +1,101 @@
+import gc
+import os
+import weakref
+from pathlib import Path
+
+from rdflib import Graph
+from typer.testing import CliRunner
+
+from rdfs_pydantic import cli, create_module, create_package
+from rdfs_pydantic.cache import SchemaCache
+from rdfs_pydantic.extraction import extract_schema
+
+
+EXAMPLE = str(Path(__file__).parent.parent / "example" / "art.ttl")
+
+
+def _example_graph() -> Graph:
+    g = Graph()
+    g.parse(EXAMPLE, format="turtle")
+    return g
+
+
+def test_cached_schema_renders_identically(tmp_path):
+    cache = SchemaCache(str(tmp_path / "cache"))
+    key = cache.key([EXAMPLE], context=None, language="en", bindings=[])
+    assert cache.get(key) is None
+
+    cache.put(key, extract_schema(_example_graph()))
+    cached = cache.get(key)
+
+    assert cached is not None
+    assert create_module(cached) == create_module(_example_graph())
+    create_package(cached, output_dir=str(tmp_path / "cached" / "pkg"))
+    create_package(_example_graph(), output_dir=str(tmp_path / "fresh" / "pkg"))
+    for path in sorted((tmp_path / "fresh").rglob("*.py*")):
+        rel = path.relative_to(tmp_path / "fresh")
+        assert (tmp_path / "cached" / rel).read_text() == path.read_text()
+
+
+
+def test_schema_does_not_keep_source_graph_alive():
+    g = _example_graph()
+    graph_ref = weakref.ref(g)
+    schema = extract_schema(g)
+    expected = create_module(g)
+    del g
+    gc.collect()
+
+    assert graph_ref() is None
+    assert create_module(schema) == expected
+    shared = [info.properties for info in schema.classes.values() if info.properties]
+    by_iri = {}
+    for properties in shared:
+        for prop in properties.values():
+            assert by_iri.setdefault(prop.iri, prop) is prop
+
+
+def test_key_depends_on_every_input(tmp_path):
+    cache = SchemaCache(str(tmp_path))
+    other = tmp_path / "other.ttl"
+    other.write_text(Path(EXAMPLE).read_text() + "\n# edited\n")
+
+    base = cache.key([EXAMPLE], None, "en", [])
+    assert cache.key([EXAMPLE], None, "en", []) == base
+    assert cache.key([str(other)], None, "en", []) != base
+    assert cache.key([EXAMPLE], {"@context": {"A": "http://example.org/Agent"}}, "en", []) != base
+    assert cache.key([EXAMPLE], None, "fr", []) != base
+    assert cache.key([EXAMPLE], None, "en", [("ex", "http://example.org/")]) != base
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    schema = extract_schema(_example_graph())
+    cache = SchemaCache(str(tmp_path), max_bytes=10**9)
+    for key in ("a", "b", "c"):
+        cache.put(key, schema)
+    entry_size = os.path.getsize(tmp_path / "a.ir")
+    for age, key in enumerate(("a", "b", "c")):
+        os.utime(tmp_path / f"{key}.ir", (1000 + age, 1000 + age))
+    cache.get("a")
+
+    cache.max_bytes = entry_size * 2
+    cache.evict()
+
+    assert sorted(p.name for p in tmp_path.glob("*.ir")) == ["a.ir", "c.ir"]
+
+
+def test_cli_warm_run_skips_parsing(tmp_path, monkeypatch):
+    runner = CliRunner()
+    args = ["module", "--ontology", EXAMPLE, "--cache", "--cache-dir", str(tmp_path)]
+
+    cold = runner.invoke(cli.app, args)
+    assert cold.exit_code == 0, cold.output
+
+    def fail(*args, **kwargs):
+        raise AssertionError("ontology was parsed on a warm run")
+
+    monkeypatch.setattr(cli, "load_ontologies", fail)
+    warm = runner.invoke(cli.app, args)
+
+    assert warm.exit_code == 0, warm.output
+    assert warm.output == cold.output
@@ -1,9 +1,12 @@
 import json
+import subprocess
+import sys
 import pytest
 import testmark
 from pathlib import Path
-from rdflib import Graph, Namespace, RDF, RDFS
+from rdflib import Graph, Literal, Namespace, RDF, RDFS
 from rdfs_pydantic import create_package
+from rdfs_pydantic.package_generator import MANIFEST_NAME
 from pydantic import BaseModel
 import re
 
@@ -216,3 +219,113 @@ def test_context_path_alias(tmp_path):
     person_file = out_dir / "ex" / "Person.py"
     assert person_file.exists()
     assert "class Person(" in person_file.read_text(encoding="utf-8")
+
+
+def test_class_iris_are_resolved_once_per_run(tmp_path, monkeypatch):
+    import rdfs_pydantic.models as models
+    from rdfs_pydantic import create_module
+    from rdfs_pydantic.extraction import extract_schema
+
+    g = Graph()
+    ex = Namespace("http://example.org/")
+    g.bind("ex", ex)
+    for name in ("Agent", "Person", "Place"):
+        g.add((ex[name], RDF.type, RDFS.Class))
+    g.add((ex.Person, RDFS.subClassOf, ex.Agent))
+    g.add((ex.livesIn, RDF.type, RDF.Property))
+    g.add((ex.livesIn, RDFS.domain, ex.Person))
+    g.add((ex.livesIn, RDFS.range, ex.Place))
+
+    resolved = []
+    original = models.extract_prefix_and_local
+    monkeypatch.setattr(models, "extract_prefix_and_local", lambda uri, graph: resolved.append(str(uri)) or original(uri, graph))
+
+    schema = extract_schema(g)
+    create_module(schema)
+    create_package(schema, output_dir=str(tmp_path / "pkg"))
+
+    assert sorted(resolved) == sorted(schema.classes)
+    assert schema.curies[str(ex.Person)] == ("ex", "Person")
+
+
+def test_parallel_rendering_matches_serial_output(tmp_path):
+    g = Graph()
+    g.parse(Path(__file__).parent.parent / "example" / "art.ttl", format="turtle")
+    other = Namespace("http://other.example/")
+    g.bind("other", other)
+    for i in range(40):
+        g.add((other[f"C{i}"], RDF.type, RDFS.Class))
+        g.add((other[f"C{i}"], RDFS.subClassOf, other[f"C{i // 2}"] if i else Namespace("http://example.org/").Artwork))
+
+    create_package(g, output_dir=str(tmp_path / "serial" / "pkg"), base_cls=CustomBaseModel)
+    create_package(g, output_dir=str(tmp_path / "parallel" / "pkg"), base_cls=CustomBaseModel, jobs=3)
+
+    # The manifests differ only in the recorded mtimes
+    serial = {p.relative_to(tmp_path / "serial"): p.read_bytes() for p in (tmp_path / "serial").rglob("*") if p.is_file() and p.name != MANIFEST_NAME}
+    parallel = {p.relative_to(tmp_path / "parallel"): p.read_bytes() for p in (tmp_path / "parallel").rglob("*") if p.is_file() and p.name != MANIFEST_NAME}
+    assert len(serial) > 80
+    assert parallel == serial
+
+
+def test_regeneration_rewrites_only_changed_files(tmp_path):
+    ex = Namespace("http://example.org/")
+    g = Graph()
+    g.bind("ex", ex)
+    for name in ("Person", "Place", "Event"):
+        g.add((ex[name], RDF.type, RDFS.Class))
+    output_dir = tmp_path / "pkg"
+
+    first = create_package(g, output_dir=str(output_dir))
+    assert first.written == {
+        "py.typed", "__init__.py", "ex/__init__.py",
+        "ex/Person.py", "ex/Person.pyi", "ex/Place.py", "ex/Place.pyi", "ex/Event.py", "ex/Event.pyi",
+    }
+    assert (output_dir / MANIFEST_NAME).exists()
+    (output_dir / "ex" / "notes.txt").write_text("kept", encoding="utf-8")
+    mtimes = {p: p.stat().st_mtime_ns for p in output_dir.rglob("*.py*")}
+
+    second = create_package(g, output_dir=str(output_dir))
+    assert second.is_empty()
+    assert second.unchanged == first.written
+    assert {p: p.stat().st_mtime_ns for p in output_dir.rglob("*.py*")} == mtimes
+
+    # A new comment on Person and a removed Event touch only their files and the __init__ modules
+    g.add((ex.Person, RDFS.comment, Literal("A human being")))
+    g.remove((ex.Event, RDF.type, RDFS.Class))
+    third = create_package(g, output_dir=str(output_dir))
+    assert third.written == {"ex/Person.py", "ex/__init__.py", "__init__.py"}
+    assert third.removed == {"ex/Event.py", "ex/Event.pyi"}
+    assert third.summary() == "3 written, 4 unchanged, 2 removed"
+    assert not (output_dir / "ex" / "Event.py").exists()
+    assert (output_dir / "ex" / "notes.txt").read_text(encoding="utf-8") == "kept"
+    assert (output_dir / "ex" / "Place.py").stat().st_mtime_ns == mtimes[output_dir / "ex" / "Place.py"]
+
+    # A generated file edited by hand is restored
+    (output_dir / "ex" / "Place.py").write_text("# edited\n", encoding="utf-8")
+    assert create_package(g, output_dir=str(output_dir)).written == {"ex/Place.py"}
+
+
+def test_lazy_package_imports_classes_on_first_access(tmp_path):
+    g = Graph()
+    g.parse(Path(__file__).parent.parent / "example" / "art.ttl", format="turtle")
+    create_package(g, output_dir=str(tmp_path / "artpkg"), lazy=True)
+
+    script = """
+import sys
+import artpkg
+assert not [m for m in sys.modules if m.startswith("artpkg.ex.")]
+
+# Artist loads its parent and the classes its properties refer to, not Exhibition
+artist = artpkg.Artist(name="Vincent", created=[{"artist": {"name": "Theo"}}])
+assert artist.created[0].artist.name == "Theo"
+assert "artpkg.ex.Exhibition" not in sys.modules
+assert artpkg.ex.Artist is artpkg.Artist
+
+from artpkg.ex import Exhibition
+assert Exhibition(artworks=[artist.created[0]]).artworks[0].artist.name == "Theo"
+assert {"Agent", "Painting"} <= set(dir(artpkg)) and artpkg.__all__ == sorted(artpkg.__all__)
+print("ok")
+"""
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, cwd=str(tmp_path))
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "ok"
@@ -0,0 +1,165 @@
+import random
+import warnings
+
+import pytest
+from rdflib import Graph, Namespace, RDF, RDFS
+
+from rdfs_pydantic import create_module, create_package
+from rdfs_pydantic.hierarchy import ClassHierarchy
+from rdfs_pydantic.models import ClassInfo, PropertyInfo
+
+
+def _classes(parents: dict[str, list[str]]) -> dict[str, ClassInfo]:
+    return {uri: ClassInfo(iri=uri, name=uri, parent_uris=list(ps)) for uri, ps in parents.items()}
+
+
+def _cyclic_hierarchy() -> ClassHierarchy:
+    with pytest.warns(UserWarning):
+        return ClassHierarchy(_classes({
+            "ex:Leaf": ["ex:B", "ex:Other"],
+            "ex:B": ["ex:C"],
+            "ex:C": ["ex:B", "ex:Root"],
+            "ex:Root": ["http://other.example/Thing"],
+            "ex:Other": ["ex:Root"],
+        }))
+
+
+def test_cycles_are_collapsed_into_components():
+    hierarchy = _cyclic_hierarchy()
+
+    assert hierarchy.components == [["ex:Root"], ["ex:B", "ex:C"], ["ex:Other"], ["ex:Leaf"]]
+    assert hierarchy.cycles == [["ex:B", "ex:C"]]
+    assert hierarchy.component_of["ex:B"] == hierarchy.component_of["ex:C"]
+    assert hierarchy.component_parents[hierarchy.component_of["ex:Leaf"]] == [1, 2]
+
+
+def test_ancestors_include_cycle_members():
+    hierarchy = _cyclic_hierarchy()
+
+    assert hierarchy.ancestors("ex:Leaf") == ["ex:Root", "ex:B", "ex:C", "ex:Other"]
+    assert hierarchy.ancestors("ex:B") == ["ex:Root", "ex:B", "ex:C"]
+    assert hierarchy.ancestors("ex:Root") == []
+    assert hierarchy.ancestors("http://other.example/Thing") == []
+    assert hierarchy.is_ancestor("ex:C", "ex:B")
+    assert not hierarchy.is_ancestor("ex:Leaf", "ex:Root")
+    assert not hierarchy.is_ancestor("http://other.example/Thing", "ex:Root")
+    assert hierarchy.is_strict_ancestor("ex:Root", "ex:B")
+    assert not hierarchy.is_strict_ancestor("ex:C", "ex:B")
+
+
+def test_minimal_parents_drop_inherited_ones():
+    with pytest.warns(UserWarning):
+        hierarchy = ClassHierarchy(_classes({
+            "ex:A": [],
+            "ex:B": ["ex:A"],
+            "ex:C": ["ex:D"],
+            "ex:D": ["ex:C"],
+            "ex:E": ["ex:A", "ex:B", "ex:C", "ex:D", "http://other.example/Thing"],
+        }))
+
+    assert hierarchy.minimal_parents("ex:E") == ["ex:B", "ex:C", "ex:D"]
+    assert hierarchy.minimal_parents("ex:B") == ["ex:A"]
+    assert hierarchy.minimal_parents("http://other.example/Thing") == []
+
+
+def test_walk_ancestors_matches_recursive_pre_order():
+    hierarchy = _cyclic_hierarchy()
+
+    assert hierarchy.walk_ancestors(["ex:B", "ex:Other"], exclude=["ex:Leaf"]) == [
+        "ex:B", "ex:C", "ex:Root", "ex:Other",
+    ]
+    assert hierarchy.walk_ancestors(["ex:C"], exclude=["ex:B"]) == ["ex:C", "ex:Root"]
+    assert hierarchy.mro("ex:B") == ["ex:B", "ex:C", "ex:Root"]
+    assert hierarchy.mro("ex:Leaf") == ["ex:Leaf", "ex:B", "ex:C", "ex:Other", "ex:Root"]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_mro_matches_python_on_random_hierarchies(seed):
+    rng = random.Random(seed)
+    uris = [f"C{i}" for i in range(200)]
+    hierarchy = ClassHierarchy(_classes({
+        uri: rng.sample(uris[:i], min(i, rng.randrange(4))) for i, uri in enumerate(uris)
+    }))
+
+    python_classes: dict[str, type] = {}
+    checked = 0
+    for uri in hierarchy.order:
+        if any(parent not in python_classes for parent in hierarchy.minimal_parents(uri)):
+            continue
+        bases = tuple(python_classes[parent] for parent in hierarchy.minimal_parents(uri))
+        try:
+            python_classes[uri] = type(uri, bases or (object,), {})
+        except TypeError:
+            with pytest.warns(UserWarning, match="No consistent method resolution order"):
+                hierarchy.mro(uri)
+            continue
+        assert hierarchy.mro(uri) == [cls.__name__ for cls in python_classes[uri].__mro__[:-1]]
+        checked += 1
+    assert checked > 100
+
+
+def test_effective_properties_follow_mro():
+    classes = _classes({"ex:A": [], "ex:B": ["ex:A"], "ex:C": ["ex:A"], "ex:D": ["ex:B", "ex:C"]})
+    for uri, names in {"ex:A": ["name", "age"], "ex:C": ["name"], "ex:D": ["title"]}.items():
+        classes[uri].properties = {name: PropertyInfo(name=name, label=uri) for name in names}
+    hierarchy = ClassHierarchy(classes)
+
+    assert hierarchy.mro("ex:D") == ["ex:D", "ex:B", "ex:C", "ex:A"]
+    assert {name: info.label for name, info in hierarchy.effective_properties("ex:D").items()} == {
+        "title": "ex:D", "name": "ex:C", "age": "ex:A",
+    }
+    assert hierarchy.effective_properties("http://other.example/Thing") == {}
+
+
+def test_deep_chain_does_not_recurse():
+    depth = 100_000
+    classes = _classes({f"ex:C{i}": [f"ex:C{i - 1}"] if i else [] for i in range(depth)})
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        hierarchy = ClassHierarchy(classes)
+
+    assert hierarchy.order == [f"ex:C{i}" for i in range(depth)]
+    assert hierarchy.ancestors("ex:C5000") == [f"ex:C{i}" for i in range(5000)]
+    assert len(hierarchy.walk_ancestors([f"ex:C{depth - 2}"])) == depth - 1
+    assert hierarchy.mro("ex:C5000") == [f"ex:C{i}" for i in range(5000, -1, -1)]
+
+
+def test_package_generation_handles_cycles_and_deep_chains(tmp_path):
+    EX = Namespace("http://example.org/")
+    g = Graph()
+    g.bind("ex", EX)
+    for name in ("A", "B"):
+        g.add((EX[name], RDF.type, RDFS.Class))
+    g.add((EX.A, RDFS.subClassOf, EX.B))
+    g.add((EX.B, RDFS.subClassOf, EX.A))
+    g.add((EX.name, RDF.type, RDF.Property))
+    g.add((EX.name, RDFS.domain, EX.A))
+    g.add((EX.name, RDFS.range, RDFS.Literal))
+    depth = 1500  # beyond the default recursion limit
+    for i in range(depth):
+        g.add((EX[f"C{i}"], RDF.type, RDFS.Class))
+        g.add((EX[f"C{i}"], RDFS.subClassOf, EX[f"C{i - 1}"] if i else EX.A))
+
+    with pytest.warns(UserWarning, match="ex:A|http://example.org/A"):
+        create_package(g, str(tmp_path))
+
+    stub = (tmp_path / "ex" / f"C{depth - 1}.pyi").read_text()
+    assert "name:" in stub
+    assert (tmp_path / "ex" / "B.pyi").read_text().count("name:") >= 1
+
+
+def test_module_lists_only_most_specific_parents():
+    EX = Namespace("http://example.org/")
+    g = Graph()
+    g.bind("ex", EX)
+    for name in ("Agent", "Person", "Artist"):
+        g.add((EX[name], RDF.type, RDFS.Class))
+    g.add((EX.Person, RDFS.subClassOf, EX.Agent))
+    g.add((EX.Artist, RDFS.subClassOf, EX.Agent))
+    g.add((EX.Artist, RDFS.subClassOf, EX.Person))
+
+    code = create_module(g)
+
+    assert "class Artist(Person):" in code
+    exec(compile(code, "<generated>", "exec"), {})
@@ -0,0 +1,214 @@
+import copy
+import random
+from pathlib import Path
+
+import pytest
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import RDF, RDFS, XSD
+
+from rdfs_pydantic import create_module
+from rdfs_pydantic.extraction import extract_schema
+from rdfs_pydantic.incremental import update_schema
+from rdfs_pydantic.module_generator import _ModuleRenderer, _prepare_module
+from rdfs_pydantic.package_generator import _render_class_sources
+from rdfs_pydantic.schema_index import SchemaIndex
+
+
+EXAMPLE = str(Path(__file__).parent.parent / "example" / "art.ttl")
+EX = Namespace("http://example.org/")
+OTHER = Namespace("http://other.example/")
+# Local names T0-T2 occur in both namespaces, so edits can make classes collide
+TERMS = [*(EX[f"T{i}"] for i in range(5)), *(OTHER[f"T{i}"] for i in range(3))]
+
+EDITS = {
+    "relabel class": ([(EX.Artist, RDFS.label, Literal("Artiste", lang="fr"))], [(EX.Artist, RDFS.label, Literal("Artist"))]),
+    "add class": ([(EX.Sculpture, RDF.type, RDFS.Class), (EX.Sculpture, RDFS.subClassOf, EX.Artwork)], []),
+    "remove class": ([], [(EX.Agent, RDF.type, RDFS.Class)]),
+    "retype class": ([(EX.Agent, RDF.type, RDFS.Class)], [(EX.Agent, RDF.type, RDFS.Class)]),
+    "reparent class": ([(EX.Painting, RDFS.subClassOf, EX.Exhibition)], [(EX.Painting, RDFS.subClassOf, EX.Artwork)]),
+    "add property": ([(EX.width, RDF.type, RDF.Property), (EX.width, RDFS.domain, EX.Painting), (EX.width, RDFS.range, XSD.decimal)], []),
+    "add external range": ([(EX.owner, RDF.type, RDF.Property), (EX.owner, RDFS.domain, EX.Artwork), (EX.owner, RDFS.range, EX.Museum)], []),
+    "add external domain": ([(EX.city, RDF.type, RDF.Property), (EX.city, RDFS.domain, EX.Museum), (EX.city, RDFS.range, RDFS.Literal)], []),
+    "remove property": ([], [(EX.name, RDF.type, RDF.Property)]),
+    "move property": ([(EX.name, RDFS.domain, EX.Exhibition)], [(EX.name, RDFS.domain, EX.Agent)]),
+    "relabel property": ([(EX.name, RDFS.label, Literal("Full name"))], [(EX.name, RDFS.label, Literal("Name"))]),
+}
+
+
+def _index() -> SchemaIndex:
+    g = Graph()
+    g.parse(EXAMPLE, format="turtle")
+    return SchemaIndex.from_graph(g)
+
+
+@pytest.mark.parametrize("edit", EDITS)
+def test_update_matches_fresh_extraction(edit):
+    added, removed = EDITS[edit]
+    index = _index()
+    schema = extract_schema(index)
+    for triple in removed:
+        index.graph.remove(triple)
+    for triple in added:
+        index.graph.add(triple)
+
+    update_schema(schema, index, added, removed)
+    fresh = extract_schema(SchemaIndex.from_graph(index.graph))
+
+    assert list(schema.classes) == list(fresh.classes)
+    assert schema.classes == fresh.classes
+    assert schema.literals == fresh.literals
+    assert {iri: info.properties for iri, info in schema.external_classes.items()} == {
+        iri: info.properties for iri, info in fresh.external_classes.items()
+    }
+    assert create_module(schema) == create_module(fresh)
+
+
+def test_update_reports_affected_classes():
+    index = _index()
+    schema = extract_schema(index)
+    width = [(EX.width, RDF.type, RDF.Property), (EX.width, RDFS.domain, EX.Painting), (EX.width, RDFS.range, EX.Unit)]
+
+    update = update_schema(schema, index, added=width)
+    assert update.changed_classes == {str(EX.Painting)}
+    assert update.changed_external_classes == {str(EX.Unit)}
+
+    update = update_schema(schema, index, removed=[(EX.Agent, RDF.type, RDFS.Class)])
+    assert update.removed_classes == {str(EX.Agent)}
+    assert str(EX.Artist) in update.changed_classes
+    assert str(EX.Agent) in update.changed_external_classes
+
+    assert update_schema(schema, index).is_empty()
+
+
+def test_update_rejects_unbound_prefix_without_modifying_schema():
+    index = _index()
+    schema = extract_schema(index)
+    other = Namespace("http://other.example/")
+
+    with pytest.raises(ValueError, match="http://other.example/Thing"):
+        update_schema(schema, index, added=[(other.Thing, RDF.type, RDFS.Class)])
+    assert str(other.Thing) not in schema.classes
+    assert other.Thing not in index.classes
+
+
+def _rendered_classes(schema) -> dict[str, str]:
+    """Render every class as its module block (with its namespace group) and its package module and stub."""
+    renderer = _ModuleRenderer(schema, _prepare_module(schema), None, False)
+    hierarchy = schema.class_hierarchy()
+    curies = schema.class_curies()
+    rendered = {}
+    for kind, uri, prefix, _, _ in renderer.plan():
+        if kind == "class":
+            block = "\n".join(renderer.render((kind, uri, prefix, False, False)))
+            module, stub = _render_class_sources((*curies[uri], uri), schema.classes, hierarchy, curies)
+            rendered[uri] = "\n".join((str(prefix), block, module, stub))
+    return rendered
+
+
+def _assert_reports_rerendered_classes(g: Graph, added: list, removed: list = ()) -> set[str]:
+    """Apply an edit and check that every class whose rendering changed is reported."""
+    index = SchemaIndex.from_graph(g)
+    schema = extract_schema(index)
+    before = _rendered_classes(schema)
+    update = update_schema(schema, index, added, removed)
+    after = _rendered_classes(schema)
+    rerendered = {iri for iri, text in after.items() if before.get(iri) != text}
+    assert rerendered <= update.changed_classes
+    return rerendered
+
+
+def _class_graph(*triples) -> Graph:
+    g = Graph()
+    g.bind("ex", EX)
+    g.bind("other", OTHER)
+    for triple in triples:
+        g.add(triple)
+    return g
+
+
+def test_update_reports_subclasses_with_new_minimal_parents():
+    g = _class_graph(
+        *((cls, RDF.type, RDFS.Class) for cls in (EX.A, EX.B, EX.D, EX.E)),
+        (EX.D, RDFS.subClassOf, EX.A),
+        (EX.D, RDFS.subClassOf, EX.B),
+        (EX.E, RDFS.subClassOf, EX.D),
+    )
+
+    rerendered = _assert_reports_rerendered_classes(g, [(EX.B, RDFS.subClassOf, EX.A)])
+    assert str(EX.D) in rerendered
+
+
+def test_update_reports_descendants_inheriting_a_new_property():
+    g = _class_graph(
+        *((cls, RDF.type, RDFS.Class) for cls in (EX.A, EX.B, EX.C)),
+        (EX.B, RDFS.subClassOf, EX.A),
+        (EX.C, RDFS.subClassOf, EX.B),
+    )
+    name = [(EX.name, RDF.type, RDF.Property), (EX.name, RDFS.domain, EX.A), (EX.name, RDFS.range, XSD.string)]
+
+    rerendered = _assert_reports_rerendered_classes(g, name)
+    assert {str(EX.B), str(EX.C)} <= rerendered
+
+
+def test_update_reports_classes_regrouped_by_a_colliding_name():
+    g = _class_graph(
+        *((cls, RDF.type, RDFS.Class) for cls in (EX.Person, EX.Student, EX.School)),
+        (EX.Student, RDFS.subClassOf, EX.Person),
+        (EX.teaches, RDF.type, RDF.Property),
+        (EX.teaches, RDFS.domain, EX.School),
+        (EX.teaches, RDFS.range, EX.Person),
+    )
+
+    rerendered = _assert_reports_rerendered_classes(g, [(OTHER.Person, RDF.type, RDFS.Class)])
+    assert str(EX.Person) in rerendered
+
+
+def _random_triple(rng: random.Random) -> tuple:
+    subject = rng.choice(TERMS)
+    kind = rng.randrange(6)
+    if kind == 0:
+        return (subject, RDF.type, RDFS.Class)
+    if kind == 1:
+        return (subject, RDF.type, RDF.Property)
+    if kind == 2:
+        return (subject, RDFS.subClassOf, rng.choice(TERMS))
+    if kind == 3:
+        return (subject, RDFS.domain, rng.choice(TERMS))
+    if kind == 4:
+        return (subject, RDFS.range, rng.choice([*TERMS, XSD.string]))
+    return (subject, RDFS.label, Literal(rng.choice("ab"), lang=rng.choice(["en", "fr"])))
+
+
+@pytest.mark.filterwarnings("ignore:Cyclic rdfs.subClassOf hierarchy:UserWarning")
+def test_random_edit_sequences_match_fresh_extraction():
+    # Edits put several values on one predicate, so their order must match a rebuilt index too
+    for seed in range(400):
+        rng = random.Random(seed)
+        g = Graph()
+        g.bind("ex", EX)
+        g.bind("other", OTHER)
+        for _ in range(12):
+            g.add(_random_triple(rng))
+        index = SchemaIndex.from_graph(g)
+        schema = extract_schema(index)
+        for step in range(4):
+            removed = rng.sample(sorted(g), min(len(g), rng.randrange(3)))
+            added = [t for t in (_random_triple(rng) for _ in range(rng.randrange(4))) if t not in g or t in removed]
+            for triple in removed:
+                g.remove(triple)
+            for triple in added:
+                g.add(triple)
+            before = copy.deepcopy(schema.classes)
+            rendered = _rendered_classes(schema)
+
+            update = update_schema(schema, index, added, removed)
+            fresh = extract_schema(SchemaIndex.from_graph(g))
+
+            context = f"seed {seed}, step {step}"
+            assert list(schema.classes) == list(fresh.classes), context
+            assert schema.classes == fresh.classes, context
+            assert schema.literals == fresh.literals, context
+            assert create_module(schema) == create_module(fresh), context
+            assert update.removed_classes == set(before) - set(fresh.classes), context
+            assert {iri for iri, info in fresh.classes.items() if before.get(iri) != info} <= update.changed_classes, context
+            assert {iri for iri, text in _rendered_classes(schema).items() if rendered.get(iri) != text} <= update.changed_classes, context
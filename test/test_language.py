@@ -0,0 +1,94 @@
+import pytest
+from rdflib import Graph, Literal
+from typer.testing import CliRunner
+
+from rdfs_pydantic import cli, create_module, create_modules, create_package, create_packages
+from rdfs_pydantic.language import LanguageChain, parse_language_chain
+
+
+def test_chain_is_normalized_and_completed():
+    assert parse_language_chain("en") == ("en", "und", "*")
+    assert parse_language_chain("en-GB, EN ,en") == ("en-gb", "en", "und", "*")
+    assert parse_language_chain(["fr", "und"]) == ("fr", "und", "*")
+    assert parse_language_chain("fr,*") == ("fr", "*")
+
+
+@pytest.mark.parametrize("language", ["", "en,,fr", "en_GB", "toolonglanguage"])
+def test_malformed_chain_is_rejected(language):
+    with pytest.raises(ValueError):
+        parse_language_chain(language)
+
+
+def test_select_prefers_exact_tag_over_subtag():
+    values = [Literal("US", lang="en-US"), Literal("plain", lang="en")]
+    assert LanguageChain("en").select(values) == values[1]
+    assert LanguageChain("en-us").select(values) == values[0]
+    assert LanguageChain("de,*").select(values) == values[0]
+    assert LanguageChain("de,und").select([]) is None
+
+
+ONTOLOGY = """
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix ex: <http://example.org/> .
+
+ex:Person a rdfs:Class ;
+    rdfs:label "Person"@en, "Personne"@fr, "Person"@de ;
+    rdfs:comment "A human being."@en, "Un être humain."@fr .
+
+ex:Employee a rdfs:Class ;
+    rdfs:subClassOf ex:Person ;
+    rdfs:label "Employee"@en, "Employé"@fr, "Angestellter"@de .
+
+ex:name a rdf:Property ;
+    rdfs:label "name"@en, "nom"@fr, "Name"@de ;
+    rdfs:domain ex:Person ;
+    rdfs:range rdfs:Literal .
+
+ex:employer a rdf:Property ;
+    rdfs:label "employer"@en, "employeur"@fr ;
+    rdfs:domain ex:Employee ;
+    rdfs:range ex:Organization .
+"""
+
+LANGUAGES = ["en", "fr", "de,en"]
+
+
+def _graph() -> Graph:
+    g = Graph()
+    g.parse(data=ONTOLOGY, format="turtle")
+    return g
+
+
+def test_create_modules_matches_one_run_per_language():
+    modules = create_modules(_graph(), LANGUAGES)
+
+    assert list(modules) == LANGUAGES
+    for language in LANGUAGES:
+        assert modules[language] == create_module(_graph(), language=language)
+    assert "Un être humain." in modules["fr"]
+    assert "employer <http://example.org/employer>" in modules["de,en"]
+
+
+def test_create_packages_matches_one_run_per_language(tmp_path):
+    create_packages(_graph(), {language: str(tmp_path / "variants" / str(i) / "pkg") for i, language in enumerate(LANGUAGES)})
+
+    for i, language in enumerate(LANGUAGES):
+        create_package(_graph(), output_dir=str(tmp_path / "single" / str(i) / "pkg"), language=language)
+        single = tmp_path / "single" / str(i)
+        for path in sorted(single.rglob("*.py*")):
+            assert (tmp_path / "variants" / str(i) / path.relative_to(single)).read_text() == path.read_text()
+
+
+def test_cli_writes_one_module_per_language(tmp_path):
+    ontology = tmp_path / "ontology.ttl"
+    ontology.write_text(ONTOLOGY)
+    args = ["module", "--ontology", str(ontology), "--output-dir", str(tmp_path / "out")]
+    for language in LANGUAGES:
+        args += ["--language", language]
+
+    result = CliRunner().invoke(cli.app, args)
+
+    assert result.exit_code == 0, result.output
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["de.py", "en.py", "fr.py"]
+    assert (tmp_path / "out" / "fr.py").read_text() == create_module(_graph(), language="fr")
@@ -0,0 +1,83 @@
+import pytest
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import RDF, RDFS
+
+from rdfs_pydantic import create_module
+from rdfs_pydantic.loading import load_graph, schema_graph
+
+
+EX = Namespace("http://example.org/")
+
+
+def _mixed_graph() -> Graph:
+    g = Graph()
+    g.bind("ex", EX)
+    g.add((EX.Person, RDF.type, RDFS.Class))
+    g.add((EX.Person, RDFS.label, Literal("Person", lang="en")))
+    g.add((EX.name, RDF.type, RDF.Property))
+    g.add((EX.name, RDFS.domain, EX.Person))
+    g.add((EX.name, RDFS.range, RDFS.Literal))
+    g.add((EX.alice, RDF.type, EX.Person))
+    g.add((EX.alice, EX.name, Literal("Alice")))
+    g.add((EX.alice, EX.age, Literal(42)))
+    return g
+
+
+@pytest.mark.parametrize("fmt,suffix", [("turtle", "ttl"), ("xml", "rdf"), ("json-ld", "jsonld")])
+def test_schema_only_graph_drops_instance_triples(tmp_path, fmt, suffix):
+    path = tmp_path / f"mixed.{suffix}"
+    _mixed_graph().serialize(str(path), format=fmt)
+
+    full = load_graph(path, [fmt])
+    filtered = load_graph(path, [fmt], schema_only=True)
+    filtered.bind("ex", EX)
+
+    assert (EX.alice, EX.age, Literal(42)) not in filtered
+    assert (EX.alice, RDF.type, EX.Person) not in filtered
+    assert len(filtered) == 5
+    full.bind("ex", EX)
+    assert create_module(filtered) == create_module(full)
+
+
+def test_schema_graph_preserves_namespace_bindings():
+    g = schema_graph()
+    g.parse(data=_mixed_graph().serialize(format="turtle"), format="turtle")
+
+    assert ("ex", str(EX)) in [(prefix, str(ns)) for prefix, ns in g.namespaces()]
+    assert "class Person(BaseModel):" in create_module(g)
+
+
+def _write_vocabularies(tmp_path) -> list[str]:
+    """Write several small vocabularies, two of which bind `ex` to different namespaces."""
+    vocabularies = {
+        "a.ttl": ("ex", "http://example.org/a/", "Agent"),
+        "b.ttl": ("ex", "http://example.org/b/", "Agent"),
+        "c.ttl": ("other", "http://example.org/c/", "Thing"),
+    }
+    paths = []
+    for filename, (prefix, namespace, local) in vocabularies.items():
+        path = tmp_path / filename
+        path.write_text(
+            f"@prefix {prefix}: <{namespace}> .\n"
+            "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n"
+            "@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .\n"
+            f"{prefix}:{local} a rdfs:Class ; rdfs:label \"{local} from {filename}\" .\n"
+            f"{prefix}:Sub a rdfs:Class ; rdfs:subClassOf {prefix}:{local} .\n"
+            f"{prefix}:name a rdf:Property ; rdfs:domain {prefix}:{local} ; rdfs:range rdfs:Literal .\n",
+            encoding="utf-8",
+        )
+        paths.append(str(path))
+    return paths
+
+
+@pytest.mark.parametrize("schema_only", [False, True])
+def test_parallel_load_matches_serial(tmp_path, schema_only):
+    paths = _write_vocabularies(tmp_path)
+    timings = []
+
+    serial = load_graph(paths, schema_only=schema_only)
+    parallel = load_graph(paths, schema_only=schema_only, jobs=3, on_parsed=lambda path, seconds: timings.append(path))
+
+    assert [path for path in timings] == paths
+    assert list(parallel.namespaces()) == list(serial.namespaces())
+    assert create_module(parallel) == create_module(serial)
@@ -0,0 +1,35 @@
+from rdflib import Graph, Namespace, RDF, RDFS
+
+from rdfs_pydantic.extraction import extract_schema
+from rdfs_pydantic.naming import CachedNamingStrategy, ContextAwareNamingStrategy, DefaultNamingStrategy, NamingCache
+
+EX = Namespace("http://example.org/")
+
+
+def test_cached_strategy_names_each_iri_once():
+    strategy = CachedNamingStrategy(ContextAwareNamingStrategy({"http://example.org/a-b": "class"}))
+
+    names = [strategy.get_local_name(iri) for iri in ["http://example.org/a-b", "http://example.org/x#1st", "http://example.org/a-b"]]
+
+    assert names == ["class_", "_1st", "class_"]
+    assert (strategy.cache.hits, strategy.cache.misses) == (1, 2)
+
+
+def test_extraction_reuses_names_across_properties():
+    g = Graph()
+    g.bind("ex", EX)
+    for name in ("Person", "Place"):
+        g.add((EX[name], RDF.type, RDFS.Class))
+    for i in range(10):
+        g.add((EX[f"p{i}"], RDF.type, RDF.Property))
+        g.add((EX[f"p{i}"], RDFS.domain, EX.Person))
+        g.add((EX[f"p{i}"], RDFS.range, EX.Place))
+    cache = NamingCache()
+
+    schema = extract_schema(g, naming_cache=cache)
+
+    assert cache.misses == len(cache.names) == 12
+    assert cache.hits == 10
+    uncached = DefaultNamingStrategy()
+    assert all(name == uncached.get_local_name(iri) for iri, name in cache.names.items())
+    assert schema == extract_schema(g)
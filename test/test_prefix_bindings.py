@@ -2,6 +2,8 @@ import pytest
 from rdflib import Graph
 
 from rdfs_pydantic import create_module
+from rdfs_pydantic.extraction import check_prefix_bindings
+from rdfs_pydantic.schema_index import SchemaIndex
 
 
 def test_unbound_prefixes_raise_actionable_error_message():
@@ -15,3 +17,32 @@ def test_unbound_prefixes_raise_actionable_error_message():
 
     with pytest.raises(ValueError) as exc_info:
         create_module(g)
+
+
+def test_prefix_report_lists_classes_and_properties_and_is_reused():
+    ontology = """
+    @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+    @prefix ex: <http://example.org/> .
+    ex:E1 a rdfs:Class .
+    <http://unbound.org/E2> a rdfs:Class .
+    <http://unbound.org/p1> a rdf:Property .
+    """
+
+    g = Graph()
+    g.parse(data=ontology, format="turtle")
+    index = SchemaIndex.from_graph(g)
+
+    report = check_prefix_bindings(index)
+
+    assert report.unbound == [
+        ("http://unbound.org/E2", "rdfs:Class"),
+        ("http://unbound.org/p1", "rdf:Property"),
+    ]
+    assert report.unbound_classes == [("http://unbound.org/E2", "rdfs:Class")]
+    assert check_prefix_bindings(index) is report
+
+    g.bind("un", "http://unbound.org/")
+    index = SchemaIndex.from_graph(g)
+    assert check_prefix_bindings(index).is_valid()
+    assert "class E2(BaseModel):" in create_module(index)
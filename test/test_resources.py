@@ -0,0 +1,119 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from rdfs_pydantic import cli
+from rdfs_pydantic.extraction import _load_context_from_str
+from rdfs_pydantic.resources import ResourceLoader, set_default_loader
+
+
+CONTEXT = {"@context": {"ex": "http://example.org/"}}
+ETAG = '"v1"'
+
+
+class _ContextServer(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _ContextHandler)
+        self.requests = []
+        self.body = json.dumps(CONTEXT).encode("utf-8")
+        self.status = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/context.jsonld"
+
+
+class _ContextHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+        if self.server.status is not None:
+            self.send_response(self.server.status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/ld+json")
+        self.send_header("ETag", ETAG)
+        self.send_header("Last-Modified", "Mon, 05 Oct 2026 10:00:00 GMT")
+        self.send_header("Content-Length", str(len(self.server.body)))
+        self.end_headers()
+        self.wfile.write(self.server.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = _ContextServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_fresh_entry_needs_no_request(server, tmp_path):
+    loader = ResourceLoader(str(tmp_path))
+    assert loader.fetch_json(server.url) == CONTEXT
+    assert loader.fetch_json(server.url) == CONTEXT
+    assert len(server.requests) == 1
+
+
+def test_stale_entry_is_revalidated(server, tmp_path):
+    loader = ResourceLoader(str(tmp_path), ttl=0)
+    loader.fetch_json(server.url)
+    server.body = b"{}"  # only a full 200 response would return this
+
+    assert loader.fetch_json(server.url) == CONTEXT
+    assert len(server.requests) == 2
+    assert server.requests[1]["If-None-Match"] == ETAG
+    assert server.requests[1]["If-Modified-Since"] == "Mon, 05 Oct 2026 10:00:00 GMT"
+
+
+def test_offline_mode_uses_cache_only(server, tmp_path):
+    with pytest.raises(ValueError, match="offline"):
+        ResourceLoader(str(tmp_path), offline=True).fetch(server.url)
+    assert server.requests == []
+
+    ResourceLoader(str(tmp_path)).fetch(server.url)
+    assert ResourceLoader(str(tmp_path), ttl=0, offline=True).fetch_json(server.url) == CONTEXT
+    assert len(server.requests) == 1
+
+
+def test_unreachable_server_falls_back_to_stale_entry(server, tmp_path):
+    url = server.url
+    ResourceLoader(str(tmp_path)).fetch(url)
+    server.shutdown()
+    server.server_close()
+
+    assert ResourceLoader(str(tmp_path), ttl=0, timeout=1).fetch_json(url) == CONTEXT
+
+
+@pytest.mark.parametrize("status", [404, 410, 500])
+def test_error_status_after_entry_goes_stale_is_raised(server, tmp_path, status):
+    ResourceLoader(str(tmp_path)).fetch(server.url)
+    server.status = status
+
+    with pytest.raises(requests.HTTPError):
+        ResourceLoader(str(tmp_path), ttl=0).fetch(server.url)
+    assert len(server.requests) == 2
+
+
+def test_cli_and_extraction_share_the_loader(server, tmp_path):
+    loader = ResourceLoader(str(tmp_path))
+    set_default_loader(loader)
+    try:
+        assert cli.load_context(server.url) == CONTEXT
+        assert _load_context_from_str(server.url) == CONTEXT
+        assert cli.load_context(server.url, ResourceLoader(str(tmp_path), offline=True)) == CONTEXT
+    finally:
+        set_default_loader(None)
+    assert len(server.requests) == 1
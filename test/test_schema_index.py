@@ -0,0 +1,61 @@
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import RDF, RDFS
+
+from rdfs_pydantic.extraction import extract_classes_and_properties
+from rdfs_pydantic.schema_index import SchemaIndex
+
+
+EX = Namespace("http://example.org/")
+
+
+def test_index_keeps_only_schema_subjects_and_predicates():
+    g = Graph()
+    g.bind("ex", EX)
+    g.add((EX.Person, RDF.type, RDFS.Class))
+    g.add((EX.Person, RDFS.label, Literal("Person")))
+    g.add((EX.name, RDF.type, RDF.Property))
+    g.add((EX.name, RDFS.domain, EX.Person))
+    g.add((EX.alice, RDF.type, EX.Person))
+    g.add((EX.alice, RDFS.label, Literal("Alice")))
+    g.add((EX.alice, EX.name, Literal("Alice")))
+
+    index = SchemaIndex.from_graph(g)
+
+    assert list(index.classes) == [EX.Person]
+    assert list(index.properties) == [EX.name]
+    assert EX.alice not in index.values
+    assert list(index.objects(EX.Person, RDFS.label)) == [Literal("Person")]
+    assert list(index.objects(EX.name, RDFS.range)) == []
+
+
+def test_parent_order_follows_subject_not_object_insertion():
+    g = Graph()
+    g.bind("ex", EX)
+    for cls in ("A", "B", "C", "X"):
+        g.add((EX[cls], RDF.type, RDFS.Class))
+    g.add((EX.X, RDFS.subClassOf, EX.B))
+    g.add((EX.C, RDFS.subClassOf, EX.A))
+    g.add((EX.C, RDFS.subClassOf, EX.B))
+
+    classes, _ = extract_classes_and_properties(g)
+
+    assert classes[str(EX.C)].parent_uris == list(g.objects(EX.C, RDFS.subClassOf))
+
+
+def test_add_matches_from_graph():
+    g = Graph()
+    g.bind("ex", EX)
+    g.add((EX.Person, RDF.type, RDFS.Class))
+    g.add((EX.Person, RDFS.comment, Literal("A human", lang="en")))
+    g.add((EX.knows, RDF.type, RDF.Property))
+    g.add((EX.knows, RDFS.domain, EX.Person))
+    g.add((EX.knows, RDFS.range, EX.Person))
+
+    streamed = SchemaIndex(g)
+    for triple in g:
+        streamed.add(*triple)
+    indexed = SchemaIndex.from_graph(g)
+
+    assert streamed.classes == indexed.classes
+    assert streamed.properties == indexed.properties
+    assert streamed.values == indexed.values
@@ -0,0 +1,108 @@
+import io
+from pathlib import Path
+
+from rdflib import Graph
+from typer.testing import CliRunner
+
+from rdfs_pydantic import cli, create_module, iter_module
+from rdfs_pydantic.schema_index import SchemaIndex
+from rdfs_pydantic.streaming import read_ntriples_schema
+
+
+RDF_TYPE = "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>"
+RDFS = "http://www.w3.org/2000/01/rdf-schema#"
+
+NTRIPLES = f"""
+# Schema
+<http://example.org/Person> {RDF_TYPE} <{RDFS}Class> .
+<http://example.org/Person> <{RDFS}label> "Person"@en .
+<http://example.org/Person> <{RDFS}label> "Personne"@fr .
+<http://example.org/Person> <{RDFS}comment> "A human being\\nwith a name" .
+<http://example.org/Employee> {RDF_TYPE} <{RDFS}Class> .
+<http://example.org/Employee> <{RDFS}subClassOf> <http://example.org/Person> .
+<http://example.org/name> {RDF_TYPE} <http://www.w3.org/1999/02/22-rdf-syntax-ns#Property> .
+<http://example.org/name> <{RDFS}domain> <http://example.org/Person> .
+<http://example.org/name> <{RDFS}range> <{RDFS}Literal> .
+# Instance data
+<http://example.org/alice> {RDF_TYPE} <http://example.org/Employee> .
+<http://example.org/alice> <{RDFS}label> "Alice" .
+<http://example.org/alice> <http://example.org/name> "Alice" .
+"""
+
+
+def _bound(index: SchemaIndex) -> SchemaIndex:
+    index.graph.bind("ex", "http://example.org/")
+    return index
+
+
+def test_streamed_ntriples_match_graph_output(tmp_path):
+    path = tmp_path / "dump.nt"
+    path.write_text(NTRIPLES, encoding="utf-8")
+
+    g = Graph()
+    g.parse(str(path), format="nt")
+    g.bind("ex", "http://example.org/")
+
+    streamed = _bound(read_ntriples_schema(path))
+
+    assert create_module(streamed) == create_module(g)
+
+
+def test_instance_values_are_not_indexed(tmp_path):
+    path = tmp_path / "dump.nt"
+    path.write_text(NTRIPLES, encoding="utf-8")
+
+    index = read_ntriples_schema(path)
+
+    assert {str(s) for s in index.values} == {
+        "http://example.org/Person",
+        "http://example.org/Employee",
+        "http://example.org/name",
+    }
+
+
+def test_nquads_graph_labels_are_merged(tmp_path):
+    lines = [line for line in NTRIPLES.splitlines() if line and not line.startswith("#")]
+    quads = "\n".join(
+        line[: -len(" .")] + f" <http://example.org/graph/{i % 2}> ." for i, line in enumerate(lines)
+    )
+    nt_path = tmp_path / "dump.nt"
+    nt_path.write_text(NTRIPLES, encoding="utf-8")
+    nq_path = tmp_path / "dump.nq"
+    nq_path.write_text(quads, encoding="utf-8")
+
+    from_nt = _bound(read_ntriples_schema(nt_path))
+    from_nq = _bound(read_ntriples_schema(nq_path))
+
+    assert create_module(from_nq) == create_module(from_nt)
+
+
+EXAMPLE = str(Path(__file__).parent.parent / "example" / "art.ttl")
+
+
+def test_module_is_rendered_in_pieces(tmp_path):
+    g = Graph()
+    g.parse(EXAMPLE, format="turtle")
+    code = create_module(g, emit_iris=True)
+
+    chunks = list(iter_module(g, emit_iris=True))
+    out = io.StringIO()
+
+    assert create_module(g, emit_iris=True, out=out) is None
+    assert out.getvalue() == "".join(chunks) == code
+    assert len(chunks) > 5
+    assert all(chunk.strip() for chunk in chunks[:-1])
+
+
+def test_cli_streams_module_to_stdout_or_file(tmp_path):
+    g = Graph()
+    g.parse(EXAMPLE, format="turtle")
+    runner = CliRunner()
+
+    printed = runner.invoke(cli.app, ["module", "--ontology", EXAMPLE])
+    written = runner.invoke(cli.app, ["module", "--ontology", EXAMPLE, "--output", str(tmp_path / "models.py")])
+
+    assert printed.exit_code == 0, printed.output
+    assert printed.output == create_module(g) + "\n"
+    assert written.exit_code == 0, written.output
+    assert (tmp_path / "models.py").read_text(encoding="utf-8") == create_module(g)
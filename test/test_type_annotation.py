@@ -0,0 +1,140 @@
+from rdflib import Graph, Literal, Namespace, RDF, RDFS, XSD
+
+from rdfs_pydantic import create_module, iter_module
+from rdfs_pydantic.extraction import extract_schema
+from rdfs_pydantic.models import PropertyType, TypeMember
+from rdfs_pydantic.ranges import RangeClassifier, RangeKind
+from rdfs_pydantic.type_annotation import build_property_type, get_union_property_type
+
+EX = Namespace("http://example.org/")
+OTHER = Namespace("http://other.example/")
+
+
+def test_members_keep_class_iris_and_primitive_kinds():
+    ranges = [XSD.anyURI, EX.Person, XSD.integer, OTHER.Person, XSD.string]
+
+    property_type = build_property_type(ranges)
+
+    assert property_type == PropertyType((
+        TypeMember("Person", str(EX.Person)),
+        TypeMember("int"),
+        TypeMember("str"),
+    ))
+    assert property_type.render() == get_union_property_type(ranges) == "list[Person | int | str]"
+    assert build_property_type([]).render() == "list[str]"
+
+
+
+def test_range_classifier_labels_each_iri_once():
+    ranges = RangeClassifier({str(EX.LiteralWork): None})
+
+    assert ranges.kind(XSD.integer) is RangeKind.PRIMITIVE
+    assert ranges.kind(RDFS.Literal) is RangeKind.PRIMITIVE
+    assert ranges.kind(XSD.anyURI) is RangeKind.LITERAL
+    assert ranges.kind(RDF.XMLLiteral) is RangeKind.LITERAL
+    assert ranges.kind(EX.LiteralWork) is RangeKind.INTERNAL
+    assert ranges.kind(OTHER.Literal) is RangeKind.EXTERNAL
+    assert set(ranges.datatypes) == {str(XSD.integer), str(RDFS.Literal), str(XSD.anyURI), str(RDF.XMLLiteral), str(EX.LiteralWork), str(OTHER.Literal)}
+
+
+def test_classes_named_like_literals_are_not_datatypes():
+    g = Graph()
+    g.bind("ex", EX)
+    g.add((EX.Book, RDF.type, RDFS.Class))
+    g.add((EX.about, RDF.type, RDF.Property))
+    g.add((EX.about, RDFS.domain, EX.Book))
+    g.add((EX.about, RDFS.range, EX.LiteralWork))
+
+    schema = extract_schema(g)
+
+    assert schema.classes[str(EX.Book)].properties["about"].type_annotation == "list[LiteralWork]"
+    assert str(EX.LiteralWork) in schema.external_classes
+    assert schema.range_classifier().kind(EX.LiteralWork) is RangeKind.EXTERNAL
+    assert schema.range_classifier().kind(EX.Book) is RangeKind.INTERNAL
+
+
+def test_rendering_substitutes_names_by_iri():
+    property_type = build_property_type([EX.Person, XSD.boolean])
+
+    assert property_type.render({str(EX.Person): "ex.Person"}) == "list[ex.Person | bool]"
+    assert property_type.render_optional() == "Person | bool | list[Person | bool] | None"
+
+
+def test_module_generation_leaves_property_types_unqualified():
+    g = Graph()
+    g.bind("ex", EX)
+    g.bind("other", OTHER)
+    for cls in (EX.Person, OTHER.Person):
+        g.add((cls, RDF.type, RDFS.Class))
+    g.add((EX.knows, RDF.type, RDF.Property))
+    g.add((EX.knows, RDFS.domain, EX.Person))
+    g.add((EX.knows, RDFS.range, OTHER.Person))
+    schema = extract_schema(g)
+
+    create_module(schema)
+
+    knows = schema.classes[str(EX.Person)].properties["knows"]
+    assert knows.type_annotation == "list[Person]"
+    assert knows.property_type.members == (TypeMember("Person", str(OTHER.Person)),)
+
+
+def test_legacy_range_normalisation_leaves_schema_unchanged():
+    g = Graph()
+    g.bind("ex", EX)
+    for cls in (EX.E1, EX.E2):
+        g.add((cls, RDF.type, RDFS.Class))
+    g.add((EX.p, RDF.type, RDF.Property))
+    g.add((EX.p, RDFS.domain, EX.E1))
+    g.add((EX.p, RDFS.range, EX.E2))
+    g.add((EX.p, RDFS.range, EX.E1))
+    schema = extract_schema(g)
+    prop = schema.classes[str(EX.E1)].properties["p"]
+
+    assert "p: list[E1]" in create_module(schema)
+
+    assert schema.classes[str(EX.E1)].properties["p"] is prop
+    assert prop.property_type.render() == "list[E2 | E1]"
+
+
+def test_colliding_namespaces_are_each_wrapped_once():
+    g = Graph()
+    namespaces = [Namespace(f"http://example.org/ns{n}/") for n in range(3)]
+    for n, ns in enumerate(namespaces):
+        g.bind(f"ns{n}", ns)
+        for name in ("E1", "E2"):
+            g.add((ns[name], RDF.type, RDFS.Class))
+        g.add((ns.p, RDF.type, RDF.Property))
+        g.add((ns.p, RDFS.domain, ns.E2))
+        g.add((ns.p, RDFS.range, namespaces[(n + 1) % 3].E1))
+    g.add((EX.Unique, RDF.type, RDFS.Class))
+    g.bind("ex", EX)
+
+    code = create_module(g)
+
+    assert [code.count(f"class ns{n}:") for n in range(3)] == [1, 1, 1]
+    assert "class Unique(BaseModel):" in code
+    assert code.index("class ns0:") < code.index("class ns1:") < code.index("class ns2:")
+    exec(compile(code, "<generated>", "exec"), {})
+
+
+def test_parallel_module_rendering_matches_serial():
+    g = Graph()
+    namespaces = [Namespace(f"http://example.org/ns{n}/") for n in range(3)]
+    for n, ns in enumerate(namespaces):
+        g.bind(f"ns{n}", ns)
+        for i in range(30):
+            g.add((ns[f"C{i}"], RDF.type, RDFS.Class))
+            g.add((ns[f"C{i}"], RDFS.label, Literal(f"Class {i}")))
+            if i:
+                g.add((ns[f"C{i}"], RDFS.subClassOf, ns[f"C{i // 2}"]))
+        g.add((ns[f"Only{n}"], RDF.type, RDFS.Class))
+        g.add((ns.p, RDF.type, RDF.Property))
+        g.add((ns.p, RDFS.domain, ns[f"Only{n}"]))
+        g.add((ns.p, RDFS.range, OTHER[f"Thing{n}"]))
+    schema = extract_schema(g)
+
+    serial = create_module(schema, emit_iris=True)
+
+    assert create_module(schema, emit_iris=True, jobs=3) == serial
+    assert "".join(iter_module(schema, emit_iris=True, jobs=2)) == serial
+    assert "class Thing2(BaseModel):" in serial